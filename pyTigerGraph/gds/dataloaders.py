@@ -14,6 +14,7 @@ import warnings
 import math
 import os
 from collections import defaultdict
+from concurrent.futures import wait
 from queue import Empty, Queue
 from threading import Event, Thread
 from time import sleep
@@ -38,7 +39,8 @@ import numpy as np
 import pandas as pd
 
 from ..pyTigerGraphException import TigerGraphException
-from .utilities import install_query_file, random_string, add_attribute
+from .utilities import (install_query_file, flush_query_installs, flush_schema_changes,
+                        random_string, add_attribute)
 
 __all__ = ["VertexLoader", "EdgeLoader", "NeighborLoader", "GraphLoader", "EdgeNeighborLoader", "NodePieceLoader", "HGTLoader"]
 
@@ -523,29 +525,23 @@ class BaseLoader:
         # Run query async
         _payload = {}
         _payload.update(payload)
-        resp = tgraph.runInstalledQuery(query_name, params=_payload, timeout=timeout, usePost=True, runAsync=True)
+        job = tgraph.runInstalledQueryAsync(query_name, params=_payload, timeout=timeout, usePost=True)
+        # The status of the query is polled by the connection's query job manager
         while not exit_event.is_set():
-            # Check status
-            status = tgraph.checkQueryStatus(resp)
-            if status[0]["status"] == "running":
-                sleep(1)
-                continue
-            elif status[0]["status"] == "success":
-                res = tgraph.getQueryResult(resp)
-                if res[0]["kafkaError"]:
-                    raise TigerGraphException(
-                        "Kafka Error: {}".format(res[0]["kafkaError"])
-                    )
-                else:
-                    break
-            else:
-                raise TigerGraphException(
-                    "Error generating data. {}".format(
-                        status
-                    )
-                )
-        # exiting
-        tgraph.abortQuery(resp)
+            if wait([job], timeout=0.1).done:
+                break
+        if not job.done():
+            # Exiting before the query is finished
+            job.cancel()
+            return
+        try:
+            res = job.result()
+        except TigerGraphException as e:
+            raise TigerGraphException("Error generating data. {}".format(e))
+        if res[0]["kafkaError"]:
+            raise TigerGraphException(
+                "Kafka Error: {}".format(res[0]["kafkaError"])
+            )
 
     @staticmethod
     def _request_rest(
@@ -1648,15 +1644,11 @@ class NeighborLoader(BaseLoader):
             if not filter_by:
                 num_vertices = sum(self._graph.getVertexCount(self._seed_types).values())
             elif isinstance(filter_by, str):
-                num_vertices = sum(
-                    self._graph.getVertexCount(k, where="{}!=0".format(filter_by))
-                    for k in self._seed_types
-                )
+                num_vertices = sum(self._graph.getVertexCount(
+                    self._seed_types, where="{}!=0".format(filter_by)).values())
             elif isinstance(filter_by, dict):
-                num_vertices = sum(
-                    self._graph.getVertexCount(k, where="{}!=0".format(filter_by[k]))
-                    for k in self._seed_types
-                )
+                num_vertices = sum(self._graph.getVertexCount(self._seed_types, where={
+                    k: "{}!=0".format(filter_by[k]) for k in self._seed_types}).values())
             else:
                 raise ValueError("filter_by should be None, attribute name, or dict of {type name: attribute name}.")
             self.num_batches = math.ceil(num_vertices / batch_size)
@@ -2101,7 +2093,8 @@ class EdgeLoader(BaseLoader):
         if batch_size:
             # If batch_size is given, calculate the number of batches
             if filter_by:
-                num_edges = sum(self._graph.getEdgeStats(e_type)[e_type][filter_by if isinstance(filter_by, str) else filter_by[e_type]]["TRUE"] for e_type in self._etypes)
+                stats = self._graph.getEdgeStats(self._etypes)
+                num_edges = sum(stats[e_type][filter_by if isinstance(filter_by, str) else filter_by[e_type]]["TRUE"] for e_type in self._etypes)
             else:
                 num_edges = sum(self._graph.getEdgeCount(i) for i in self._etypes)
             self.num_batches = math.ceil(num_edges / batch_size)
@@ -2402,10 +2395,8 @@ class VertexLoader(BaseLoader):
             # If batch_size is given, calculate the number of batches
             num_vertices_by_type = self._graph.getVertexCount(self._vtypes)
             if filter_by:
-                num_vertices = sum(
-                    self._graph.getVertexCount(k, where="{}!=0".format(filter_by))
-                    for k in num_vertices_by_type
-                )
+                num_vertices = sum(self._graph.getVertexCount(
+                    list(num_vertices_by_type), where="{}!=0".format(filter_by)).values())
             else:
                 num_vertices = sum(num_vertices_by_type.values())
             self.num_batches = math.ceil(num_vertices / batch_size)
@@ -3063,7 +3054,8 @@ class EdgeNeighborLoader(BaseLoader):
         if batch_size:
             # If batch_size is given, calculate the number of batches
             if filter_by:
-                num_edges = sum(self._graph.getEdgeStats(e_type)[e_type][filter_by if isinstance(filter_by, str) else filter_by[e_type]]["TRUE"] for e_type in self._seed_types)
+                stats = self._graph.getEdgeStats(self._seed_types)
+                num_edges = sum(stats[e_type][filter_by if isinstance(filter_by, str) else filter_by[e_type]]["TRUE"] for e_type in self._seed_types)
             else:
                 num_edges = sum(self._graph.getEdgeCount(i) for i in self._seed_types)
             self.num_batches = math.ceil(num_edges / batch_size)
@@ -3412,16 +3404,12 @@ class NodePieceLoader(BaseLoader):
             if not filter_by:
                 num_vertices = sum(self._graph.getVertexCount(self._seed_types).values())
             elif isinstance(filter_by, str):
-                num_vertices = sum(
-                    self._graph.getVertexCount(k, where="{}!=0".format(filter_by))
-                    for k in self._seed_types
-                )
+                num_vertices = sum(self._graph.getVertexCount(
+                    self._seed_types, where="{}!=0".format(filter_by)).values())
             elif isinstance(filter_by, dict):
                 self._seed_types = list(filter_by.keys())
-                num_vertices = sum(
-                    self._graph.getVertexCount(k, where="{}!=0".format(filter_by[k]))
-                    for k in self._seed_types
-                )
+                num_vertices = sum(self._graph.getVertexCount(self._seed_types, where={
+                    k: "{}!=0".format(filter_by[k]) for k in self._seed_types}).values())
             else:
                 raise ValueError("filter_by should be None, attribute name, or dict of {type name: attribute name}.")
             self.num_batches = math.ceil(num_vertices / batch_size)
@@ -3508,6 +3496,8 @@ class NodePieceLoader(BaseLoader):
             )
             params = {"anchor_attr": anchor_attribute, "v_types": self._vtypes}
             install_query_file(self._graph, query_path)
+            flush_schema_changes(self._graph)
+            flush_query_installs(self._graph)
             ancs = self._graph.runInstalledQuery("get_anchors", params=params, timeout=self.timeout)[0]["@@vids"]
             print("Number of Anchors:", len(ancs))
             for tok in self.baseTokens + ancs:
@@ -3533,6 +3523,8 @@ class NodePieceLoader(BaseLoader):
                 "random_anchor_selection.gsql",
             )
             install_query_file(self._graph, query_path)
+            flush_schema_changes(self._graph)
+            flush_query_installs(self._graph)
             params = {
                 "percentage": self._anchor_perc,
                 "v_type": self._vtypes,
@@ -3966,15 +3958,11 @@ class HGTLoader(BaseLoader):
             if not filter_by:
                 num_vertices = sum(self._graph.getVertexCount(self._seed_types).values())
             elif isinstance(filter_by, str):
-                num_vertices = sum(
-                    self._graph.getVertexCount(k, where="{}!=0".format(filter_by))
-                    for k in self._seed_types
-                )
+                num_vertices = sum(self._graph.getVertexCount(
+                    self._seed_types, where="{}!=0".format(filter_by)).values())
             elif isinstance(filter_by, dict):
-                num_vertices = sum(
-                    self._graph.getVertexCount(k, where="{}!=0".format(filter_by[k]))
-                    for k in self._seed_types
-                )
+                num_vertices = sum(self._graph.getVertexCount(self._seed_types, where={
+                    k: "{}!=0".format(filter_by[k]) for k in self._seed_types}).values())
             else:
                 raise ValueError("filter_by should be None, attribute name, or dict of {type name: attribute name}.")
             self.num_batches = math.ceil(num_vertices / batch_size)
@@ -2,20 +2,30 @@
 The Featurizer class provides methods for installing and running Graph Data Science Algorithms onto a TigerGraph server.
 """
 
-from typing import TYPE_CHECKING, Any, List, Tuple
+from typing import TYPE_CHECKING, Any, Iterator, List, Tuple, Union
 
 if TYPE_CHECKING:
     from ..pyTigerGraph import TigerGraphConnection
+    from ..queryJobs import QueryJob
 
 from ..pyTigerGraphException import TigerGraphException
 import json
-import re
+import logging
+import os
+import tempfile
 import time
+from concurrent.futures import FIRST_COMPLETED, TimeoutError as FutureTimeoutError, wait
+from itertools import groupby
 from os.path import join as pjoin
+from urllib.parse import urlparse
 
 import requests
 
-from .utilities import is_query_installed, random_string, add_attribute
+from .utilities import (add_attribute, add_attributes, flush_query_installs,
+                        flush_schema_changes, install_queries, is_query_installed,
+                        random_string, read_query_file)
+
+logger = logging.getLogger(__name__)
 
 
 class AsyncFeaturizerResult:
@@ -30,23 +40,49 @@ class AsyncFeaturizerResult:
         self.algorithm = algorithm
         self.query_id = query_id
         self.results = results
+        self._future = None
 
-    def wait(self, refresh: float = 1):
+    def wait(self, refresh: float = None, timeout: float = None):
         """
         Function call to block all execution if called until algorithm result is returned.
         Args:
             refresh (float):
-                How often to check for results. Defaults to 1 time every second.
+                DEPRECATED. The status of the algorithm is polled by the connection's query job
+                manager, with adaptive backoff.
+            timeout (float):
+                The maximum time to wait in seconds. Waits until the algorithm completes by default.
 
         Returns:
             Algorithm results when they become available.
+
+        Raises:
+            TigerGraphException if the algorithm was aborted, did not complete within `timeout`
+            seconds or failed (the original error is re-raised).
         """
-        while not self.results:
-            if self.algorithmComplete():
-                return self._getAlgorithmResults()
-            time.sleep(refresh)
+        if not self.results:
+            try:
+                self.results = self.future.result(timeout=timeout)
+            except FutureTimeoutError as e:
+                raise TigerGraphException(
+                    "Algorithm timed-out. Increase your timeout and try again."
+                ) from e
+            except TigerGraphException as e:
+                if "aborted" in str(e):
+                    raise TigerGraphException("Algorithm was aborted") from e
+                raise
         return self.results
 
+    @property
+    def future(self) -> "QueryJob":
+        """
+        The `concurrent.futures` style future of the algorithm's execution. It can be used with
+        `concurrent.futures.as_completed()` or `add_done_callback()`, and cancelled (which aborts
+        the algorithm). The same future is returned at every access.
+        """
+        if self._future is None:
+            self._future = self.conn.getQueryJobManager().track(self.query_id)
+        return self._future
+
     def algorithmComplete(self):
         """
         Function to check if the algorithm has completed execution.
@@ -107,9 +143,18 @@ class Featurizer:
 
     print(res)
     ```
+    The files downloaded from the repository are cached on disk (by default in `~/.cache/pyTigerGraph/algorithms`),
+    per algorithm version, so constructing a featurizer does not access the repository once the cache is warm.
+    To use the featurizer in an environment not connected to the public internet, you can also download the whole
+    library into the cache with `downloadAlgorithms()` and copy the cache directory there:
+    ```
+    feat = Featurizer(conn, algo_version="3.9", cache_dir="PATH/TO/CACHE")
+    feat.downloadAlgorithms()
+    ```
     """
     def __init__(
-        self, conn: "TigerGraphConnection", repo: str = None, algo_version: str = None
+        self, conn: "TigerGraphConnection", repo: str = None, algo_version: str = None,
+        cache_dir: Union[str, bool] = None, refresh_cache: bool = False
     ):
 
         """NO DOC: Class for feature extraction.
@@ -121,9 +166,23 @@ class Featurizer:
         Args:
             conn (TigerGraphConnection):
                 Connection to the TigerGraph database.
+            repo (str):
+                URL or local path of the algorithm repository.
+            algo_version (str):
+                Version of the algorithms. Defaults to the version of the database.
+            cache_dir (str or bool):
+                Directory of the on-disk cache of the files downloaded from the repository.
+                Defaults to `~/.cache/pyTigerGraph/algorithms`. `False` disables the cache.
+            refresh_cache (bool):
+                If True, revalidates the cached files with the repository (with conditional requests).
         """
 
         self.conn = conn
+        if cache_dir is None:
+            cache_dir = os.path.join(os.path.expanduser("~"), ".cache", "pyTigerGraph", "algorithms")
+        self.cache_dir = cache_dir
+        self.refresh_cache = refresh_cache
+        self._refreshed = set()
         # Get DB version if algo version is not given
         if not algo_version:
             self.major_ver, self.minor_ver, self.patch_ver = self._get_db_version()
@@ -146,12 +205,12 @@ class Featurizer:
         # Get algo dict from manifest
         try:
             manifest = pjoin(repo, "manifest.json")
-            self.algo_dict = self._get_algo_dict(manifest)
+            self.algo_dict = self._get_algo_dict(self._local_path(manifest))
         except:
             print("Cannot read manifest file. Trying master branch.")
             repo = "https://raw.githubusercontent.com/tigergraph/gsql-graph-algorithms/master"
             manifest = pjoin(repo, "manifest.json")
-            self.algo_dict = self._get_algo_dict(manifest)
+            self.algo_dict = self._get_algo_dict(self._local_path(manifest))
             self.repo = repo
 
         self.algo_paths = None
@@ -161,6 +220,7 @@ class Featurizer:
         self.query_result_type = None
         self.sch_type = None
         self.template_queries = {}
+        self._signatures = {}
 
     def _get_db_version(self) -> Tuple[str, str, str]:
         # Get DB version
@@ -177,6 +237,87 @@ class Featurizer:
             major_ver, minor_ver, patch_ver = self.algo_ver, "", ""
         return major_ver, minor_ver, patch_ver
 
+    def _local_path(self, url: str) -> str:
+        """
+        Returns the path of the cached copy of a file of the algorithm repository, downloading it if needed.
+
+        The cache mirrors the URLs, which contain the version of the algorithms. Cached files are only
+        revalidated (using their ETags) if `refresh_cache` is set; if the repository is not reachable, the
+        cached copy is used.
+
+        Args:
+            url (str):
+                URL of the file. Local paths are returned as is.
+        """
+        if not self.cache_dir or not url.startswith("http"):
+            return url
+        parsed = urlparse(url)
+        path = os.path.join(self.cache_dir, parsed.netloc, *parsed.path.strip("/").split("/"))
+        cached = os.path.exists(path)
+        if cached and (not self.refresh_cache or path in self._refreshed):
+            return path
+        headers = {}
+        if cached and os.path.exists(path + ".etag"):
+            with open(path + ".etag") as f:
+                headers["If-None-Match"] = f.read()
+        try:
+            resp = requests.get(url, headers=headers)
+            if resp.status_code != 304:
+                resp.raise_for_status()
+        except requests.exceptions.RequestException:
+            if not cached:
+                raise
+            logger.warning("Cannot refresh {}, using the cached copy.".format(url))
+            resp = None
+        if resp is not None and resp.status_code != 304:
+            # The ETag of the previous copy is dropped first and the new one is written last, so
+            # that an interrupted download never leaves an ETag that vouches for the wrong content
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            if os.path.exists(path + ".etag"):
+                os.remove(path + ".etag")
+            self._write_atomic(path, resp.text)
+            if resp.headers.get("ETag"):
+                self._write_atomic(path + ".etag", resp.headers["ETag"])
+        self._refreshed.add(path)
+        return path
+
+    @staticmethod
+    def _write_atomic(path: str, text: str) -> None:
+        # Write to a temporary file first, as other processes might read the cache
+        fd, tmp = tempfile.mkstemp(prefix=os.path.basename(path) + ".", suffix=".tmp",
+            dir=os.path.dirname(path))
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(text)
+            os.replace(tmp, path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+
+    def downloadAlgorithms(self) -> str:
+        """
+        Downloads all algorithms of the repository into the on-disk cache.
+
+        The cache directory can then be copied to (and used by featurizers in) environments not
+        connected to the public internet.
+
+        Returns:
+            The path of the cache directory.
+        """
+        if not self.cache_dir:
+            raise ValueError("The cache is disabled.")
+        if not self.algo_paths:
+            (
+                self.algo_paths,
+                self.query_result_type,
+                self.sch_type,
+            ) = self._get_algo_details(self.algo_dict)
+        for paths in self.algo_paths.values():
+            for path in paths:
+                self._local_path(path)
+        return self.cache_dir
+
     def _get_algo_dict(self, manifest_file: str) -> dict:
         # Get algo dict from manifest
         if manifest_file.startswith("http"):
@@ -232,6 +373,62 @@ class Featurizer:
                 "Call listAlgorithms() with the category name to see the list of algorithms"
             )
 
+    def _install_query_files(
+        self,
+        query_paths: List[str],
+        replace: dict = None,
+        force: bool = False,
+        global_change: bool = False,
+        distributed_mode: bool = False
+    ) -> List[str]:
+        """
+        Reads the query files and installs the queries with a single INSTALL QUERY command.
+        The first line of each query file should be the header of the query, e.g, CREATE QUERY query_name ...
+
+        Args:
+            query_paths (List[str]):
+                Paths or URLs of the query files
+            replace (dict):
+                If the suffix name needs to be replaced
+            force (bool):
+                False by default. Set to true to reinstall queries already installed.
+            global_change (bool):
+                False by default. Set to true if you want to run `GLOBAL SCHEMA_CHANGE JOB`. For Algorithms that are not schema free we need to specify this argument.
+                See https://docs.tigergraph.com/gsql-ref/current/ddl-and-loading/modifying-a-graph-schema#_global_vs_local_schema_changes.
+            distributed_mode (bool):
+                False by default. Set to true if DISTRIBUTED algorithm execution is desired.
+
+        Return:
+            Names of the installed queries
+        """
+        queries = []
+        for query_path in query_paths:
+            query_name, query = read_query_file(
+                self._local_path(query_path), replace, distributed_mode
+            )
+            queries.append((query_name, query, force))
+            self.query = query
+            if (
+                query_name == "tg_fastRP"
+                and self.major_ver != "master"
+                and int(self.major_ver) <= 3
+                and int(self.minor_ver) <= 7
+                and (force or not is_query_installed(self.conn, query_name))
+            ):
+                # Drop all jobs on the graph
+                self.conn.gsql("USE GRAPH {}\n".format(self.conn.graphname) + "drop job *")
+                res = add_attribute(
+                    self.conn,
+                    schema_type="VERTEX",
+                    attr_type="LIST<DOUBLE>",
+                    attr_name="embedding",
+                    global_change=global_change,
+                )
+        # The signatures of reinstalled queries might have changed
+        for query_name, _, _ in queries:
+            self._signatures.pop(query_name, None)
+        return install_queries(self.conn, queries)
+
     def _install_query_file(
         self,
         query_path: str,
@@ -257,74 +454,9 @@ class Featurizer:
         Return:
             Name of the installed query
         """
-        # Read in the query
-        if query_path.startswith("http"):
-            resp = requests.get(query_path)
-            resp.raise_for_status()
-            query = resp.text
-        else:
-            with open(query_path) as f:
-                query = f.read()
-        # Get query name from the first line
-        firstline = query.split("\n", 1)[0]
-        try:
-            query_name = re.search(r"QUERY (.+?)\(", firstline).group(1).strip()
-        except:
-            raise ValueError(
-                "Cannot parse the query file. It should start with CREATE QUERY ... "
-            )
-        # If query is already installed, skip unless force install.
-        is_installed, is_enabled = is_query_installed(
-            self.conn, query_name, return_status=True
-        )
-        if is_installed:
-            if force or (not is_enabled):
-                query = "USE GRAPH {}\nDROP QUERY {}\n".format(
-                    self.conn.graphname, query_name
-                )
-                resp = self.conn.gsql(query)
-                status = resp.splitlines()[-1]
-                if "Failed" in status:
-                    raise ConnectionError(resp)
-            else:
-                return query_name
-        # Replace placeholders with actual content if given
-        if replace:
-            for placeholder in replace:
-                query = query.replace(placeholder, replace[placeholder])
-        self.query = query
-        if (
-            query_name == "tg_fastRP" 
-            and self.major_ver != "master"
-            and int(self.major_ver) <= 3 
-            and int(self.minor_ver) <= 7
-        ):
-            # Drop all jobs on the graph
-            self.conn.gsql("USE GRAPH {}\n".format(self.conn.graphname) + "drop job *")
-            res = add_attribute(
-                self.conn,
-                schema_type="VERTEX",
-                attr_type="LIST<DOUBLE>",
-                attr_name="embedding",
-                global_change=global_change,
-            )
-        if distributed_mode:
-            query.replace("CREATE QUERY", "CREATE DISTRIBUTED QUERY")
-        query = (
-            "USE GRAPH {}\n".format(self.conn.graphname)
-            + query
-            + "\nInstall Query {}\n".format(query_name)
-        )
-        print(
-            "Installing and optimizing the queries, it might take a minute...",
-            flush=True,
-        )
-        resp = self.conn.gsql(query)
-        status = resp.splitlines()[-1]
-        if "Failed" in status:
-            raise ConnectionError(resp)
-        print("Queries installed successfully", flush=True)
-        return query_name
+        return self._install_query_files(
+            [query_path], replace, force, global_change, distributed_mode
+        )[0]
 
     def installAlgorithm(
         self, query_name: str, query_path: str = None, global_change: bool = False,
@@ -364,8 +496,10 @@ class Featurizer:
             ) = self._get_algo_details(self.algo_dict)
         if query_name not in self.algo_paths:
             raise ValueError("Cannot find {} in the library.".format(query_name))
-        for query in self.algo_paths[query_name]:
-            _ = self._install_query_file(query, global_change=global_change, distributed_mode=distributed_query)
+        # Install the algorithm and the queries it depends on together
+        _ = self._install_query_files(
+            self.algo_paths[query_name], global_change=global_change, distributed_mode=distributed_query
+        )
         self.query_name = query_name
         return self.query_name
 
@@ -402,7 +536,7 @@ class Featurizer:
             ) = self._get_algo_details(self.algo_dict)
         if query_name not in self.algo_paths:
             raise ValueError("Cannot find {} in the library.".format(query_name))
-        query_path = self.algo_paths[query_name][-1]
+        query_path = self._local_path(self.algo_paths[query_name][-1])
         if query_path.startswith("http"):
             resp = requests.get(query_path)
             resp.raise_for_status()
@@ -424,8 +558,8 @@ class Featurizer:
         Returns:
             Parameter dict the algorithm takes as input.
         """
-        query = self._get_query(query_name)
-        param_values, param_types = self._get_params(query)
+        param_values, param_types = self._get_signature(query_name)
+        param_values = dict(param_values)
         if printout:
             print(
                 "Parameters for {} (parameter: type [= default value]):".format(
@@ -450,6 +584,21 @@ class Featurizer:
                     print("- {}: {}".format(param, param_types[param]))
         return param_values
 
+    def _get_signature(self, query_name: str) -> Tuple[dict, dict]:
+        """
+        Returns the parameters of an algorithm and their types, parsed from the query header.
+        The signatures are cached per query until the query is reinstalled by this featurizer.
+
+        Args:
+            query_name (str):
+                Name of the algorithm.
+        """
+        signature = self._signatures.get(query_name)
+        if signature is None:
+            signature = self._get_params(self._get_query(query_name))
+            self._signatures[query_name] = signature
+        return signature
+
     def _get_params(self, query: str):
         """
         Returns query parameters and their types by parsing the query header.
@@ -637,6 +786,7 @@ class Featurizer:
                     "Please run installAlgorithm() to install this custom query first."
                 )
             self.installAlgorithm(query_name, global_change=global_schema, distributed_query=distributed_query)
+            flush_query_installs(self.conn)
 
         # Check query parameters for built-in queries.
         if not custom_query:
@@ -695,12 +845,7 @@ class Featurizer:
                 query_name, params, feat_name, feat_type, custom_query, schema_name
             )
         elif not custom_query:
-            if not (
-                query_name == "tg_fastRP"
-                and self.major_ver != "master"
-                and int(self.major_ver) <= 3
-                and int(self.minor_ver) <= 7
-            ):  # fastRP in 3.7 creates attribute at install time
+            if not self._attribute_at_install(query_name):
                 if params.get("result_attr", None) or params.get("result_attribute", None):
                     self._add_result_attribute(query_name, params)
         # Run query.
@@ -721,13 +866,405 @@ class Featurizer:
             else:
                 return result
 
+    def _attribute_at_install(self, query_name: str) -> bool:
+        """NO DOC: fastRP in 3.7 creates its result attribute at install time."""
+        return (
+            query_name == "tg_fastRP"
+            and self.major_ver != "master"
+            and int(self.major_ver) <= 3
+            and int(self.minor_ver) <= 7
+        )
+
+    def runPipeline(
+        self,
+        steps: dict,
+        concurrency: int = 2,
+        threadLimit: int = None,
+        memoryLimit: int = None,
+    ) -> dict:
+        """
+        Runs multiple algorithms, concurrently where their dependencies allow it.
+        All algorithms that are not installed yet are installed with a single `INSTALL QUERY` command, and the
+        attributes needed to store the results of all steps are added with a single schema change job
+        (one for global and one for local types) before the first algorithm runs.
+        Each step is then run in asynchronous mode (see `runAlgorithm()`) as soon as all the steps it depends on
+        have finished, with at most `concurrency` steps running at the same time.
+
+        Usage:
+
+            [source,python]
+            ----
+            f = conn.gds.featurizer()
+            timings = f.runPipeline({
+                "pagerank": {"algorithm": "tg_pagerank",
+                             "params": {"v_type": "Paper", "e_type": "Cite", "result_attribute": "pagerank"}},
+                "louvain": {"algorithm": "tg_louvain",
+                            "params": {"v_type_set": ["Paper"], "e_type_set": ["Cite"], "result_attribute": "cid"}},
+                "fastrp": {"algorithm": "tg_fastRP", "params": {...}, "depends_on": ["pagerank"],
+                           "memoryLimit": 4096}
+            }, concurrency=2, threadLimit=8)
+            ----
+
+        Args:
+            steps (dict):
+                The steps of the pipeline, as `{step_name: step}` pairs. Each step is a dictionary with the keys:
+                - "algorithm": The name of the algorithm (query). Defaults to the name of the step.
+                - "params": The parameters of the algorithm.
+                - "depends_on": Names of the steps that have to finish before this step starts.
+                - Any of the `threadLimit`, `memoryLimit`, `feat_name`, `feat_type`, `custom_query`, `schema_name`,
+                  `global_schema`, `timeout`, `sizeLimit` and `distributed_query` arguments of `runAlgorithm()`.
+            concurrency (int, optional):
+                The maximum number of algorithms running at the same time. Must be at least 1. Defaults to 2.
+            threadLimit (int, optional):
+                The thread limit of the steps that do not specify their own `threadLimit`.
+                Keep `concurrency * threadLimit` within the number of cores of each node.
+            memoryLimit (int, optional):
+                The memory limit (in MB) of the steps that do not specify their own `memoryLimit`.
+                Keep `concurrency * memoryLimit` within the memory available for queries on each node.
+
+        Returns:
+            A dictionary of `{step_name: {"algorithm", "result", "start", "end", "seconds"}}`, where `start` and `end`
+            are the times (as returned by `time.time()`) the step was submitted and found finished.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1.")
+        run_args = {"threadLimit", "memoryLimit", "feat_name", "feat_type", "custom_query", "schema_name",
+                    "global_schema", "timeout", "sizeLimit", "distributed_query"}
+        # Validate the steps and check that the dependencies form a DAG
+        deps = {}
+        for name, step in steps.items():
+            unknown = set(step) - run_args - {"algorithm", "params", "depends_on"}
+            if unknown:
+                raise ValueError("Unknown options {} in step {}.".format(sorted(unknown), name))
+            deps[name] = set(step.get("depends_on", []))
+            missing = deps[name] - set(steps)
+            if missing:
+                raise ValueError("Step {} depends on unknown steps {}.".format(name, sorted(missing)))
+        remaining = {name: set(d) for name, d in deps.items()}
+        while remaining:
+            ready = [name for name, d in remaining.items() if not d]
+            if not ready:
+                raise ValueError("The dependencies of steps {} form a cycle.".format(sorted(remaining)))
+            for name in ready:
+                del remaining[name]
+            for d in remaining.values():
+                d.difference_update(ready)
+
+        # Install all missing algorithms at once
+        if not self.algo_paths:
+            (
+                self.algo_paths,
+                self.query_result_type,
+                self.sch_type,
+            ) = self._get_algo_details(self.algo_dict)
+        with self.conn.gds.prepare():
+            for name, step in steps.items():
+                algorithm = step.get("algorithm", name)
+                if not is_query_installed(self.conn, algorithm):
+                    if step.get("custom_query"):
+                        raise ValueError(
+                            "Please run installAlgorithm() to install this custom query first."
+                        )
+                    self.installAlgorithm(
+                        algorithm,
+                        global_change=step.get("global_schema", False),
+                        distributed_query=step.get("distributed_query", False),
+                    )
+
+        # Add the result attributes of all steps at once
+        changes = []
+        for name, step in steps.items():
+            algorithm = step.get("algorithm", name)
+            params = step.get("params")
+            if step.get("custom_query"):
+                if step.get("feat_name"):
+                    if not (step.get("feat_type") and step.get("schema_name")):
+                        raise ValueError(
+                            "Please provide feat_type and schema_name if adding attribute for custom query."
+                        )
+                    changes.extend(self._result_attribute_changes(
+                        algorithm, params, step["feat_name"], step["feat_type"], True, step["schema_name"]
+                    ))
+            elif not self._attribute_at_install(algorithm):
+                query_params = self.getParams(algorithm, printout=False)
+                query_params.update(params or {})
+                if query_params.get("result_attr", None) or query_params.get("result_attribute", None):
+                    changes.extend(self._result_attribute_changes(algorithm, query_params))
+        _ = add_attributes(self.conn, changes)
+        flush_schema_changes(self.conn)
+
+        # Run the steps
+        report = {}
+        running = {}
+        pending = list(steps)
+        finished = set()
+        try:
+            while pending or running:
+                for name in [n for n in pending if deps[n] <= finished]:
+                    if len(running) >= concurrency:
+                        break
+                    pending.remove(name)
+                    step = steps[name]
+                    kwargs = {k: v for k, v in step.items() if k in run_args}
+                    kwargs.setdefault("threadLimit", threadLimit)
+                    kwargs.setdefault("memoryLimit", memoryLimit)
+                    algorithm = step.get("algorithm", name)
+                    start = time.time()
+                    res = self.runAlgorithm(algorithm, step.get("params"), runAsync=True, **kwargs)
+                    report[name] = {"algorithm": algorithm, "start": start}
+                    running[res.future] = (name, res)
+                done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in done:
+                    name, res = running.pop(future)
+                    try:
+                        res.results = future.result()
+                    except Exception as e:
+                        raise TigerGraphException(
+                            "Step {} ({}) failed: {}".format(name, res.algorithm, e)
+                        ) from e
+                    end = time.time()
+                    report[name].update({
+                        "result": res.results,
+                        "end": end,
+                        "seconds": end - report[name]["start"]
+                    })
+                    finished.add(name)
+                    print("{} finished in {:.2f} seconds.".format(name, report[name]["seconds"]), flush=True)
+        except BaseException:
+            # Abort the algorithms that are still running
+            for future in running:
+                future.cancel()
+            raise
+
+        return {name: report[name] for name in steps}
+
+    def _result_pages(self, elements: list, chunkSize: int) -> Iterator[Tuple[list, list]]:
+        """NO DOC: Splits a printed output element into pages of (id_keys, elements)."""
+        for i in range(0, len(elements), chunkSize):
+            page = elements[i:i + chunkSize]
+            if "v_id" in page[0]:
+                yield ["v_id", "v_type"], page
+            elif "from_id" in page[0]:
+                yield ["from_type", "from_id", "to_type", "to_id"], page
+            else:
+                # Accumulator of tuples, e.g. a heap of (vertex, score) pairs
+                yield [], [{"attributes": e} for e in page]
+
+    def iterResults(
+        self,
+        query_name: str,
+        params: dict = None,
+        results: list = None,
+        feat_name: str = None,
+        feat_type: str = None,
+        schema_name: list = None,
+        custom_query: bool = False,
+        chunkSize: int = 100000,
+        prefetch: int = 4,
+        fmt: str = "df",
+    ) -> Iterator[Tuple[str, Any]]:
+        """
+        Iterates over the results of an algorithm as typed, columnar pages.
+        Results written to attributes (e.g. the `result_attribute` parameter of the built-in algorithms) are read back
+        page by page (see `iterVertices()` and `iterEdges()`), so the results of algorithms on large graphs never have
+        to be returned as one JSON response. The columns are typed according to the schema of the attribute.
+        Printed results (the output of `runAlgorithm()` passed as `results`) are split into pages of the vertex sets,
+        edge sets and accumulators of tuples in the output, with column types inferred from the values.
+
+        Usage:
+
+            [source,python]
+            ----
+            params = {"v_type": "Paper", "e_type": "Cite", "result_attribute": "pagerank", "print_results": False}
+            f.runAlgorithm("tg_pagerank", params=params)
+            for v_type, df in f.iterResults("tg_pagerank", params=params):
+                process(df)
+            ----
+
+        Args:
+            query_name (str):
+                The name of the algorithm (query).
+            params (dict, optional):
+                The parameters the algorithm was run with. Used to find the attribute and the vertex or edge types
+                the results are stored in.
+            results (list, optional):
+                The (printed) output of the algorithm. If given, its elements are returned instead of the attributes.
+            feat_name (str, optional):
+                The attribute the results of a custom query are stored in.
+            feat_type (str, optional):
+                The type of the attribute the results of a custom query are stored in.
+            schema_name (list, optional):
+                The vertex or edge types the results of a custom query are stored in.
+            custom_query (bool, optional):
+                If the query is a custom query. Defaults to False.
+            chunkSize (int, optional):
+                The (maximum) number of rows in a page. Defaults to 100000.
+            prefetch (int, optional):
+                The number of pages retrieved in parallel, ahead of the consumption of the pages. Defaults to 4.
+            fmt (str, optional):
+                Format of the pages:
+                - "df":    pandas DataFrame
+                - "arrow": Apache Arrow table
+
+        Returns:
+            A generator of `(name, page)` tuples, where name is the vertex or edge type the results are stored in, or
+            the key of the printed output element.
+        """
+        if fmt not in ("df", "arrow"):
+            raise ValueError("Unsupported output format: {}".format(fmt))
+        if fmt == "arrow":
+            try:
+                import pyarrow as pa
+            except ImportError:
+                raise ImportError("PyArrow is required to use this function. "
+                    "Download pyarrow using 'pip install pyarrow'.")
+
+        def to_table(elements: list, id_keys: list, attributes: list = None):
+            if fmt == "df":
+                return self.conn._elementSetToDataFrame(
+                    elements, id_keys, self.conn._getAttrDtypes(attributes or [])
+                )
+            if attributes is not None:
+                return self.conn._elementSetToArrow(
+                    elements, id_keys, self.conn._getArrowSchema(id_keys, attributes)
+                )
+            id_cols, attr_cols = self.conn._elementSetToColumns(elements, id_keys)
+            cols = dict(zip(id_keys, id_cols))
+            cols.update(attr_cols)
+            return pa.table(cols)
+
+        # Printed results
+        if results is not None:
+            for output in results:
+                for key, value in output.items():
+                    if not (isinstance(value, list) and value and isinstance(value[0], dict)):
+                        continue
+                    for id_keys, page in self._result_pages(value, chunkSize):
+                        yield key, to_table(page, id_keys)
+            return
+
+        # Results written to attributes
+        if custom_query:
+            if not (feat_name and feat_type and schema_name):
+                raise ValueError(
+                    "Please provide feat_name, feat_type and schema_name of the results of a custom query."
+                )
+            changes = self._result_attribute_changes(query_name, params, feat_name, feat_type, True, schema_name)
+        else:
+            if not self.query_result_type:
+                (
+                    self.algo_paths,
+                    self.query_result_type,
+                    self.sch_type,
+                ) = self._get_algo_details(self.algo_dict)
+            query_params = self.getParams(query_name, printout=False)
+            query_params.update(params or {})
+            if not (query_params.get("result_attr", None) or query_params.get("result_attribute", None)):
+                raise ValueError(
+                    "The results of {} are not stored in attributes. Pass the output of runAlgorithm() as `results`.".format(
+                        query_name
+                    )
+                )
+            changes = self._result_attribute_changes(query_name, query_params)
+        for schema_type, type_name, attr_name, _ in changes:
+            if schema_type == "EDGE":
+                meta_data = self.conn.getEdgeType(type_name)
+                id_keys = ["from_type", "from_id", "to_type", "to_id"]
+                pages = (
+                    [dict(e, attributes={attr_name: e["attributes"].get(attr_name)}) for e in page]
+                    for page in self.conn.iterEdges(type_name, chunkSize=chunkSize, prefetch=prefetch)
+                )
+            else:
+                meta_data = self.conn.getVertexType(type_name)
+                id_keys = ["v_id"]
+                pages = self.conn.iterVertices(type_name, select=attr_name, chunkSize=chunkSize, prefetch=prefetch)
+            attributes = [a for a in meta_data["Attributes"] if a["AttributeName"] == attr_name]
+            for page in pages:
+                yield type_name, to_table(page, id_keys, attributes)
+
+    def exportResults(
+        self,
+        path: str,
+        query_name: str,
+        params: dict = None,
+        results: list = None,
+        feat_name: str = None,
+        feat_type: str = None,
+        schema_name: list = None,
+        custom_query: bool = False,
+        format: str = "parquet",
+        chunkSize: int = 100000,
+        concurrency: int = 4,
+    ) -> dict:
+        """
+        Writes the results of an algorithm to Parquet or Arrow IPC files, page by page (see `iterResults()`).
+        The pages of each vertex or edge type (or printed output element) are written to separate files:
+
+        ----
+        <path>/<name>/part-00000.parquet
+        <path>/manifest.json
+        ----
+
+        Args:
+            path (str):
+                The directory to write the results into. It is created if it does not exist.
+            query_name (str):
+                The name of the algorithm (query).
+            params (dict, optional):
+                The parameters the algorithm was run with.
+            results (list, optional):
+                The (printed) output of the algorithm. If given, its elements are written instead of the attributes.
+            feat_name (str, optional):
+                The attribute the results of a custom query are stored in.
+            feat_type (str, optional):
+                The type of the attribute the results of a custom query are stored in.
+            schema_name (list, optional):
+                The vertex or edge types the results of a custom query are stored in.
+            custom_query (bool, optional):
+                If the query is a custom query. Defaults to False.
+            format (str, optional):
+                "parquet" (Apache Parquet) or "arrow" (Apache Arrow IPC). Defaults to "parquet".
+            chunkSize (int, optional):
+                The (maximum) number of rows in a file. Defaults to 100000.
+            concurrency (int, optional):
+                The number of pages retrieved in parallel. Defaults to 4.
+
+        Returns:
+            The manifest of the files: the files, the number of rows and the columns of each result.
+        """
+        if format not in ("parquet", "arrow"):
+            raise ValueError("Unsupported export format: {}".format(format))
+        manifest = {
+            "algorithm": query_name,
+            "format": format,
+            "created": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "results": {}
+        }
+        pages = self.iterResults(
+            query_name, params, results, feat_name, feat_type, schema_name, custom_query,
+            chunkSize=chunkSize, prefetch=concurrency, fmt="arrow"
+        )
+        # The pages of a name are not necessarily adjacent (e.g. the same key printed by several PRINT
+        # statements), so the files of later groups are appended to the ones written before
+        for name, tables in groupby(pages, key=lambda x: x[0]):
+            written = manifest["results"].setdefault(name, {"files": [], "rows": 0, "columns": []})
+            more = self.conn._writeTables(
+                path, name, (t for _, t in tables), format, start=len(written["files"])
+            )
+            written["files"].extend(more["files"])
+            written["rows"] += more["rows"]
+            written["columns"] = written["columns"] or more["columns"]
+        with open(pjoin(path, "manifest.json"), "w") as f:
+            json.dump(manifest, f, indent=2)
+        return manifest
+
     def _get_template_queries(self):
         categories = self.conn.gsql("SHOW PACKAGE GDBMS_ALGO").strip().split("\n")[2:]
         for cat in categories:
             resp = self.conn.gsql("SHOW PACKAGE GDBMS_ALGO.{}".format(cat.strip("- ")))
             self.template_queries[cat.strip("- ")] = resp.strip()
 
-    def _add_result_attribute(
+    def _result_attribute_changes(
         self,
         query_name: str,
         params: dict,
@@ -735,7 +1272,8 @@ class Featurizer:
         feat_type: str = "",
         custom_query: bool = False,
         schema_name: list = [],
-    ):
+    ) -> List[tuple]:
+        """NO DOC: (schema_type, type_name, attr_name, attr_type) tuples of the attributes needed to store the results."""
         if custom_query:
             # For custom query, feat_name, feat_type and schema_name should be
             # provided. Infer schema type from schema name.
@@ -774,37 +1312,23 @@ class Featurizer:
                     schema_name = params[key]
                 else:
                     raise ValueError("e_type should be either a list or string")
-        # Find whether global or local changes are needed by checking schema type.
-        global_types = []
-        local_types = []
-        if schema_type == "VERTEX":
-            for v_type in schema_name:
-                if "IsLocal" in self.conn.getVertexType(v_type, force=True):
-                    local_types.append(v_type)
-                else:
-                    global_types.append(v_type)
-        if schema_type == "EDGE":
-            for e_type in schema_name:
-                if "IsLocal" in self.conn.getEdgeType(e_type, force=True):
-                    local_types.append(e_type)
-                else:
-                    global_types.append(e_type)
-        # Change schema
-        if global_types:
-            _ = add_attribute(
-                conn=self.conn,
-                schema_type=schema_type,
-                attr_type=feat_type,
-                attr_name=feat_name,
-                schema_name=global_types,
-                global_change=True,
-            )
-        if local_types:
-            _ = add_attribute(
-                conn=self.conn,
-                schema_type=schema_type,
-                attr_type=feat_type,
-                attr_name=feat_name,
-                schema_name=local_types,
-                global_change=False,
-            )
+        return [(schema_type, t, feat_name, feat_type) for t in schema_name]
+
+    def _add_result_attribute(
+        self,
+        query_name: str,
+        params: dict,
+        feat_name: str = "",
+        feat_type: str = "",
+        custom_query: bool = False,
+        schema_name: list = [],
+    ):
+        # Global and local types are changed by (at most) one job each. Inside
+        # `GDS.prepare()` this also adds the attributes collected so far.
+        _ = add_attributes(
+            self.conn,
+            self._result_attribute_changes(
+                query_name, params, feat_name, feat_type, custom_query, schema_name
+            ),
+        )
+        flush_schema_changes(self.conn)
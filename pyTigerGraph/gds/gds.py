@@ -26,7 +26,9 @@ You can find the reference for those classes on the following pages:
 * link:https://docs.tigergraph.com/pytigergraph/current/gds/metrics[Metrics]
 * link:https://docs.tigergraph.com/pytigergraph/current/gds/splitters[Splitters]
 """
-from typing import TYPE_CHECKING, Union, List, Callable
+import logging
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Union, List, Callable, Iterator
 
 if TYPE_CHECKING:
     from ..pyTigerGraph import TigerGraphConnection
@@ -36,9 +38,12 @@ from .dataloaders import (EdgeLoader, EdgeNeighborLoader, GraphLoader,
                           HGTLoader)
 from .featurizer import Featurizer
 from .splitters import RandomEdgeSplitter, RandomVertexSplitter
+from .utilities import flush_query_installs, flush_schema_changes
 # from ..pyTigerGraph import pyTigerGraphGSQL
 from pyTigerGraph.pyTigerGraphGSQL import pyTigerGraphGSQL
 
+logger = logging.getLogger(__name__)
+
 
 class GDS:
     def __init__(self, conn: "TigerGraphConnection") -> None: 
@@ -52,6 +57,8 @@ class GDS:
         """
         self.conn = conn
         self.kafkaConfig = None
+        self._pending_installs = None
+        self._pending_schema_changes = None
 
     def configureKafka(self,
         kafka_address: str = None,
@@ -1566,10 +1573,68 @@ class GDS:
                 loader.reinstall_query()
             return loader
     
+    @contextmanager
+    def prepare(self, algorithms: List[str] = None, featurizer: Featurizer = None) -> Iterator[None]:
+        """Install all queries and add all attributes needed by a pipeline at once.
+
+        Installing a query is a long compilation on the server, and the loaders, splitters
+        and algorithms of a pipeline each install their own queries. Inside a `prepare()`
+        block these installations are only collected; at the end of the block all queries
+        that are not installed yet are created and then installed with a single
+        `INSTALL QUERY` command.
+        Likewise, the attributes that splitters and algorithms store their results in are
+        collected, and the ones missing from the schema are added by a single schema change
+        job (one for global and one for local types) before the queries are installed.
+        Do not iterate over loaders or run splitters and algorithms inside the block.
+
+        Usage:
+
+            [source,python]
+            ----
+            conn = TigerGraphConnection(...)
+            with conn.gds.prepare(algorithms=["tg_pagerank"]):
+                splitter = conn.gds.vertexSplitter(is_train=0.8, is_val=0.2)
+                train_loader = conn.gds.neighborLoader(...)
+                valid_loader = conn.gds.neighborLoader(...)
+            splitter.run()
+            ----
+
+        Args:
+            algorithms (List[str], optional):
+                Names of the Graph Data Science algorithms to install as well.
+            featurizer (Featurizer, optional):
+                The featurizer used to install the algorithms. Defaults to a new featurizer
+                of the default repository.
+        """
+        logger.info("entry: prepare")
+        if self._pending_installs is not None:
+            # Nested block: installed at the end of the outer block
+            yield
+            logger.info("exit: prepare")
+            return
+        self._pending_installs = []
+        self._pending_schema_changes = []
+        try:
+            if algorithms:
+                feat = featurizer or self.featurizer()
+                for algorithm in algorithms:
+                    feat.installAlgorithm(algorithm)
+            yield
+            # The queries might refer to the new attributes
+            flush_schema_changes(self.conn)
+            flush_query_installs(self.conn)
+        finally:
+            self._pending_installs = None
+            self._pending_schema_changes = None
+        # Only after the flush, so that failing installs are attributed to the block
+        logger.info("exit: prepare")
+
     def featurizer(
         self,
         repo: str = None, 
-        algo_version: str = None) -> Featurizer:
+        algo_version: str = None,
+        cache_dir: Union[str, bool] = None,
+        refresh_cache: bool = False) -> Featurizer:
         """Get a featurizer. The Featurizer enables installation and execution of algorithms in the Graph Data Science (GDS) libarary. 
         The Featurizer pulls the most up-to-date version of the algorithm available in our public GitHub repository that is
         compatible with your database version.
@@ -1587,10 +1652,23 @@ class GDS:
 
         print(res)
         ```
+        The files downloaded from the repository are cached on disk, so that subsequent featurizers
+        do not download them again.
+
+        Args:
+            repo (str, optional):
+                URL or local path of the algorithm repository. Defaults to the public GitHub repository.
+            algo_version (str, optional):
+                Version of the algorithms. Defaults to the version of the database.
+            cache_dir (str or bool, optional):
+                Directory of the on-disk cache of the repository files. Defaults to
+                `~/.cache/pyTigerGraph/algorithms`. `False` disables the cache.
+            refresh_cache (bool, optional):
+                If True, revalidates the cached files with the repository. Defaults to False.
         Returns:
             Featurizer
         """
-        return Featurizer(self.conn, repo, algo_version)
+        return Featurizer(self.conn, repo, algo_version, cache_dir, refresh_cache)
 
     def vertexSplitter(self, v_types: List[str] = None, timeout: int = 600000, **split_ratios):
         """Get a vertex splitter that splits vertices into at most 3 parts randomly.
@@ -6,7 +6,7 @@ Make sure to create the appropriate attributes in the graph before using these f
 import os.path
 from typing import TYPE_CHECKING, List
 
-from .utilities import install_query_file, add_attribute
+from .utilities import install_query_file, add_attributes, flush_schema_changes
 
 if TYPE_CHECKING:
     from ..pyTigerGraph import TigerGraphConnection
@@ -15,6 +15,8 @@ if TYPE_CHECKING:
 class BaseRandomSplitter:
     """NO DOC: Base Random Splitter"""
 
+    schema_type = None
+
     def __init__(
         self,
         conn: "TigerGraphConnection",
@@ -30,6 +32,9 @@ class BaseRandomSplitter:
         self.query_name = install_query_file(self._graph, query_path)
         self.timeout = timeout
         self.schema_types = schema_types
+        if self.schema_type and self._graph.gds._pending_schema_changes is not None:
+            # Inside `GDS.prepare()`: add the attributes together with the others
+            add_attributes(self._graph, self._attribute_changes(self.schema_type, split_ratios))
 
     def _validate_args(self, split_ratios) -> None:
         if len(split_ratios) == 0:
@@ -42,6 +47,9 @@ class BaseRandomSplitter:
         if sum(split_ratios.values()) > 1:
             raise ValueError("Sum of all partition ratios have to be <=1")
 
+    def _attribute_changes(self, schema_type: str, split_ratios: dict) -> List[tuple]:
+        return [(schema_type, t, key, "BOOL") for t in self.schema_types for key in split_ratios]
+
     def run(self, schema_type, **split_ratios) -> None:
         """Perform the split.
 
@@ -54,32 +62,9 @@ class BaseRandomSplitter:
             self._validate_args(split_ratios)
         else:
             split_ratios = self.split_ratios
-        global_types = []
-        local_types = []
-        if schema_type == "VERTEX":
-            for v_type in self.schema_types:
-                if "IsLocal" in self._graph.getVertexType(v_type, force=True):
-                    local_types.append(v_type)
-                else:
-                    global_types.append(v_type)
-        if schema_type == "EDGE":
-            for e_type in self.schema_types:
-                if "IsLocal" in self._graph.getEdgeType(e_type, force=True):
-                    local_types.append(e_type)
-                else:
-                    global_types.append(e_type)
-        if len(global_types) > 0:
-            add_attribute(self._graph, 
-                        schema_type, 
-                        attr_name = {key: "BOOL" for key in split_ratios},
-                        schema_name = global_types,
-                        global_change = True)
-        if len(local_types) > 0:
-            add_attribute(self._graph, 
-                        schema_type, 
-                        attr_name = {key: "BOOL" for key in split_ratios},
-                        schema_name = local_types,
-                        global_change = False)
+        # Global and local types are changed by (at most) one job each.
+        add_attributes(self._graph, self._attribute_changes(schema_type, split_ratios))
+        flush_schema_changes(self._graph)
         payload = {}
         payload["stypes"] = self.schema_types
         for i, key in enumerate(split_ratios):
@@ -144,6 +129,8 @@ class RandomVertexSplitter(BaseRandomSplitter):
             Timeout value for the operation. Defaults to 600000.
     """
 
+    schema_type = "VERTEX"
+
     def __init__(
         self, conn: "TigerGraphConnection", v_types: List[str] = None, timeout: int = 600000, **split_ratios
     ) -> None:
@@ -231,6 +218,8 @@ class RandomEdgeSplitter(BaseRandomSplitter):
             Timeout value for the operation. Defaults to 600000.
     """
 
+    schema_type = "EDGE"
+
     def __init__(
         self, conn: "TigerGraphConnection", e_types: List[str] = None, timeout: int = 600000, **split_ratios
     ) -> None:
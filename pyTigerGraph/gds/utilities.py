@@ -1,15 +1,28 @@
 """GDS Utilities
 Utilities for the Graph Data Science functions.
 """
+import hashlib
 import logging
 import os
 import random
 import re
 import string
+import tempfile
+import time
+from contextlib import contextmanager
 from os.path import join as pjoin
-from typing import TYPE_CHECKING, Union
+from typing import TYPE_CHECKING, Iterator, List, Tuple, Union
 from urllib.parse import urlparse
 
+import requests
+
+try:
+    import fcntl
+except ImportError:
+    # Windows
+    fcntl = None
+    import msvcrt
+
 if TYPE_CHECKING:
     from ..pyTigerGraph import TigerGraphConnection
 
@@ -110,17 +123,26 @@ def is_query_installed(
         return is_installed
 
 
-def install_query_file(
-    conn: "TigerGraphConnection",
-    file_path: str,
-    replace: dict = None,
-    distributed: bool = False,
-    force: bool = False,
-) -> str:
-    # Read the first line of the file to get query name. The first line should be
-    # something like CREATE QUERY query_name (...
-    with open(file_path) as infile:
-        firstline = infile.readline()
+def read_query_file(
+    file_path: str, replace: dict = None, distributed: bool = False
+) -> Tuple[str, str]:
+    """Reads a query file (local path or URL) and returns the name and the text of the query.
+
+    Args:
+        file_path (str): Path or URL of the file. The first line should be
+            something like CREATE QUERY query_name (...
+        replace (dict): Placeholders to be replaced in the query, including its name.
+        distributed (bool): Whether to create the query as DISTRIBUTED.
+    """
+    if file_path.startswith("http"):
+        resp = requests.get(file_path)
+        resp.raise_for_status()
+        query = resp.text
+    else:
+        with open(file_path) as infile:
+            query = infile.read()
+    # Get query name from the first line
+    firstline = query.split("\n", 1)[0]
     try:
         query_name = re.search(r"QUERY (.+?)\(", firstline).group(1).strip()
     except:
@@ -130,46 +152,224 @@ def install_query_file(
     # If a suffix is to be added to query name
     if replace and ("{QUERYSUFFIX}" in replace):
         query_name = query_name.replace("{QUERYSUFFIX}", replace["{QUERYSUFFIX}"])
-    # If query is already installed, skip unless force install.
-    is_installed, is_enabled = is_query_installed(conn, query_name, return_status=True)
-    if is_installed:
-        if force or (not is_enabled):
-            query = "USE GRAPH {}\nDROP QUERY {}\n".format(conn.graphname, query_name)
-            resp = conn.gsql(query)
-            if "Successfully dropped queries" not in resp:
-                raise ConnectionError(resp)
-        else:
-            return query_name
-    # Otherwise, install the query from file
-    with open(file_path) as infile:
-        query = infile.read()
     # Replace placeholders with actual content if given
     if replace:
         for placeholder in replace:
             query = query.replace(placeholder, replace[placeholder])
     if distributed:
         query = query.replace("CREATE QUERY", "CREATE DISTRIBUTED QUERY")
-    logger.debug(query)
-    query = (
-        "USE GRAPH {}\n".format(conn.graphname)
-        + query
-        + "\nInstall Query {}\n".format(query_name)
-    )
-    print(
-        "Installing and optimizing queries. It might take a minute or two."
-    )
-    resp = conn.gsql(query)
-    if "Query installation finished" not in resp:
-        raise ConnectionError(resp)
+    return query_name, query
+
+
+def _try_lock(f) -> bool:
+    # Locks the first byte of the file without blocking; returns False if another process
+    # holds the lock
+    f.seek(0)
+    try:
+        if fcntl:
+            fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+    except OSError:
+        return False
+    return True
+
+
+def _unlock(f) -> None:
+    f.seek(0)
+    if fcntl:
+        fcntl.flock(f, fcntl.LOCK_UN)
+    else:
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def _install_generation(f) -> int:
+    # The number of installations done under the lock so far, stored in the lock file
+    f.seek(0)
+    content = f.read().strip()
+    return int(content) if content.isdigit() else 0
+
+
+@contextmanager
+def install_lock(conn: "TigerGraphConnection") -> Iterator[dict]:
+    """Lock serialising query installations on the graph across processes of the host.
+
+    Installing queries is a long compilation on the server; when many processes (e.g.
+    training workers) need the same queries, only one of them should install them.
+    The lock is a file in the temporary directory, so it only covers the processes running
+    on the same host; processes on other hosts are not serialised.
+
+    Yields:
+        The state of the installation: `installed_by_others` tells whether other processes
+        installed queries while this one was waiting for the lock; set `installed` to True
+        after installing queries, so that the processes waiting for the lock can tell.
+    """
+    key = hashlib.md5("{}/{}".format(conn.host, conn.graphname).encode()).hexdigest()
+    path = os.path.join(tempfile.gettempdir(), "pyTigerGraph_install_{}.lock".format(key))
+    with open(path, "a+") as f:
+        generation = _install_generation(f)
+        if not _try_lock(f):
+            logger.info("Waiting for another process to install queries")
+            if fcntl:
+                f.seek(0)
+                fcntl.flock(f, fcntl.LOCK_EX)
+            else:
+                while not _try_lock(f):
+                    time.sleep(1)
+        state = {
+            "installed_by_others": _install_generation(f) != generation,
+            "installed": False
+        }
+        try:
+            yield state
+        finally:
+            if state["installed"]:
+                generation = _install_generation(f) + 1
+                f.seek(0)
+                f.truncate()
+                f.write(str(generation))
+                f.flush()
+            _unlock(f)
+
+
+def _queries_to_install(
+    conn: "TigerGraphConnection", queries: List[tuple], refresh: bool = False,
+    keep_installed: bool = False
+) -> Tuple[list, dict]:
+    # Returns the queries to be dropped and the queries to be created.
+    # The catalog of installed queries is cached by the connection unless refreshed.
+    # If keep_installed, installed queries are not reinstalled even if forced (e.g. when
+    # another process has just reinstalled them).
+    installed = conn.getInstalledQueries(force=refresh)
+    to_drop = []
+    to_create = {}
+    for query_name, query, force in queries:
+        if query_name in to_create:
+            continue
+        target = "GET /query/{}/{}".format(conn.graphname, query_name)
+        if target in installed:
+            # If query is already installed, skip unless force install.
+            if (force and not keep_installed) or (not installed[target]["enabled"]):
+                to_drop.append(query_name)
+            else:
+                continue
+        to_create[query_name] = query
+    return to_drop, to_create
+
+
+def _install_queries(conn: "TigerGraphConnection", queries: List[tuple]) -> None:
+    # Create all queries that are not installed yet (or need to be reinstalled),
+    # then install them with a single INSTALL QUERY command.
+    if not any(_queries_to_install(conn, queries)):
+        return
+    with install_lock(conn) as lock:
+        # Another process might have installed (or reinstalled) the queries while we were waiting
+        to_drop, to_create = _queries_to_install(
+            conn, queries, refresh=True, keep_installed=lock["installed_by_others"]
+        )
+        if to_drop:
+            lock["installed"] = True
+            resp = conn.gsql(
+                "USE GRAPH {}\nDROP QUERY {}\n".format(conn.graphname, ", ".join(to_drop))
+            )
+            if "Successfully dropped queries" not in resp:
+                raise ConnectionError(resp)
+        if not to_create:
+            return
+        logger.debug("\n".join(to_create.values()))
+        query = (
+            "USE GRAPH {}\n".format(conn.graphname)
+            + "\n".join(to_create.values())
+            + "\nInstall Query {}\n".format(", ".join(to_create))
+        )
+        print(
+            "Installing and optimizing {} queries. It might take a minute or two.".format(
+                len(to_create)
+            )
+        )
+        lock["installed"] = True
+        resp = conn.gsql(query)
+        if "Query installation finished" not in resp:
+            raise ConnectionError(resp)
+        else:
+            print("Query installation finished.")
+
+
+def install_queries(conn: "TigerGraphConnection", queries: List[tuple]) -> List[str]:
+    """Installs queries with a single INSTALL QUERY command.
+
+    Inside a `GDS.prepare()` block the queries are only collected, and installed
+    together with all other queries of the block at its end.
+
+    Args:
+        conn (TigerGraphConnection): Connection to the database.
+        queries (List[tuple]): List of (query_name, query_text, force) tuples, where
+            query_text is the full CREATE QUERY statement (see `read_query_file()`)
+            and force means dropping and reinstalling the query if it is already installed.
+
+    Returns:
+        The names of the queries.
+    """
+    pending = conn.gds._pending_installs
+    if pending is not None:
+        pending.extend(queries)
     else:
-        print("Query installation finished.")
-    return query_name
+        _install_queries(conn, queries)
+    return [q[0] for q in queries]
+
+
+def flush_query_installs(conn: "TigerGraphConnection") -> None:
+    """Installs the queries collected so far in a `GDS.prepare()` block.
+
+    Call it before running a query that might have been collected.
+    """
+    pending = conn.gds._pending_installs
+    if pending:
+        conn.gds._pending_installs = []
+        _install_queries(conn, pending)
+
+
+def install_query_files(
+    conn: "TigerGraphConnection",
+    file_paths: List[Union[str, tuple]],
+    distributed: bool = False,
+    force: bool = False,
+) -> List[str]:
+    """Installs the queries of multiple files with a single INSTALL QUERY command.
+
+    Args:
+        conn (TigerGraphConnection): Connection to the database.
+        file_paths (List[Union[str, tuple]]): Paths of the query files, or
+            (file_path, replace) tuples (see `install_query_file()`).
+        distributed (bool): Whether to create the queries as DISTRIBUTED.
+        force (bool): Whether to reinstall the queries already installed.
+
+    Returns:
+        The names of the queries.
+    """
+    queries = []
+    for f in file_paths:
+        file_path, replace = f if isinstance(f, tuple) else (f, None)
+        query_name, query = read_query_file(file_path, replace, distributed)
+        queries.append((query_name, query, force))
+    return install_queries(conn, queries)
+
+
+def install_query_file(
+    conn: "TigerGraphConnection",
+    file_path: str,
+    replace: dict = None,
+    distributed: bool = False,
+    force: bool = False,
+) -> str:
+    return install_query_files(conn, [(file_path, replace)], distributed, force)[0]
 
 
 def add_attribute(conn: "TigerGraphConnection", schema_type:str, attr_type:str = None, attr_name:Union[str, dict] = None, schema_name:list = None, global_change:bool = False):
     '''
     If the current attribute is not already added to the schema, it will create the schema job to do that.
     Check whether to add the attribute to vertex(vertices) or edge(s).
+    Inside a `GDS.prepare()` block the attributes are only collected (see `add_attributes()`).
 
     Args:
         schema_type (str): 
@@ -186,60 +386,122 @@ def add_attribute(conn: "TigerGraphConnection", schema_type:str, attr_type:str =
             If the schema change should be global or local.
     '''
     # Check whether to add the attribute to vertex(vertices) or edge(s)
-    v_type = False
     if schema_type.upper() == "VERTEX":
-        target = conn.getVertexTypes(force=True)
-        v_type = True
+        target = conn.getVertexTypes()
     elif schema_type.upper() == "EDGE":
-        target = conn.getEdgeTypes(force=True)
+        target = conn.getEdgeTypes()
     else:
         raise Exception('schema_type has to be VERTEX or EDGE')
     # If attribute should be added to a specific vertex/edge name
     if schema_name != None:
-        target.clear()
         target = schema_name
-    # For every vertex or edge type
-    tasks = []
-    for t in target:
-        attributes = []
-        if v_type:
-            meta_data =  conn.getVertexType(t, force=True)
+    if isinstance(attr_name, str):
+        if not attr_type:
+            raise Exception("attr_type must be defined if attr_name is of type string")
+        attr_name = {attr_name: attr_type}
+    elif not isinstance(attr_name, dict):
+        attr_name = {}
+    changes = [(schema_type, t, aname, atype, global_change)
+               for t in target for aname, atype in attr_name.items() if aname != None]
+    return add_attributes(conn, changes)
+
+
+def _attribute_tasks(conn: "TigerGraphConnection", changes: List[tuple]) -> dict:
+    """Returns the ALTER statements of the attributes that do not exist yet.
+
+    The schema is fetched from the server (bypassing the cache) once for all changes, as other
+    clients may have added or dropped attributes since it was cached.
+
+    Returns:
+        Dictionary of {global_change: [statements]}.
+    """
+    schema = conn.getSchema(force=True)
+    types = {}
+    for key in ("VertexTypes", "EdgeTypes"):
+        for t in schema.get(key, []):
+            types[(key[:-5].upper(), t["Name"])] = t
+    tasks = {True: [], False: []}
+    seen = set()
+    for change in changes:
+        schema_type, type_name, attr_name, attr_type = change[:4]
+        schema_type = schema_type.upper()
+        if schema_type not in ("VERTEX", "EDGE"):
+            raise Exception('schema_type has to be VERTEX or EDGE')
+        if not attr_type:
+            raise Exception("attr_type must be defined for attribute {}".format(attr_name))
+        meta_data = types.get((schema_type, type_name))
+        if meta_data is None:
+            raise ValueError("{} type {} does not exist.".format(schema_type.capitalize(), type_name))
+        attributes = [a['AttributeName'] for a in meta_data['Attributes']]
+        if attr_name in attributes or (schema_type, type_name, attr_name) in seen:
+            continue
+        seen.add((schema_type, type_name, attr_name))
+        if len(change) > 4 and change[4] is not None:
+            global_change = change[4]
         else:
-            meta_data = conn.getEdgeType(t, force=True)
-        for i in range(len(meta_data['Attributes'])):
-            attributes.append(meta_data['Attributes'][i]['AttributeName'])
-        # If attribute is not in list of vertex attributes, do the schema change to add it
-        if isinstance(attr_name, str):
-            if not attr_type:
-                raise Exception("attr_type must be defined if attr_name is of type string")
-            if attr_name != None and attr_name not in attributes:
-                tasks.append("ALTER {} {} ADD ATTRIBUTE ({} {});\n".format(
-                        schema_type, t, attr_name, attr_type))
-        elif isinstance(attr_name, dict):
-            for aname in attr_name:
-                if aname != None and aname not in attributes:
-                    tasks.append("ALTER {} {} ADD ATTRIBUTE ({} {});\n".format(
-                        schema_type, t, aname, attr_name[aname]
-                    ))
-    # If attribute already exists for schema type t, nothing to do
-    if not tasks:
+            global_change = "IsLocal" not in meta_data
+        tasks[global_change].append("ALTER {} {} ADD ATTRIBUTE ({} {});\n".format(
+            schema_type, type_name, attr_name, attr_type))
+    return tasks
+
+
+def _add_attributes(conn: "TigerGraphConnection", changes: List[tuple]) -> str:
+    tasks = _attribute_tasks(conn, changes)
+    # If all attributes already exist, nothing to do
+    if not (tasks[True] or tasks[False]):
         return "Attribute already exists"
-    # Drop all jobs on the graph
-    # self.conn.gsql("USE GRAPH {}\n".format(self.conn.graphname) + "DROP JOB *")
-    # Create schema change job 
-    job_name = "add_{}_attr_{}".format(schema_type,random_string(6)) 
-    if not(global_change):
-        job = "USE GRAPH {}\n".format(conn.graphname) + "CREATE SCHEMA_CHANGE JOB {} {{\n".format(
-            job_name) + ''.join(tasks) + "}}\nRUN SCHEMA_CHANGE JOB {}".format(job_name)
-    else:
-        job = "USE GRAPH {}\n".format(conn.graphname) + "CREATE GLOBAL SCHEMA_CHANGE JOB {} {{\n".format(
-            job_name) + ''.join(tasks) + "}}\nRUN GLOBAL SCHEMA_CHANGE JOB {}".format(job_name)
-    # Submit the job
-    print("Changing schema to save results...", flush=True)
-    resp = conn.gsql(job)
-    status = resp.splitlines()[-1]
-    if "Failed" in status:
-        raise ConnectionError(resp)
-    else:
-        print(status, flush=True)
-    return 'Schema change succeeded.'
\ No newline at end of file
+    for global_change in (True, False):
+        if not tasks[global_change]:
+            continue
+        job_name = "add_attrs_{}".format(random_string(6))
+        scope = "GLOBAL " if global_change else ""
+        job = "USE GRAPH {}\n".format(conn.graphname) + "CREATE {}SCHEMA_CHANGE JOB {} {{\n".format(
+            scope, job_name) + ''.join(tasks[global_change]) + "}}\nRUN {}SCHEMA_CHANGE JOB {}".format(
+            scope, job_name)
+        # Submit the job
+        print("Changing schema to save results...", flush=True)
+        resp = conn.gsql(job)
+        status = resp.splitlines()[-1]
+        if "Failed" in status:
+            raise ConnectionError(resp)
+        else:
+            print(status, flush=True)
+    return 'Schema change succeeded.'
+
+
+def add_attributes(conn: "TigerGraphConnection", changes: List[tuple]) -> str:
+    """Adds attributes to multiple vertex and edge types with a single schema change job.
+
+    Attributes that already exist are skipped, based on a single (uncached) fetch of the schema.
+    Global and local types cannot be changed by the same job, so at most one
+    `GLOBAL SCHEMA_CHANGE JOB` and one local `SCHEMA_CHANGE JOB` are run.
+    Inside a `GDS.prepare()` block the attributes are only collected, and added
+    together with all other attributes of the block by `flush_schema_changes()`.
+
+    Args:
+        conn (TigerGraphConnection): Connection to the database.
+        changes (List[tuple]): List of (schema_type, type_name, attr_name, attr_type)
+            tuples, where schema_type is VERTEX or EDGE. An optional fifth element
+            selects a global (True) or local (False) schema change; by default it is
+            inferred from the schema.
+
+    Returns:
+        'Schema change succeeded.', 'Attribute already exists' or, inside a
+        `GDS.prepare()` block, 'Schema change pending.'.
+    """
+    pending = conn.gds._pending_schema_changes
+    if pending is not None:
+        pending.extend(changes)
+        return "Schema change pending."
+    return _add_attributes(conn, changes)
+
+
+def flush_schema_changes(conn: "TigerGraphConnection") -> None:
+    """Adds the attributes collected so far in a `GDS.prepare()` block.
+
+    Call it before running a query that might need the collected attributes.
+    """
+    pending = conn.gds._pending_schema_changes
+    if pending:
+        conn.gds._pending_schema_changes = []
+        _add_attributes(conn, pending)
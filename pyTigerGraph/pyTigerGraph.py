@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING, Union
 import urllib3
 
 from pyTigerGraph.pyTigerGraphEdge import pyTigerGraphEdge
+from pyTigerGraph.pyTigerGraphExport import pyTigerGraphExport
 from pyTigerGraph.pyTigerGraphLoading import pyTigerGraphLoading
 from pyTigerGraph.pyTigerGraphPath import pyTigerGraphPath
 from pyTigerGraph.pyTigerGraphUDT import pyTigerGraphUDT
@@ -23,7 +24,7 @@ if not sys.warnoptions:
 # TODO Proper deprecation handling; import deprecation?
 
 class TigerGraphConnection(pyTigerGraphVertex, pyTigerGraphEdge, pyTigerGraphUDT,
-    pyTigerGraphLoading, pyTigerGraphPath, pyTigerGraphDataset, object):
+    pyTigerGraphLoading, pyTigerGraphPath, pyTigerGraphDataset, pyTigerGraphExport, object):
     """Python wrapper for TigerGraph's REST++ and GSQL APIs"""
 
     def __init__(self, host: str = "http://127.0.0.1", graphname: str = "MyGraph",
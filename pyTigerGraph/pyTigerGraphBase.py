@@ -5,11 +5,18 @@ A TigerGraphConnection object provides the HTTP(S) communication used by all oth
 
 """
 import base64
+import copy
 import json
 import logging
+import queue
 import sys
+import threading
+import time
 import warnings
-from typing import Union
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
+from typing import Callable, Iterable, Iterator, Union
 from urllib.parse import urlparse
 
 import requests
@@ -30,6 +37,13 @@ def excepthook(type, value, traceback):
 
 logger = logging.getLogger(__name__)
 
+# Read-only endpoints (path prefixes) whose identical concurrent GET requests share a single
+# request (see `coalesceReads`)
+COALESCED_RESTPP_PATHS = ("/graph/", "/builtins/", "/echo/", "/version/", "/endpoints/",
+    "/statistics/", "/showprocesslist/", "/query_status", "/query_result")
+COALESCED_GS_PATHS = ("/gsqlserver/gsql/schema", "/gsqlserver/gsql/udtlist",
+    "/gsqlserver/gsql/userdefinedfunction", "/gsqlserver/gsql/queryinfo")
+
 class pyTigerGraphBase(object):
     def __init__(self, host: str = "http://127.0.0.1", graphname: str = "MyGraph",
             gsqlSecret: str = "", username: str = "tigergraph", password: str = "tigergraph",
@@ -133,6 +147,33 @@ class pyTigerGraphBase(object):
             sys.tracebacklimit = None
 
         self.schema = None
+        self._schemaIndex = None
+
+        # Time to live (in seconds) of the cached metadata; `None` means no expiry, `0` disables
+        # caching of that kind of metadata. Vertex counts are not cached unless enabled, as they
+        # can be changed by other clients at any time
+        self.metadataCacheTTL = {
+            "schema": None,
+            "udts": None,
+            "installedQueries": 60,
+            "udfs": 300,
+            "vertexCount": 0
+        }
+        self._metadataCache = {}
+        self._metadataVersion = 0
+        self._metadataKindVersions = {}
+        self._metadataLock = threading.Lock()
+        self.queryCache = None
+        self.queryJobManager = None
+        # Interpreted queries run this many times are installed (see `enableQueryPromotion()`)
+        self.queryPromotionThreshold = None
+        self._interpretedRuns = OrderedDict()
+        self._promotionFailed = set()
+        # Identical GET requests of read-only endpoints (see `COALESCED_RESTPP_PATHS` and
+        # `COALESCED_GS_PATHS`) running at the same time share a single request (and its result)
+        self.coalesceReads = True
+        self._inflight = {}
+        self._inflightLock = threading.Lock()
 
         # TODO Remove useCert parameter
         if useCert is not None:
@@ -261,11 +302,11 @@ class pyTigerGraphBase(object):
             if isinstance(self.apiToken, tuple):
                 self.apiToken = self.apiToken[0]
             self.authHeader = {'Authorization': "Bearer " + self.apiToken}
-            _headers = self.authHeader
         else:
             self.authHeader = {'Authorization': 'Basic {0}'.format(self.base64_credential)}
-            _headers = self.authHeader
             authMode = 'pwd'
+        # Copy, so that request specific headers do not leak into other (concurrent) requests
+        _headers = dict(self.authHeader)
 
         if authMode == "pwd":
             _auth = (self.username, self.password)
@@ -294,6 +335,12 @@ class pyTigerGraphBase(object):
             res = requests.request(method, url, headers=_headers, data=_data, params=params, verify=verify)
         res.raise_for_status()
 
+        if method != "GET" and self.metadataCacheTTL.get("vertexCount") != 0 and \
+                (url.startswith(self.restppUrl + "/graph/")
+                or url.startswith(self.restppUrl + "/ddl/")):
+            # Vertices were (possibly) upserted, loaded or deleted
+            self._dropCachedMetadata("vertexCount")
+
         if jsonResponse:
             try:
                 res = json.loads(res.text, strict=strictJson)
@@ -343,7 +390,13 @@ class pyTigerGraphBase(object):
         if logger.level == logging.DEBUG:
             logger.debug("params: " + self._locals(locals()))
 
-        res = self._req("GET", url, authMode, headers, None, resKey, skipCheck, params, strictJson)
+        if self.coalesceReads and self._isReadOnlyEndpoint(url):
+            key = ("GET", url, authMode, json.dumps(headers, sort_keys=True), resKey, skipCheck,
+                json.dumps(params, sort_keys=True, default=str), strictJson)
+            res = self._singleflight(key, lambda: self._req("GET", url, authMode, headers, None,
+                resKey, skipCheck, params, strictJson))
+        else:
+            res = self._req("GET", url, authMode, headers, None, resKey, skipCheck, params, strictJson)
 
         if logger.level == logging.DEBUG:
             logger.debug("return: " + str(res))
@@ -351,6 +404,18 @@ class pyTigerGraphBase(object):
 
         return res
 
+    def _isReadOnlyEndpoint(self, url: str) -> bool:
+        """Returns whether GET requests of the URL are known not to modify the database.
+
+        Other GET requests (e.g. installed queries, `/abortquery` and `/rebuildnow`) are never
+        coalesced.
+        """
+        for baseUrl, paths in ((self.restppUrl, COALESCED_RESTPP_PATHS),
+                (self.gsUrl, COALESCED_GS_PATHS)):
+            if url.startswith(baseUrl) and url[len(baseUrl):].startswith(paths):
+                return True
+        return False
+
     def _post(self, url: str, authMode: str = "token", headers: dict = None,
             data: Union[dict, list, str, bytes] = None, resKey: str = "results", skipCheck: bool = False,
             params: Union[dict, list, str] = None, jsonData: bool = False) -> Union[dict, list]:
@@ -412,6 +477,236 @@ class pyTigerGraphBase(object):
 
         return res
 
+    def _singleflight(self, key: object, func: Callable, copyResult: bool = True) -> object:
+        """Calls a function, unless an identical call is already in progress, in which case it
+            waits for that call and returns its result.
+
+        Args:
+            key:
+                Identifies the call; must be hashable.
+            func:
+                The function (without arguments) to be called.
+            copyResult:
+                If `True`, the callers waiting for an identical call receive a (deep) copy of its
+                result, so that they can modify it independently.
+
+        Returns:
+            The return value of the function. If the function raises an exception, it is raised
+            in all callers.
+        """
+        with self._inflightLock:
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[key] = Future()
+        if not leader:
+            res = flight.result()
+            return copy.deepcopy(res) if copyResult else res
+
+        try:
+            res = func()
+        except BaseException as e:
+            flight.set_exception(e)
+            raise
+        else:
+            flight.set_result(res)
+            return res
+        finally:
+            with self._inflightLock:
+                del self._inflight[key]
+
+    def _getCachedMetadata(self, kind: str, key: object, loader: Callable,
+            force: bool = False) -> object:
+        """Returns metadata from the connection's metadata cache, loading it if necessary.
+
+        Args:
+            kind:
+                The kind of the metadata; one of the keys of `metadataCacheTTL`.
+            key:
+                Identifies the metadata within its kind (e.g. the vertex type); must be hashable.
+            loader:
+                The function (without arguments) retrieving the metadata from the database.
+            force:
+                If `True`, the metadata is retrieved from the database even if it is cached.
+
+        Returns:
+            The (cached or retrieved) metadata.
+        """
+        ttl = self.metadataCacheTTL.get(kind)
+        if ttl == 0:
+            return loader()
+        with self._metadataLock:
+            entry = self._metadataCache.get((kind, key))
+            version = (self._metadataVersion, self._metadataKindVersions.get(kind, 0))
+        if entry and not force and (ttl is None or time.monotonic() - entry[0] < ttl):
+            return entry[1]
+        # Concurrent callers (e.g. worker threads at startup) share a single retrieval
+        ret = self._singleflight(("metadata", kind, key, force), loader, copyResult=False)
+        with self._metadataLock:
+            # Do not cache the result if the metadata was invalidated while it was being retrieved
+            if version == (self._metadataVersion, self._metadataKindVersions.get(kind, 0)):
+                self._metadataCache[(kind, key)] = (time.monotonic(), ret)
+
+        return ret
+
+    def _dropCachedMetadata(self, kind: str) -> None:
+        """Removes one kind of metadata from the metadata cache, leaving the other kinds (and
+            their retrievals in progress) intact.
+
+        Args:
+            kind:
+                The kind of the metadata; one of the keys of `metadataCacheTTL`.
+        """
+        with self._metadataLock:
+            self._metadataKindVersions[kind] = self._metadataKindVersions.get(kind, 0) + 1
+            for k in [k for k in self._metadataCache if k[0] == kind]:
+                del self._metadataCache[k]
+
+    def invalidateMetadataCache(self, *kinds: str) -> None:
+        """Removes metadata from the connection's metadata cache.
+
+        The cache is invalidated automatically after schema changes, query installations and
+        data modifications made through this connection. Use this function when the database is
+        modified by other clients.
+
+        Args:
+            kinds:
+                The kinds of metadata to be removed (see `metadataCacheTTL`). If not specified, all
+                cached metadata is removed.
+        """
+        logger.info("entry: invalidateMetadataCache")
+        if logger.level == logging.DEBUG:
+            logger.debug("params: " + self._locals(locals()))
+
+        with self._metadataLock:
+            self._metadataVersion += 1
+            if kinds:
+                for k in list(self._metadataCache):
+                    if k[0] in kinds:
+                        del self._metadataCache[k]
+            else:
+                self._metadataCache.clear()
+        if not kinds or "schema" in kinds:
+            self.schema = None
+
+        logger.info("exit: invalidateMetadataCache")
+
+    def _runConcurrently(self, func: Callable, argsList: list, concurrency: int = 1) -> list:
+        """Calls a function once for each item of a list, running at most `concurrency` calls at a
+            time.
+
+        Args:
+            func:
+                The function to be called; it receives one item of `argsList` as its only argument.
+            argsList:
+                The list of arguments.
+            concurrency:
+                The maximum number of calls running in parallel. If `1` (or less), the calls are
+                executed sequentially in the calling thread.
+
+        Returns:
+            The list of return values, in the order of `argsList`.
+        """
+        if not concurrency or concurrency <= 1 or len(argsList) <= 1:
+            return [func(a) for a in argsList]
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(argsList))) as executor:
+            return list(executor.map(func, argsList))
+
+    def _iterConcurrently(self, func: Callable, argsList: Iterable, concurrency: int = 1) -> Iterator:
+        """Calls a function for each item of an iterable and yields the return values in order,
+            keeping at most `concurrency` calls running ahead of the consumer.
+
+        Args:
+            func:
+                The function to be called; it receives one item of `argsList` as its only argument.
+            argsList:
+                The arguments; consumed lazily.
+            concurrency:
+                The maximum number of calls running in parallel (i.e. prefetched). If `1` (or
+                less), each call is made only when the consumer asks for the next value.
+
+        Returns:
+            A generator of the return values, in the order of `argsList`.
+        """
+        args = iter(argsList)
+        if not concurrency or concurrency <= 1:
+            for a in args:
+                yield func(a)
+            return
+        executor = ThreadPoolExecutor(max_workers=concurrency)
+        pending = deque(executor.submit(func, a) for a in islice(args, concurrency))
+        try:
+            while pending:
+                res = pending.popleft().result()
+                for a in islice(args, 1):
+                    pending.append(executor.submit(func, a))
+                yield res
+        finally:
+            # The consumer may stop early; do not start the calls that are not running yet
+            for f in pending:
+                f.cancel()
+            executor.shutdown(wait=False)
+
+    def _iterCursor(self, func: Callable, cursor: object, prefetch: int = 0) -> Iterator:
+        """Calls a paging function repeatedly, each time with the cursor returned by the previous
+            call, and yields the pages.
+
+        Args:
+            func:
+                The function to be called; it receives the cursor as its only argument and returns
+                a `(page, next_cursor)` tuple. `next_cursor` is `None` after the last page.
+            cursor:
+                The cursor of the first page.
+            prefetch:
+                The maximum number of pages retrieved (in a background thread) ahead of the
+                consumer. If `0`, each page is retrieved only when the consumer asks for it.
+
+        Returns:
+            A generator of the pages.
+        """
+        if not prefetch or prefetch < 1:
+            while cursor is not None:
+                page, cursor = func(cursor)
+                yield page
+            return
+
+        pages = queue.Queue(maxsize=prefetch)
+        stopped = threading.Event()
+
+        def put(item: tuple) -> bool:
+            while not stopped.is_set():
+                try:
+                    pages.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        def produce(cursor: object) -> None:
+            try:
+                while cursor is not None:
+                    page, cursor = func(cursor)
+                    if not put((page, None)):
+                        return
+            except Exception as e:
+                put((None, e))
+                return
+            put((None, StopIteration()))
+
+        threading.Thread(target=produce, args=(cursor,), daemon=True,
+            name="pyTigerGraph-prefetch").start()
+        try:
+            while True:
+                page, error = pages.get()
+                if isinstance(error, StopIteration):
+                    return
+                if error is not None:
+                    raise error
+                yield page
+        finally:
+            # The consumer may stop early; let the producer thread exit
+            stopped.set()
+
     def customizeHeader(self, timeout:int = 16_000, responseSize:int = 3.2e+7):
         """Method to configure the request header.
 
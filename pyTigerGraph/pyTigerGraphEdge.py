@@ -7,7 +7,7 @@ import json
 import logging
 import warnings
 
-from typing import TYPE_CHECKING, Union
+from typing import TYPE_CHECKING, Iterator, Union
 
 if TYPE_CHECKING:
     import pandas as pd
@@ -37,9 +37,7 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
         if logger.level == logging.DEBUG:
             logger.debug("params: " + self._locals(locals()))
 
-        ret = []
-        for et in self.getSchema(force=force)["EdgeTypes"]:
-            ret.append(et["Name"])
+        ret = list(self._getSchemaIndex(force)["edgeTypes"])
 
         if logger.level == logging.DEBUG:
             logger.debug("return: " + str(ret))
@@ -64,13 +62,13 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
         if logger.level == logging.DEBUG:
             logger.debug("params: " + self._locals(locals()))
 
-        for et in self.getSchema(force=force)["EdgeTypes"]:
-            if et["Name"] == edgeType:
-                if logger.level == logging.DEBUG:
-                    logger.debug("return: " + str(et))
-                logger.info("exit: getEdgeType (found)")
+        et = self._getSchemaIndex(force)["edgeTypes"].get(edgeType)
+        if et:
+            if logger.level == logging.DEBUG:
+                logger.debug("return: " + str(et))
+            logger.info("exit: getEdgeType (found)")
 
-                return et
+            return et
 
         logger.warning("Edge type `" + edgeType + "` was not found.")
         logger.info("exit: getEdgeType (not found)")
@@ -96,11 +94,7 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
         if logger.level == logging.DEBUG:
             logger.debug("params: " + self._locals(locals()))
 
-        et = self.getEdgeType(edgeType)
-        ret = []
-
-        for at in et["Attributes"]:
-            ret.append((at["AttributeName"], self._getAttrType(at["AttributeType"])))
+        ret = list(self._getSchemaIndex()["edgeAttrs"][edgeType])
 
         if logger.level == logging.DEBUG:
             logger.debug("return: " + str(ret))
@@ -135,37 +129,15 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
         if logger.level == logging.DEBUG:
             logger.debug("params: " + self._locals(locals()))
 
-        edgeTypeDetails = self.getEdgeType(edgeType)
-
-        # Edge type with a single source vertex type
-        if edgeTypeDetails["FromVertexTypeName"] != "*":
-            ret = edgeTypeDetails["FromVertexTypeName"]
-
-            if logger.level == logging.DEBUG:
-                logger.debug("return: " + str(ret))
-            logger.info("exit: getEdgeSourceVertexType (single source)")
-
-            return ret
+        ret = self._getSchemaIndex()["edgeSources"][edgeType]
+        if isinstance(ret, set):
+            ret = set(ret)
 
-        # Edge type with multiple source vertex types
-        if "EdgePairs" in edgeTypeDetails:
-            # v3.0 and later notation
-            vts = set()
-            for ep in edgeTypeDetails["EdgePairs"]:
-                vts.add(ep["From"])
-
-            if logger.level == logging.DEBUG:
-                logger.debug("return: " + str(vts))
-            logger.info("exit: getEdgeSourceVertexType (multi source)")
-
-            return vts
-        else:
-            # 2.6.1 and earlier notation
-            if logger.level == logging.DEBUG:
-                logger.debug("return: *")
-            logger.info("exit: getEdgeSourceVertexType (multi source, pre-3.x)")
+        if logger.level == logging.DEBUG:
+            logger.debug("return: " + str(ret))
+        logger.info("exit: getEdgeSourceVertexType")
 
-            return "*"
+        return ret
 
     def getEdgeTargetVertexType(self, edgeType: str) -> Union[str, set]:
         """Returns the type(s) of the edge type's target vertex.
@@ -193,37 +165,15 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
         if logger.level == logging.DEBUG:
             logger.debug("params: " + self._locals(locals()))
 
-        edgeTypeDetails = self.getEdgeType(edgeType)
-
-        # Edge type with a single target vertex type
-        if edgeTypeDetails["ToVertexTypeName"] != "*":
-            ret = edgeTypeDetails["ToVertexTypeName"]
-
-            if logger.level == logging.DEBUG:
-                logger.debug("return: " + str(ret))
-            logger.info("exit: getEdgeTargetVertexType (single target)")
-
-            return ret
+        ret = self._getSchemaIndex()["edgeTargets"][edgeType]
+        if isinstance(ret, set):
+            ret = set(ret)
 
-        # Edge type with multiple target vertex types
-        if "EdgePairs" in edgeTypeDetails:
-            # v3.0 and later notation
-            vts = set()
-            for ep in edgeTypeDetails["EdgePairs"]:
-                vts.add(ep["To"])
-
-            if logger.level == logging.DEBUG:
-                logger.debug("return: " + str(vts))
-            logger.info("exit: getEdgeTargetVertexType (multi target)")
-
-            return vts
-        else:
-            # 2.6.1 and earlier notation
-            if logger.level == logging.DEBUG:
-                logger.debug("return: *")
-            logger.info("exit: getEdgeTargetVertexType (multi target, pre-3.x)")
+        if logger.level == logging.DEBUG:
+            logger.debug("return: " + str(ret))
+        logger.info("exit: getEdgeTargetVertexType")
 
-            return "*"
+        return ret
 
     def isDirected(self, edgeType: str) -> bool:
         """Is the specified edge type directed?
@@ -267,10 +217,8 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
 
             return ""
 
-        config = self.getEdgeType(edgeType)["Config"]
-        if "REVERSE_EDGE" in config:
-            ret = config["REVERSE_EDGE"]
-
+        ret = self._getSchemaIndex()["reverseEdges"].get(edgeType)
+        if ret:
             if logger.level == logging.DEBUG:
                 logger.debug("return: " + str(ret))
             logger.info("exit: getReverseEdge (reverse edge found)")
@@ -881,8 +829,154 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
         return self.getEdgesDataFrame(sourceVertexType, sourceVertexId, edgeType, targetVertexType,
             targetVertexId, select, where, limit, sort, timeout)
 
+    def iterEdges(self, edgeType: str, chunkSize: int = 10000, fmt: str = "py",
+            withId: bool = True, withType: bool = False, prefetch: int = 0, compact: bool = False,
+            partition: tuple = None) -> Iterator[Union[list, str, 'pd.DataFrame']]:
+        """Iterates over all edges of the given edge type, page by page.
+
+        The edges are retrieved per source vertex type, in pages of the edges of consecutive
+        source vertices (in the order of their internal ID), so that each page contains about
+        `chunkSize` edges. Each page starts after the last source vertex of the previous page, so
+        edge types of any size can be exported without running into response size or memory
+        limits. Edge types with multiple source vertex types are supported; undirected edges are
+        returned only once.
+
+        NOTE: The server cannot start a scan at the cursor: each page is selected by scanning all
+        vertices of the source vertex type and keeping the source vertices with the smallest
+        internal IDs after the cursor. With `S` source vertices and pages of `P` source vertices,
+        `S * S / P` vertices are scanned in total, i.e. the cost grows quadratically with the
+        number of source vertices for a given `chunkSize`. Use pages as large as memory allows.
+
+        The pages are retrieved by installed queries (one per source vertex type), which are
+        created and installed at the first call for the edge type (this can take a minute or so).
+        The queries are named `iterEdges_<edge_type>_<hash>`; they are reused by later calls,
+        including those of other processes and sessions.
+
+        Args:
+            edgeType:
+                The name of the edge type.
+            chunkSize:
+                The (approximate) number of edges in a page. Empty pages are skipped.
+            fmt:
+                Format of the pages:
+                - "py":   Python objects
+                - "json": JSON document
+                - "df":   pandas DataFrame
+            withId:
+                (When the output format is "df") Should the source and target vertex types and IDs
+                be included in the dataframe?
+            withType:
+                (When the output format is "df") Should the edge type be included in the dataframe?
+            prefetch:
+                The number of pages retrieved (in a background thread) ahead of the consumption of
+                the pages. Default is `0`, i.e. a page is retrieved only when it is requested.
+            compact:
+                (When the output format is "df") Should compact, schema derived dtypes be used in
+                the dataframe? See `edgeSetToDataFrame()`.
+            partition:
+                An `(i, n)` tuple: only the edges of the source vertices of the `i`-th of `n`
+                disjoint partitions (by internal ID) are retrieved. Iterating over the `n`
+                partitions in parallel retrieves all edges. The default is to retrieve all edges.
+
+        Returns:
+            A generator of the pages of edge instances, as edge sets (lists), JSON strings or pandas
+            DataFrames (one row per edge, with the source, target and attribute columns).
+
+        Endpoints:
+            - `POST /gsqlserver/gsql/file` (at the first call)
+            - `GET /query/{graph_name}/iterEdges_<edge_type>_<hash>`
+        """
+        logger.info("entry: iterEdges")
+        if logger.level == logging.DEBUG:
+            logger.debug("params: " + self._locals(locals()))
+
+        if not chunkSize or chunkSize <= 0:
+            raise TigerGraphException("chunkSize must be a positive integer.", None)
+        part, parts = partition or (0, 1)
+        if not 0 <= part < parts:
+            raise TigerGraphException("Invalid partition: " + str(partition), None)
+        et = self.getEdgeType(edgeType)
+        if not et:
+            raise TigerGraphException("Edge type `" + edgeType + "` was not found.", None)
+
+        pairs = self._getSchemaIndex()["edgePairs"][edgeType]
+        sourceVertexTypes = {p[0] for p in pairs}
+        if not et["IsDirected"]:
+            sourceVertexTypes.update(p[1] for p in pairs)
+        if "*" in sourceVertexTypes:
+            # 2.6.1 and earlier notation
+            sourceVertexTypes = set(self.getVertexTypes())
+
+        condition = ""
+        if not et["IsDirected"]:
+            # An undirected edge is traversable from both of its endpoints; keep only one of them
+            condition = "WHERE (s.type < t.type OR (s.type == t.type AND getvid(s) <= getvid(t)))"
+
+        # The page is the edges of the `page_size` source vertices following the cursor (the
+        # internal ID of the last source vertex of the previous page)
+        queryBody = \
+            '(INT after, INT page_size, INT part, INT parts) FOR GRAPH $graphname { \
+                SetAccum<EDGE> @@edges; \
+                MaxAccum<INT> @@last; \
+                start = {$sourceVertexType.*}; \
+                sources = \
+                    SELECT s \
+                    FROM   start:s \
+                    WHERE  getvid(s) > after AND getvid(s) % parts == part \
+                    ORDER BY getvid(s) ASC \
+                    LIMIT  page_size; \
+                sources = \
+                    SELECT s \
+                    FROM   sources:s \
+                    ACCUM  @@last += getvid(s); \
+                res = \
+                    SELECT s \
+                    FROM   sources:s -($edgeType:e)-> ANY:t \
+                    $condition \
+                    ACCUM  @@edges += e; \
+                PRINT @@last AS last, sources.size() AS size, @@edges AS edges; \
+            }'
+        queryBody = queryBody.replace("$graphname", self.graphname) \
+            .replace("$edgeType", edgeType) \
+            .replace("$condition", condition)
+
+        def pages(svt: str, pageSize: int) -> Iterator[list]:
+            body = queryBody.replace("$sourceVertexType", svt)
+            queryName = self._pagingQueryName("iterEdges_" + edgeType, body)
+            self._installQueryOnce(queryName, "CREATE QUERY " + queryName + body)
+
+            def fetch(after: int) -> tuple:
+                res = self.runInstalledQuery(queryName, {"after": after, "page_size": pageSize,
+                    "part": part, "parts": parts})[0]
+                return res["edges"], (res["last"] if res["size"] == pageSize else None)
+
+            return self._iterCursor(fetch, -1, prefetch)
+
+        def allPages() -> Iterator[list]:
+            for svt in sorted(sourceVertexTypes):
+                cnt = self.getEdgeCount(edgeType, sourceVertexType=svt)
+                if isinstance(cnt, dict):
+                    cnt = sum(cnt.values())
+                if not cnt:
+                    continue
+                # The number of source vertices whose edges make up about `chunkSize` edges
+                pageSize = max(1, chunkSize * self.getVertexCount(svt) // cnt)
+                yield from pages(svt, pageSize)
+
+        for ret in allPages():
+            if not ret:
+                continue
+            if fmt == "json":
+                ret = json.dumps(ret)
+            elif fmt == "df":
+                ret = self.edgeSetToDataFrame(ret, withId, withType, compact)
+
+            yield ret
+
+        logger.info("exit: iterEdges")
+
     def getEdgesByType(self, edgeType: str, fmt: str = "py", withId: bool = True,
-            withType: bool = False) -> Union[dict, str, 'pd.DataFrame']:
+            withType: bool = False, usePaging: bool = False) -> Union[dict, str, 'pd.DataFrame']:
         """Retrieves edges of the given edge type regardless the source vertex.
 
         Args:
@@ -898,11 +992,21 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
                 be included in the dataframe?
             withType:
                 (When the output format is "df") should the edge type be included in the dataframe?
+            usePaging:
+                Should the edges be retrieved page by page (see `iterEdges()`) and then merged,
+                instead of by a single interpreted query? This also supports edge types with
+                multiple source vertex types, but the paging queries are created and installed at
+                the first call (which requires the privilege to create and install queries, takes a
+                minute or so and leaves the queries installed).
 
         Returns:
             The details of the edge instances of the given edge type as dictionary, JSON or pandas
             DataFrame.
 
+        Endpoints:
+            - `POST /gsqlserver/interpreted_query`
+            - `GET /query/{graph_name}/iterEdges_<edge_type>_<hash>` (if `usePaging` is `True`)
+
         TODO Add limit parameter
         """
         logger.info("entry: getEdgesByType")
@@ -915,31 +1019,36 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
 
             return {}
 
-        sourceVertexType = self.getEdgeSourceVertexType(edgeType)
-        # TODO Support edges with multiple source vertex types
-        if isinstance(sourceVertexType, set) or sourceVertexType == "*":
-            raise TigerGraphException(
-                "Edges with multiple source vertex types are not currently supported.", None)
-
-        queryText = \
-            'INTERPRET QUERY () FOR GRAPH $graph { \
-            SetAccum<EDGE> @@edges; \
-            start = {ANY}; \
-            res = \
-                SELECT s \
-                FROM   start:s-(:e)->ANY:t \
-                WHERE  e.type == "$edgeType" \
-                   AND s.type == "$sourceEdgeType" \
-                ACCUM  @@edges += e; \
-            PRINT @@edges AS edges; \
-        }'
-
-        queryText = queryText.replace("$graph", self.graphname) \
-            .replace('$sourceEdgeType', sourceVertexType) \
-            .replace('$edgeType', edgeType)
-        ret = self.runInterpretedQuery(queryText)
-
-        ret = ret[0]["edges"]
+        if usePaging:
+            ret = []
+            for page in self.iterEdges(edgeType, chunkSize=100000):
+                ret += page
+        else:
+            sourceVertexType = self.getEdgeSourceVertexType(edgeType)
+            # TODO Support edges with multiple source vertex types
+            if isinstance(sourceVertexType, set) or sourceVertexType == "*":
+                raise TigerGraphException(
+                    "Edges with multiple source vertex types are not currently supported.", None)
+
+            queryText = \
+                'INTERPRET QUERY () FOR GRAPH $graph { \
+                SetAccum<EDGE> @@edges; \
+                start = {ANY}; \
+                res = \
+                    SELECT s \
+                    FROM   start:s-(:e)->ANY:t \
+                    WHERE  e.type == "$edgeType" \
+                       AND s.type == "$sourceEdgeType" \
+                    ACCUM  @@edges += e; \
+                PRINT @@edges AS edges; \
+            }'
+
+            queryText = queryText.replace("$graph", self.graphname) \
+                .replace('$sourceEdgeType', sourceVertexType) \
+                .replace('$edgeType', edgeType)
+            ret = self.runInterpretedQuery(queryText)
+
+            ret = ret[0]["edges"]
 
         if fmt == "json":
             ret = json.dumps(ret)
@@ -948,13 +1057,14 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
 
         if logger.level == logging.DEBUG:
             logger.debug("return: " + str(ret))
-        logger.info("exit: _upsertAttrs")
+        logger.info("exit: getEdgesByType")
 
         return ret
 
     # TODO getEdgesDataFrameByType
 
-    def getEdgeStats(self, edgeTypes: Union[str, list], skipNA: bool = False) -> dict:
+    def getEdgeStats(self, edgeTypes: Union[str, list], skipNA: bool = False,
+            concurrency: int = 4) -> dict:
         """Returns edge attribute statistics.
 
         Args:
@@ -963,6 +1073,9 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
             skipNA:
                 Skip those edges that do not have attributes or none of their attributes have
                 statistics gathered.
+            concurrency:
+                The maximum number of edge types processed in parallel (each edge type requires a
+                separate request). Defaults to 4.
 
         Returns:
             Attribute statistics of edges; a dictionary of dictionaries.
@@ -988,11 +1101,13 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
 
             return {}
 
-        ret = {}
-        for et in ets:
+        def stats(et: str) -> dict:
             data = '{"function":"stat_edge_attr","type":"' + et + '","from_type":"*","to_type":"*"}'
-            res = self._post(self.restppUrl + "/builtins/" + self.graphname, data=data, resKey="",
-                skipCheck=True)
+            return self._post(self.restppUrl + "/builtins/" + self.graphname, data=data,
+                resKey="", skipCheck=True)
+
+        ret = {}
+        for et, res in zip(ets, self._runConcurrently(stats, ets, concurrency)):
             if res["error"]:
                 if "stat_edge_attr is skip" in res["message"] or \
                         "No valid edge for the input edge type" in res["message"]:
@@ -1089,7 +1204,7 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
         return ret
 
     def edgeSetToDataFrame(self, edgeSet: list, withId: bool = True,
-            withType: bool = False) -> 'pd.DataFrame':
+            withType: bool = False, compact: bool = False) -> 'pd.DataFrame':
         """Converts an edge set to Pandas DataFrame
 
         Edge sets contain instances of the same edge type. Edge sets are not generated "naturally"
@@ -1147,6 +1262,10 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
                 Whether to include the type and primary ID of source and target vertices as a column. Default is `True`.
             withType:
                 Whether to include edge type info as a column. Default is `False`.
+            compact:
+                Whether to apply compact dtypes derived from the (cached) schema of the edge type:
+                the smallest integer types fitting the values, `float32` for `FLOAT`, `bool` for
+                `BOOL` and `category` for `STRING` attributes. Default is `False`.
 
         Returns:
             A pandas DataFrame containing the edge attributes and optionally the type and primary
@@ -1163,15 +1282,18 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
             raise ImportError("Pandas is required to use this function. "
                               "Download pandas using 'pip install pandas'.")
 
-        df = pd.DataFrame(edgeSet)
-        cols = []
+        idKeys = []
         if withId:
-            cols.extend([df["from_type"], df["from_id"], df["to_type"], df["to_id"]])
+            idKeys.extend(["from_type", "from_id", "to_type", "to_id"])
         if withType:
-            cols.append(df["e_type"])
-        cols.append(pd.DataFrame(df["attributes"].tolist()))
-
-        ret = pd.concat(cols, axis=1)
+            idKeys.append("e_type")
+        dtypes = None
+        if compact and edgeSet:
+            et = self.getEdgeType(edgeSet[0]["e_type"])
+            if et:
+                dtypes = self._getAttrDtypes(et["Attributes"])
+
+        ret = self._elementSetToDataFrame(edgeSet, idKeys, dtypes)
 
         if logger.level == logging.DEBUG:
             logger.debug("return: " + str(ret))
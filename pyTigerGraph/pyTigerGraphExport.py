@@ -0,0 +1,293 @@
+"""Export Functions
+
+Export the vertices and edges of the graph to files for offline processing.
+All functions in this module are called as methods on a link:https://docs.tigergraph.com/pytigergraph/current/core-functions/base[`TigerGraphConnection` object].
+"""
+import json
+import logging
+import os
+import time
+from typing import Iterable, Union
+
+from pyTigerGraph.pyTigerGraphException import TigerGraphException
+from pyTigerGraph.pyTigerGraphSchema import pyTigerGraphSchema
+
+logger = logging.getLogger(__name__)
+
+
+class pyTigerGraphExport(pyTigerGraphSchema):
+
+    def _getArrowSchema(self, idKeys: list, attributes: list) -> 'pa.Schema':
+        """Returns the Arrow schema of the files of a vertex or edge type.
+
+        Args:
+            idKeys:
+                The (non-attribute) columns of the files. These are always strings.
+            attributes:
+                The `Attributes` list of the vertex or edge type in the schema metadata.
+
+        Returns:
+            The Arrow schema. Attributes of container or user defined types are stored as JSON
+            strings.
+        """
+        import pyarrow as pa
+
+        types = {
+            "INT": pa.int64(),
+            "UINT": pa.uint64(),
+            "FLOAT": pa.float32(),
+            "DOUBLE": pa.float64(),
+            "BOOL": pa.bool_(),
+            "DATETIME": pa.timestamp("s")
+        }
+        fields = [pa.field(k, pa.string()) for k in idKeys]
+        for attr in attributes:
+            fields.append(pa.field(attr["AttributeName"],
+                types.get(attr["AttributeType"]["Name"], pa.string())))
+
+        return pa.schema(fields)
+
+    def _elementSetToArrow(self, elementSet: list, idKeys: list,
+            schema: 'pa.Schema') -> 'pa.Table':
+        """Converts a vertex or edge set to an Arrow table of the given schema.
+
+        Args:
+            elementSet:
+                A vertex or edge set, as returned by queries.
+            idKeys:
+                The (non-attribute) keys of the set elements to be included as the first columns.
+            schema:
+                The Arrow schema of the table, as returned by `_getArrowSchema()`.
+
+        Returns:
+            The Arrow table.
+        """
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        idCols, attrCols = self._elementSetToColumns(elementSet, idKeys)
+        cols = dict(zip(idKeys, idCols))
+        cols.update(attrCols)
+
+        arrays = []
+        for field in schema:
+            col = cols.get(field.name, [None] * len(elementSet))
+            if pa.types.is_timestamp(field.type):
+                arrays.append(pc.strptime(pa.array(col, pa.string()), format="%Y-%m-%d %H:%M:%S",
+                    unit="s"))
+            elif pa.types.is_string(field.type) and field.name not in idKeys:
+                arrays.append(pa.array([v if v is None or isinstance(v, str) else json.dumps(v)
+                    for v in col], pa.string()))
+            else:
+                arrays.append(pa.array(col, field.type))
+
+        return pa.Table.from_arrays(arrays, schema=schema)
+
+    def _writeTables(self, path: str, relPath: str, tables: Iterable['pa.Table'], format: str,
+            schema: 'pa.Schema' = None, start: int = 0, prefix: str = "part-") -> dict:
+        """Writes Arrow tables to numbered Parquet or Arrow IPC files, one file per table.
+
+        Args:
+            path:
+                The root directory of the export.
+            relPath:
+                The directory of the files, relative to `path`. It is created if it does not exist.
+            tables:
+                The tables to be written.
+            format:
+                "parquet" or "arrow".
+            schema:
+                The schema of the tables. Defaults to the schema of the first table.
+            start:
+                The number of the first file. Used to append files to the ones written earlier.
+            prefix:
+                The prefix of the file names; the files are named `<prefix><number>.<extension>`.
+
+        Returns:
+            The files (relative to `path`), the number of rows and the columns written.
+        """
+        import pyarrow.ipc
+        import pyarrow.parquet
+
+        ext = ".parquet" if format == "parquet" else ".arrow"
+        dirPath = os.path.join(path, *relPath.split("/"))
+        os.makedirs(dirPath, exist_ok=True)
+        files = []
+        rows = 0
+        for i, table in enumerate(tables, start):
+            if schema is None:
+                schema = table.schema
+            fileName = "{}{:05d}{}".format(prefix, i, ext)
+            if format == "parquet":
+                pyarrow.parquet.write_table(table, os.path.join(dirPath, fileName))
+            else:
+                with pyarrow.ipc.new_file(os.path.join(dirPath, fileName), table.schema) as writer:
+                    writer.write_table(table)
+            files.append(relPath + "/" + fileName)
+            rows += table.num_rows
+
+        return {
+            "files": files,
+            "rows": rows,
+            "columns": [{"name": f.name, "type": str(f.type)} for f in schema] if schema else []
+        }
+
+    def _clearTables(self, path: str, relPath: str) -> None:
+        """Removes the files written by an earlier export from the directory of a vertex or edge type.
+
+        Args:
+            path:
+                The root directory of the export.
+            relPath:
+                The directory of the files, relative to `path`.
+        """
+        dirPath = os.path.join(path, *relPath.split("/"))
+        if not os.path.isdir(dirPath):
+            return
+        for fileName in os.listdir(dirPath):
+            if fileName.startswith("part-") and fileName.endswith((".parquet", ".arrow")):
+                os.remove(os.path.join(dirPath, fileName))
+
+    def exportGraph(self, path: str, vertexTypes: Union[str, list] = "*",
+            edgeTypes: Union[str, list] = "*", format: str = "parquet", chunkSize: int = 100000,
+            concurrency: int = 4) -> dict:
+        """Exports the vertices and edges of the graph to Parquet or Arrow IPC files.
+
+        Each vertex and edge type is retrieved page by page by installed paging queries (see
+        `iterVertices()` and `iterEdges()`), and each page is written to a separate file. Types of
+        more than `chunkSize` vertices or edges are split into up to `concurrency` partitions (see
+        the `partition` argument of `iterVertices()` and `iterEdges()`). Up to `concurrency`
+        partitions (of any types) are exported in parallel; the next page of a partition is
+        retrieved while the previous one is being written:
+
+        ----
+        <path>/vertices/<vertex_type>/part-00000.parquet
+        <path>/vertices/<large_vertex_type>/part-00000-00000.parquet
+        <path>/vertices/<large_vertex_type>/part-00001-00000.parquet
+        <path>/edges/<edge_type>/part-00000.parquet
+        <path>/manifest.json
+        ----
+
+        Files of an earlier export into the same directory are removed from the directories of the
+        exported types, so that the directories contain only the files listed in the manifest.
+
+        The column types are derived from the schema of the vertex or edge type. Vertex files
+        contain a `v_id` column, edge files contain `from_type`, `from_id`, `to_type` and `to_id`
+        columns, followed by the attributes. The manifest lists the files, the number of rows and
+        the columns of each vertex and edge type.
+
+        Args:
+            path:
+                The directory to export the graph into. It is created if it does not exist.
+            vertexTypes:
+                The vertex type(s) to export. `"*"` exports all vertex types of the graph.
+            edgeTypes:
+                The edge type(s) to export. `"*"` exports all edge types of the graph.
+            format:
+                The format of the files:
+                - "parquet": Apache Parquet
+                - "arrow":   Apache Arrow IPC (Feather V2)
+            chunkSize:
+                The (approximate) number of vertices or edges in a page (i.e. file).
+            concurrency:
+                The number of partitions of vertex and edge types exported in parallel.
+
+        Returns:
+            The manifest of the export.
+
+        Endpoints:
+            - `POST /builtins/{graph_name}` (counting the vertices and edges)
+            - `POST /gsqlserver/gsql/file` (installation of the paging queries, at the first call)
+            - `GET /query/{graph_name}/iterVertices_<vertex_type>_<hash>`
+            - `GET /query/{graph_name}/iterEdges_<edge_type>_<hash>`
+        """
+        logger.info("entry: exportGraph")
+        if logger.level == logging.DEBUG:
+            logger.debug("params: " + self._locals(locals()))
+
+        try:
+            import pyarrow.ipc
+            import pyarrow.parquet
+        except ImportError:
+            raise ImportError("PyArrow is required to use this function. "
+                "Download pyarrow using 'pip install pyarrow'.")
+
+        if format not in ("parquet", "arrow"):
+            raise TigerGraphException("Unsupported export format: `" + str(format) + "`.", None)
+
+        if vertexTypes == "*":
+            vertexTypes = self.getVertexTypes()
+        elif isinstance(vertexTypes, str):
+            vertexTypes = [vertexTypes]
+        if edgeTypes == "*":
+            edgeTypes = self.getEdgeTypes()
+        elif isinstance(edgeTypes, str):
+            edgeTypes = [edgeTypes]
+
+        types = []
+        for vt in vertexTypes:
+            vType = self.getVertexType(vt)
+            if not vType:
+                raise TigerGraphException("Vertex type `" + vt + "` was not found.", None)
+            attributes = vType["Attributes"]
+            if vType["PrimaryId"].get("PrimaryIdAsAttribute"):
+                attributes = [{"AttributeName": vType["PrimaryId"]["AttributeName"],
+                    "AttributeType": vType["PrimaryId"]["AttributeType"]}] + attributes
+            types.append(("vertices", vt, ["v_id"], attributes))
+        for et in edgeTypes:
+            eType = self.getEdgeType(et)
+            if not eType:
+                raise TigerGraphException("Edge type `" + et + "` was not found.", None)
+            types.append(("edges", et, ["from_type", "from_id", "to_type", "to_id"],
+                eType["Attributes"]))
+
+        # Large types are split into partitions of at least `chunkSize` vertices or edges, so that
+        # they are exported in parallel too
+        jobs = []
+        for kind, typeName, idKeys, attributes in types:
+            if kind == "vertices":
+                cnt = self.getVertexCount(typeName)
+            else:
+                cnt = self.getEdgeCount(typeName)
+                if isinstance(cnt, dict):
+                    cnt = sum(cnt.values())
+            parts = max(1, min(concurrency, cnt // chunkSize))
+            jobs.extend((kind, typeName, idKeys, attributes, part, parts) for part in range(parts))
+            self._clearTables(path, kind + "/" + typeName)
+
+        def export(job: tuple) -> dict:
+            kind, typeName, idKeys, attributes, part, parts = job
+            partition = (part, parts) if parts > 1 else None
+            if kind == "vertices":
+                pages = self.iterVertices(typeName, chunkSize=chunkSize, prefetch=1,
+                    partition=partition)
+            else:
+                pages = self.iterEdges(typeName, chunkSize=chunkSize, prefetch=1,
+                    partition=partition)
+            schema = self._getArrowSchema(idKeys, attributes)
+            return self._writeTables(path, kind + "/" + typeName,
+                (self._elementSetToArrow(page, idKeys, schema) for page in pages), format, schema,
+                prefix="part-{:05d}-".format(part) if partition else "part-")
+
+        manifest = {
+            "graph": self.graphname,
+            "format": format,
+            "created": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "vertices": {},
+            "edges": {}
+        }
+        for job, res in zip(jobs, self._runConcurrently(export, jobs, concurrency)):
+            written = manifest[job[0]].setdefault(job[1], {"files": [], "rows": 0,
+                "columns": res["columns"]})
+            written["files"].extend(res["files"])
+            written["rows"] += res["rows"]
+
+        os.makedirs(path, exist_ok=True)
+        with open(os.path.join(path, "manifest.json"), "w") as f:
+            json.dump(manifest, f, indent=2)
+
+        if logger.level == logging.DEBUG:
+            logger.debug("return: " + str(manifest))
+        logger.info("exit: exportGraph")
+
+        return manifest
@@ -19,6 +19,11 @@ from .pyTigerGraphException import TigerGraphException
 logger = logging.getLogger(__name__)
 
 ANSI_ESCAPE = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+# GSQL statements that (may) change the schema, the installed queries or the data of the graph
+SCHEMA_CHANGE = re.compile(r"\b(SCHEMA_CHANGE|TYPEDEF|ALTER|DROP\s+(ALL|GRAPH|VERTEX|EDGE|TUPLE)"
+    r"|CREATE\s+(GRAPH|VERTEX|(UN)?DIRECTED\s+EDGE)|CLEAR\s+GRAPH\s+STORE|RUN\s+LOADING\s+JOB)\b",
+    re.IGNORECASE)
+QUERY_CHANGE = re.compile(r"\b(INSTALL|DROP)\s+QUERY\b", re.IGNORECASE)
 
 
 class pyTigerGraphGSQL(pyTigerGraphBase):
@@ -73,19 +78,27 @@ class pyTigerGraphGSQL(pyTigerGraphBase):
         if str(graphname).upper() == "GLOBAL" or str(graphname).upper() == "":
             graphname = ""
 
-        res = self._req("POST",
-                        self.gsUrl + "/gsqlserver/gsql/file",
-                        data=quote_plus(query.encode("utf-8")),
-                        authMode="pwd", resKey=None, skipCheck=True,
-                        jsonResponse=False)
+        try:
+            res = self._req("POST",
+                            self.gsUrl + "/gsqlserver/gsql/file",
+                            data=quote_plus(query.encode("utf-8")),
+                            authMode="pwd", resKey=None, skipCheck=True,
+                            jsonResponse=False)
 
-
-        if isinstance(res, list):
-            ret = clean_res(res)
-        else:
-            ret = clean_res(res.splitlines())
-
-        check_error(query, ret)
+            if isinstance(res, list):
+                ret = clean_res(res)
+            else:
+                ret = clean_res(res.splitlines())
+
+            check_error(query, ret)
+        finally:
+            # Statements may have been (partially) applied even if an error is reported
+            if SCHEMA_CHANGE.search(query):
+                self.invalidateMetadataCache()
+            elif QUERY_CHANGE.search(query):
+                self.invalidateMetadataCache("installedQueries")
+            if self.queryCache and (SCHEMA_CHANGE.search(query) or QUERY_CHANGE.search(query)):
+                self.queryCache.invalidate()
 
         string_without_ansi = ANSI_ESCAPE.sub('', ret)
 
@@ -146,6 +159,8 @@ class pyTigerGraphGSQL(pyTigerGraphBase):
                 logger.error("Failed to install ExprUtil")
                 raise TigerGraphException(res["message"])
 
+        self.invalidateMetadataCache("udfs")
+
         if logger.level == logging.DEBUG:
             logger.debug("return: 0")
         logger.info("exit: installUDF")
@@ -172,9 +187,9 @@ class pyTigerGraphGSQL(pyTigerGraphBase):
 
         functions_ret = None
         if ExprFunctions:
-            resp = self._get(
+            resp = self._getCachedMetadata("udfs", "ExprFunctions", lambda: self._get(
                 "{}/gsqlserver/gsql/userdefinedfunction".format(self.gsUrl),
-                params={"filename": "ExprFunctions"}, resKey="")
+                params={"filename": "ExprFunctions"}, resKey=""))
             if not resp["error"]:
                 logger.info("ExprFunctions get successfully")
                 functions_ret = resp["results"]
@@ -184,9 +199,9 @@ class pyTigerGraphGSQL(pyTigerGraphBase):
         
         util_ret = None
         if ExprUtil:
-            resp = self._get(
+            resp = self._getCachedMetadata("udfs", "ExprUtil", lambda: self._get(
                 "{}/gsqlserver/gsql/userdefinedfunction".format(self.gsUrl),
-                params={"filename": "ExprUtil"}, resKey="")
+                params={"filename": "ExprUtil"}, resKey=""))
             if not resp["error"]:
                 logger.info("ExprUtil get successfully")
                 util_ret = resp["results"]
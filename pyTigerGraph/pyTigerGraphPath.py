@@ -6,7 +6,7 @@ All functions in this module are called as methods on a link:https://docs.tigerg
 
 import json
 import logging
-from typing import Union
+from typing import Iterable, Union
 
 from pyTigerGraph.pyTigerGraphBase import pyTigerGraphBase
 
@@ -258,3 +258,188 @@ class pyTigerGraphPath(pyTigerGraphBase):
         logger.info("exit: allPaths")
 
         return ret
+
+    def _pathsToArrays(self, results: Iterable) -> dict:
+        """Converts the results of path finding requests to a compact, array based representation.
+
+        Args:
+            results:
+                The results of the path finding requests (see `shortestPath()` and `allPaths()`),
+                one per source/target pair.
+
+        Returns:
+            A dictionary of:
+            - "ids": a dictionary of `(vertex_type, vertex_id): index` pairs of all vertices
+                found; the indices are consecutive integers, in the order of the dictionary.
+            - "vertices": an array of the vertex indices of the subgraphs of all pairs.
+            - "vertexOffsets": the vertices of the subgraph of the `i`th pair are
+                `vertices[vertexOffsets[i]:vertexOffsets[i + 1]]`.
+            - "edges": an `(n, 2)` array of the (source, target) vertex indices of the edges of
+                the subgraphs of all pairs.
+            - "edgeTypes": an array of the indices of the edge types (in `edgeTypeNames`) of the
+                edges.
+            - "edgeTypeNames": the list of edge types found.
+            - "edgeOffsets": the edges of the subgraph of the `i`th pair are
+                `edges[edgeOffsets[i]:edgeOffsets[i + 1]]`.
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            raise ImportError("Numpy is required to use this function. "
+                "Download numpy using 'pip install numpy'.")
+
+        ids = {}
+        eTypes = {}
+        vIdx = []
+        vOffsets = [0]
+        eFrom = []
+        eTo = []
+        eType = []
+        eOffsets = [0]
+
+        def index(vType: str, vId: str) -> int:
+            key = (vType, vId)
+            idx = ids.get(key)
+            if idx is None:
+                idx = ids[key] = len(ids)
+            return idx
+
+        for res in results:
+            for subgraph in res:
+                for v in subgraph.get("vertices", []):
+                    vIdx.append(index(v["v_type"], v["v_id"]))
+                for e in subgraph.get("edges", []):
+                    eFrom.append(index(e["from_type"], e["from_id"]))
+                    eTo.append(index(e["to_type"], e["to_id"]))
+                    et = eTypes.get(e["e_type"])
+                    if et is None:
+                        et = eTypes[e["e_type"]] = len(eTypes)
+                    eType.append(et)
+            vOffsets.append(len(vIdx))
+            eOffsets.append(len(eFrom))
+
+        return {
+            "ids": ids,
+            "vertices": np.array(vIdx, dtype=np.int64),
+            "vertexOffsets": np.array(vOffsets, dtype=np.int64),
+            "edges": np.array([eFrom, eTo], dtype=np.int64).T.reshape(-1, 2),
+            "edgeTypes": np.array(eType, dtype=np.int32),
+            "edgeTypeNames": list(eTypes),
+            "edgeOffsets": np.array(eOffsets, dtype=np.int64)
+        }
+
+    def _pathBatch(self, endpoint: str, pairs: list, maxLength: int, vertexFilters: Union[list, dict],
+            edgeFilters: Union[list, dict], allShortestPaths: bool, concurrency: int,
+            compact: bool) -> Union[list, dict]:
+        """Runs a path finding endpoint for each source/target pair. See `shortestPathBatch()`."""
+        url = self.restppUrl + "/" + endpoint + "/" + self.graphname
+
+        def run(pair: tuple) -> list:
+            return self._post(url, data=self._preparePathParams(pair[0], pair[1], maxLength,
+                vertexFilters, edgeFilters, allShortestPaths))
+
+        if compact:
+            # Convert the results as they arrive, instead of keeping all of them in memory
+            return self._pathsToArrays(self._iterConcurrently(run, pairs, concurrency))
+        return self._runConcurrently(run, pairs, concurrency)
+
+    def shortestPathBatch(self, pairs: list, maxLength: int = None,
+            vertexFilters: Union[list, dict] = None, edgeFilters: Union[list, dict] = None,
+            allShortestPaths: bool = False, concurrency: int = 4,
+            compact: bool = False) -> Union[list, dict]:
+        """Finds the shortest path (or all shortest paths) for many source and target vertex sets.
+
+        Each source/target pair requires a separate request; at most `concurrency` requests are
+        sent at a time.
+
+        Args:
+            pairs:
+                A list of `(sourceVertices, targetVertices)` tuples; see the arguments of
+                `shortestPath()`.
+            maxLength, vertexFilters, edgeFilters, allShortestPaths:
+                See `shortestPath()`; applied to all pairs.
+            concurrency:
+                The maximum number of pairs processed in parallel. Defaults to 4.
+            compact:
+                If `True`, returns the paths as numpy arrays of vertex indices (see below) instead
+                of per-pair subgraphs. Use it for large numbers of pairs.
+
+        Returns:
+            - If `compact` is `False`: the list of the results of `shortestPath()`, in the order of
+                `pairs`.
+            - If `compact` is `True`: a dictionary of:
+                - "ids": a dictionary of `(vertex_type, vertex_id): index` pairs of all vertices
+                    found; the indices are consecutive integers, in the order of the dictionary.
+                - "vertices", "vertexOffsets": the indices of the vertices of the subgraph of the
+                    `i`th pair are `vertices[vertexOffsets[i]:vertexOffsets[i + 1]]`.
+                - "edges", "edgeOffsets": the (source, target) vertex indices of the edges of the
+                    subgraph of the `i`th pair are `edges[edgeOffsets[i]:edgeOffsets[i + 1]]`.
+                - "edgeTypes", "edgeTypeNames": the type of the `j`th edge is
+                    `edgeTypeNames[edgeTypes[j]]`.
+
+        Examples:
+
+            [source.wrap,python]
+            ----
+            paths = conn.shortestPathBatch([(("account", 10), ("person", 50)),
+                (("account", 11), ("person", 51))], maxLength=3, compact=True)
+            ----
+
+        Endpoint:
+            - `POST /shortestpath/{graphName}`
+                See xref:tigergraph-server:API:built-in-endpoints.adoc#_find_shortest_path[Find the shortest path].
+        """
+        logger.info("entry: shortestPathBatch")
+        if logger.level == logging.DEBUG:
+            logger.debug("params: " + self._locals(locals()))
+
+        ret = self._pathBatch("shortestpath", pairs, maxLength, vertexFilters, edgeFilters,
+            allShortestPaths, concurrency, compact)
+
+        if logger.level == logging.DEBUG:
+            logger.debug("return: " + str(ret))
+        logger.info("exit: shortestPathBatch")
+
+        return ret
+
+    def allPathsBatch(self, pairs: list, maxLength: int,
+            vertexFilters: Union[list, dict] = None, edgeFilters: Union[list, dict] = None,
+            concurrency: int = 4, compact: bool = False) -> Union[list, dict]:
+        """Finds all possible paths up to a given maximum path length for many source and target
+        vertex sets.
+
+        Each source/target pair requires a separate request; at most `concurrency` requests are
+        sent at a time.
+
+        Args:
+            pairs:
+                A list of `(sourceVertices, targetVertices)` tuples; see the arguments of
+                `allPaths()`.
+            maxLength, vertexFilters, edgeFilters:
+                See `allPaths()`; applied to all pairs.
+            concurrency:
+                The maximum number of pairs processed in parallel. Defaults to 4.
+            compact:
+                If `True`, returns the paths as numpy arrays of vertex indices instead of per-pair
+                subgraphs. See `shortestPathBatch()`.
+
+        Returns:
+            The list of the results of `allPaths()`, in the order of `pairs`, or their compact
+            representation (see `shortestPathBatch()`).
+
+        Endpoint:
+            - `POST /allpaths/{graphName}`
+                See xref:tigergraph-server:API:built-in-endpoints.adoc#_find_all_paths[Find all paths]
+        """
+        logger.info("entry: allPathsBatch")
+        if logger.level == logging.DEBUG:
+            logger.debug("params: " + self._locals(locals()))
+
+        ret = self._pathBatch("allpaths", pairs, maxLength, vertexFilters, edgeFilters, False,
+            concurrency, compact)
+
+        if logger.level == logging.DEBUG:
+            logger.debug("return: " + str(ret))
+        logger.info("exit: allPathsBatch")
+
+        return ret
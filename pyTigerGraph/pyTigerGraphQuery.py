@@ -3,11 +3,17 @@
 The functions on this page run installed or interpret queries in TigerGraph.
 All functions in this module are called as methods on a link:https://docs.tigergraph.com/pytigergraph/current/core-functions/base[`TigerGraphConnection` object].
 """
+import hashlib
 import json
 import logging
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 
-from typing import TYPE_CHECKING, Union
+from typing import TYPE_CHECKING, Iterator, Union
+
+import requests
 
 if TYPE_CHECKING:
     import pandas as pd
@@ -16,8 +22,14 @@ from pyTigerGraph.pyTigerGraphException import TigerGraphException
 from pyTigerGraph.pyTigerGraphSchema import pyTigerGraphSchema
 from pyTigerGraph.pyTigerGraphUtils import pyTigerGraphUtils
 from pyTigerGraph.pyTigerGraphGSQL import pyTigerGraphGSQL
+from pyTigerGraph.queryCache import QueryResultCache
+from pyTigerGraph.queryJobs import QueryJob, QueryJobManager
 logger = logging.getLogger(__name__)
 
+MAX_URL_LENGTH = 8192  # The maximum URL length accepted by RESTPP
+INTERPRET_QUERY = re.compile(r"^\s*INTERPRET\s+QUERY\s*(\w+\s*)?(?=\()", re.IGNORECASE)
+MAX_COUNTED_INTERPRETED_QUERIES = 1000  # The number of query texts whose runs are counted for promotion
+
 
 class pyTigerGraphQuery(pyTigerGraphUtils, pyTigerGraphSchema, pyTigerGraphGSQL):
     # TODO getQueries()  # List _all_ query names
@@ -55,7 +67,7 @@ class pyTigerGraphQuery(pyTigerGraphUtils, pyTigerGraphSchema, pyTigerGraphGSQL)
         else:
             TigerGraphException(res["message"], res["code"])
     
-    def getInstalledQueries(self, fmt: str = "py") -> Union[dict, str, 'pd.DataFrame']:
+    def getInstalledQueries(self, fmt: str = "py", force: bool = False) -> Union[dict, str, 'pd.DataFrame']:
         """Returns a list of installed queries.
 
         Args:
@@ -64,6 +76,9 @@ class pyTigerGraphQuery(pyTigerGraphUtils, pyTigerGraphSchema, pyTigerGraphGSQL)
                 - "py":   Python objects (default)
                 - "json": JSON document
                 - "df":   pandas DataFrame
+            force:
+                If `True`, retrieves the list again, otherwise returns a cached copy of the list (if
+                it was already fetched previously and has not expired; see `metadataCacheTTL`).
 
         Returns:
             The names of the installed queries.
@@ -76,7 +91,8 @@ class pyTigerGraphQuery(pyTigerGraphUtils, pyTigerGraphSchema, pyTigerGraphGSQL)
         if logger.level == logging.DEBUG:
             logger.debug("params: " + self._locals(locals()))
 
-        ret = self.getEndpoints(dynamic=True)
+        ret = dict(self._getCachedMetadata("installedQueries", self.graphname,
+            lambda: self.getEndpoints(dynamic=True), force))
         if fmt == "json":
             ret = json.dumps(ret)
         if fmt == "df":
@@ -93,6 +109,50 @@ class pyTigerGraphQuery(pyTigerGraphUtils, pyTigerGraphSchema, pyTigerGraphGSQL)
 
         return ret
 
+    def _installQueryOnce(self, queryName: str, queryText: str) -> str:
+        """Creates and installs a query, unless a query of the same name is already installed.
+
+        Concurrent calls for the same query share a single installation.
+
+        Args:
+            queryName:
+                The name of the query.
+            queryText:
+                The `CREATE QUERY` statement of the query.
+
+        Returns:
+            The name of the query.
+
+        Raises:
+            `TigerGraphException` if the query could not be installed.
+        """
+        endpoint = "GET /query/" + self.graphname + "/" + queryName
+        if endpoint in self.getInstalledQueries():
+            return queryName
+
+        def install() -> str:
+            if endpoint in self.getInstalledQueries(force=True):
+                return queryName
+            res = self.gsql("USE GRAPH " + self.graphname + "\n" + queryText + "\n" +
+                "INSTALL QUERY " + queryName)
+            if endpoint not in self.getInstalledQueries(force=True):
+                raise TigerGraphException(res, None)
+            return queryName
+
+        return self._singleflight(("installQuery", queryName), install)
+
+    def _pagingQueryName(self, prefix: str, queryBody: str) -> str:
+        """Returns the name of a paging query, derived from the hash of its text.
+
+        Args:
+            prefix:
+                The prefix of the name, e.g. `iterVertices_Person`.
+            queryBody:
+                The text of the query following its name.
+        """
+        return prefix + "_" + hashlib.sha1(
+            (self.graphname + queryBody).encode("utf-8")).hexdigest()[:12]
+
     # TODO installQueries()
     #   POST /gsql/queries/install
     #   xref:tigergraph-server:API:built-in-endpoints.adoc#_install_a_query[Install a query]
@@ -109,44 +169,50 @@ class pyTigerGraphQuery(pyTigerGraphUtils, pyTigerGraphSchema, pyTigerGraphGSQL)
         `VERTEX` and `SET<VERTEX>` (i.e. vertex primary ID types without vertex type specification)
         require special handling.
 
-        See xref:tigergraph-server:API:built-in-endpoints.adoc#_query_parameter_passing[Query parameter passing]
+        `SET<VERTEX>` parameters can be specified as a list of `(vertex_primary_id, vertex_type)`
+        tuples or, for multiple vertices of the same type, as a list of
+        `([vertex_primary_id1, vertex_primary_id2, ...], vertex_type)` tuples (the two forms can
+        be mixed).
 
-        TODO Accept this format for SET<VERTEX>:
-            "key": [([p_id1, p_id2, ...], "vtype"), ...]
-            I.e. multiple primary IDs of the same vertex type
+        See xref:tigergraph-server:API:built-in-endpoints.adoc#_query_parameter_passing[Query parameter passing]
         """
         logger.info("entry: _parseQueryParameters")
         if logger.level == logging.DEBUG:
             logger.debug("params: " + self._locals(locals()))
 
-        ret = ""
+        parts = []
         for k, v in params.items():
             if isinstance(v, tuple):
                 if len(v) == 2 and isinstance(v[1], str):
-                    ret += k + "=" + str(v[0]) + "&" + k + ".type=" + self._safeChar(v[1]) + "&"
+                    parts.append(k + "=" + str(v[0]))
+                    parts.append(k + ".type=" + self._safeChar(v[1]))
                 else:
                     raise TigerGraphException(
                         "Invalid parameter value: (vertex_primary_id, vertex_type)"
                         " was expected.")
-            elif isinstance(v, list):
+            elif isinstance(v, (list, set, frozenset)):
                 i = 0
                 for vv in v:
                     if isinstance(vv, tuple):
                         if len(vv) == 2 and isinstance(vv[1], str):
-                            ret += k + "[" + str(i) + "]=" + self._safeChar(vv[0]) + "&" + \
-                                   k + "[" + str(i) + "].type=" + vv[1] + "&"
+                            ids = vv[0] if isinstance(vv[0], (list, set, frozenset)) else [vv[0]]
+                            for vid in ids:
+                                key = k + "[" + str(i) + "]"
+                                parts.append(key + "=" + self._safeChar(vid))
+                                parts.append(key + ".type=" + vv[1])
+                                i += 1
                         else:
                             raise TigerGraphException(
                                 "Invalid parameter value: (vertex_primary_id , vertex_type)"
                                 " was expected.")
                     else:
-                        ret += k + "=" + self._safeChar(vv) + "&"
-                    i += 1
+                        parts.append(k + "=" + self._safeChar(vv))
+                        i += 1
             elif isinstance(v, datetime):
-                ret += k + "=" + self._safeChar(v.strftime("%Y-%m-%d %H:%M:%S")) + "&"
+                parts.append(k + "=" + self._safeChar(v.strftime("%Y-%m-%d %H:%M:%S")))
             else:
-                ret += k + "=" + self._safeChar(v) + "&"
-        ret = ret[:-1]
+                parts.append(k + "=" + self._safeChar(v))
+        ret = "&".join(parts)
 
         if logger.level == logging.DEBUG:
             logger.debug("return: " + str(ret))
@@ -154,9 +220,52 @@ class pyTigerGraphQuery(pyTigerGraphUtils, pyTigerGraphSchema, pyTigerGraphGSQL)
 
         return ret
 
+    def _queryParametersToJson(self, params: dict) -> dict:
+        """Converts a dictionary of query parameters to the JSON format of POST requests.
+
+        Accepts the same parameter formats as `_parseQueryParameters()`: `(vertex_primary_id,
+        vertex_type)` tuples are converted to `{"id": ..., "type": ...}` objects, sets to lists and
+        `datetime` values to strings.
+
+        See xref:tigergraph-server:API:built-in-endpoints.adoc#_query_parameter_passing[Query parameter passing]
+        """
+        def vertex(v: tuple) -> dict:
+            if len(v) == 2 and isinstance(v[1], str):
+                return {"id": v[0], "type": v[1]}
+            raise TigerGraphException(
+                "Invalid parameter value: (vertex_primary_id, vertex_type) was expected.")
+
+        def convert(v):
+            if isinstance(v, datetime):
+                return v.strftime("%Y-%m-%d %H:%M:%S")
+            return v
+
+        ret = {}
+        for k, v in params.items():
+            if isinstance(v, tuple):
+                ret[k] = vertex(v)
+            elif isinstance(v, (list, set, frozenset)):
+                vals = []
+                for vv in v:
+                    if isinstance(vv, tuple):
+                        vv = vertex(vv)
+                        if isinstance(vv["id"], (list, set, frozenset)):
+                            vals.extend({"id": vid, "type": vv["type"]} for vid in vv["id"])
+                        else:
+                            vals.append(vv)
+                    else:
+                        vals.append(convert(vv))
+                ret[k] = vals
+            else:
+                ret[k] = convert(v)
+
+        return ret
+
     def runInstalledQuery(self, queryName: str, params: Union[str, dict] = None,
             timeout: int = None, sizeLimit: int = None, usePost: bool = False, runAsync: bool = False,
-            replica: int = None, threadLimit: int = None, memoryLimit: int = None) -> list:
+            replica: int = None, threadLimit: int = None, memoryLimit: int = None,
+            cache: bool = None, cacheTTL: float = None, cacheTags: list = None,
+            coalesce: bool = None) -> list:
         """Runs an installed query.
 
         The query must be already created and installed in the graph.
@@ -176,8 +285,9 @@ class pyTigerGraphQuery(pyTigerGraphUtils, pyTigerGraphSchema, pyTigerGraphGSQL)
                 Maximum size of response (in bytes).
                 See xref:tigergraph-server:API:index.adoc#_response_size[Response size]
             usePost:
-                Defaults to False. The RESTPP accepts a maximum URL length of 8192 characters. Use POST if additional parameters cause
-                you to exceed this limit, or if you choose to pass an empty set into a query for database versions >= 3.8
+                Defaults to False. The RESTPP accepts a maximum URL length of 8192 characters. If the parameters (specified as a
+                dictionary) would exceed this limit, POST is used automatically. Use POST if you choose to pass an empty set into
+                a query for database versions >= 3.8
             runAsync:
                 Run the query in asynchronous mode. 
                 See xref:gsql-ref:querying:query-operations#_detached_mode_async_option[Async operation]
@@ -192,6 +302,19 @@ class pyTigerGraphQuery(pyTigerGraphUtils, pyTigerGraphSchema, pyTigerGraphGSQL)
                 Specify a limit to the amount of memory consumed by the query (in MB). If the limit is exceeded, the query will abort automatically.
                 Supported in database versions >= 3.8.
                 See xref:tigergraph-server:system-management:memory-management#_by_http_header[Memory limit]
+            cache:
+                Whether to use the query result cache (see `enableQueryCache()`). If not specified,
+                the results are cached if a TTL is configured for the query in the cache.
+                Asynchronous runs are never cached.
+            cacheTTL:
+                The time to live of the cached result in seconds, overriding the TTL configured in
+                the cache.
+            cacheTags:
+                Tags of the cached result, to be used with `invalidateQueryCache()`.
+            coalesce:
+                Whether identical calls running at the same time (e.g. in multiple threads) should
+                share a single request and its result. Only use it for read-only queries. If not
+                specified, the calls of queries whose results are cached are coalesced.
 
         Returns:
             The output of the query, a list of output elements (vertex sets, edge sets, variables,
@@ -223,6 +346,19 @@ class pyTigerGraphQuery(pyTigerGraphUtils, pyTigerGraphSchema, pyTigerGraphGSQL)
         if logger.level == logging.DEBUG:
             logger.debug("params: " + self._locals(locals()))
 
+        cacheKey = None
+        if self.queryCache and not runAsync and (cache or (cache is None
+                and queryName in self.queryCache.queryTTLs)):
+            cacheKey = self.queryCache.makeKey(self.graphname, queryName, params,
+                self._queryCacheScope())
+            ret = self.queryCache.get(cacheKey)
+            if ret is not None:
+                if logger.level == logging.DEBUG:
+                    logger.debug("return: " + str(ret))
+                logger.info("exit: runInstalledQuery (cached)")
+
+                return ret
+
         headers = {}
         res_key = "results"
         if timeout and timeout > 0:
@@ -239,26 +375,270 @@ class pyTigerGraphQuery(pyTigerGraphUtils, pyTigerGraphSchema, pyTigerGraphGSQL)
         if memoryLimit:
             headers["GSQL-QueryLocalMemLimitMB"] = str(memoryLimit)
 
+        url = self.restppUrl + "/query/" + self.graphname + "/" + queryName
+        flightKey = None
+        if not runAsync and (coalesce or (coalesce is None and cacheKey)):
+            flightKey = ("runInstalledQuery", cacheKey or QueryResultCache.makeKey(self.graphname,
+                queryName, params), tuple(sorted(headers.items())))
+        if not usePost and isinstance(params, dict):
+            encoded = self._parseQueryParameters(params)
+            if len(url) + 1 + len(encoded) > MAX_URL_LENGTH:
+                logger.info("Query parameters exceed the maximum URL length, using POST")
+                usePost = True
+            else:
+                params = encoded
         if usePost:
-            ret = self._post(self.restppUrl + "/query/" + self.graphname + "/" + queryName,
-                data=params, headers=headers, resKey=res_key, jsonData=True)
+            if isinstance(params, dict):
+                params = self._queryParametersToJson(params)
 
-            if logger.level == logging.DEBUG:
-                logger.debug("return: " + str(ret))
-            logger.info("exit: runInstalledQuery (POST)")
+            def run() -> list:
+                return self._post(url, data=params, headers=headers, resKey=res_key, jsonData=True)
+        else:
+            def run() -> list:
+                return self._get(url, params=params, headers=headers, resKey=res_key)
 
-            return ret
+        if flightKey:
+            ret = self._singleflight(flightKey, run)
         else:
-            if isinstance(params, dict):
-                params = self._parseQueryParameters(params)
-            ret = self._get(self.restppUrl + "/query/" + self.graphname + "/" + queryName,
-                params=params, headers=headers, resKey=res_key)
+            ret = run()
+        if cacheKey:
+            self.queryCache.put(cacheKey, queryName, ret, cacheTTL, cacheTags)
 
-            if logger.level == logging.DEBUG:
-                logger.debug("return: " + str(ret))
+        if logger.level == logging.DEBUG:
+            logger.debug("return: " + str(ret))
+        if usePost:
+            logger.info("exit: runInstalledQuery (POST)")
+        else:
             logger.info("exit: runInstalledQuery (GET)")
 
-            return ret
+        return ret
+
+    def runInstalledQueryAsync(self, queryName: str, params: Union[str, dict] = None,
+            timeout: int = None, sizeLimit: int = None, usePost: bool = False,
+            replica: int = None, threadLimit: int = None, memoryLimit: int = None) -> QueryJob:
+        """Runs an installed query in detached mode and returns its future.
+
+        The status of all queries started this way is polled in a single background thread (see
+        `getQueryJobManager()`). The returned future can be waited for, used with
+        `concurrent.futures.as_completed()` or `add_done_callback()`, and cancelled (which aborts
+        the query).
+
+        Args:
+            See `runInstalledQuery()`.
+
+        Returns:
+            A `QueryJob` future, resolving to the output of the query (see `getQueryResult()`).
+
+        Endpoints:
+            - `GET /query/{graph_name}/{query_name}`
+                See xref:tigergraph-server:API:built-in-endpoints.adoc#_run_an_installed_query_get[Run an installed query (GET)]
+            - `POST /query/{graph_name}/{query_name}`
+                See xref:tigergraph-server:API:built-in-endpoints.adoc#_run_an_installed_query_post[Run an installed query (POST)]
+            - `GET /query_status/{graph_name}`
+                See xref:tigergraph-server:API:built-in-endpoints.adoc#_check_query_status_detached_mode[Check query status (detached mode)]
+        """
+        logger.info("entry: runInstalledQueryAsync")
+        if logger.level == logging.DEBUG:
+            logger.debug("params: " + self._locals(locals()))
+
+        requestId = self.runInstalledQuery(queryName, params, timeout=timeout, sizeLimit=sizeLimit,
+            usePost=usePost, runAsync=True, replica=replica, threadLimit=threadLimit,
+            memoryLimit=memoryLimit)
+        ret = self.getQueryJobManager().track(requestId)
+
+        logger.info("exit: runInstalledQueryAsync")
+
+        return ret
+
+    def getQueryJobManager(self) -> QueryJobManager:
+        """Returns the job manager tracking the queries running in detached mode.
+
+        Use its `track()` method to get the future of a query started with
+        `runInstalledQuery(runAsync=True)`.
+
+        Returns:
+            The query job manager of the connection.
+        """
+        if self.queryJobManager is None:
+            self.queryJobManager = QueryJobManager(self)
+
+        return self.queryJobManager
+
+    def runInstalledQueryBatch(self, queryName: str, paramsList: list, concurrency: int = 4,
+            retries: int = 0, retryDelay: float = 1.0, asCompleted: bool = False,
+            raiseErrors: bool = False, timeout: int = None, sizeLimit: int = None,
+            usePost: bool = False, replica: int = None, threadLimit: int = None,
+            memoryLimit: int = None) -> Union[list, Iterator[tuple]]:
+        """Runs an installed query once for each set of parameters, in parallel.
+
+        At most `concurrency` queries are running at the same time, so that REST++ is not
+        overloaded. Failed runs caused by connection errors, timeouts or server side (5xx or 429)
+        HTTP errors are retried.
+
+        Args:
+            queryName:
+                The name of the query to be executed.
+            paramsList:
+                The list of query parameters, each in a format accepted by `runInstalledQuery()`.
+            concurrency:
+                The maximum number of queries running at the same time.
+            retries:
+                The number of times a failed run is retried.
+            retryDelay:
+                The delay before the first retry in seconds; doubled at each subsequent retry.
+            asCompleted:
+                If `True`, returns a generator yielding the results as soon as they are available.
+            raiseErrors:
+                If `True`, the first error (after retries) is raised. Otherwise, the exception is
+                returned in place of the result of the failed run.
+            timeout, sizeLimit, usePost, replica, threadLimit, memoryLimit:
+                See `runInstalledQuery()`.
+
+        Returns:
+            - If `asCompleted` is `False`: the list of the outputs of the query runs (or the
+                exceptions of the failed runs), in the order of `paramsList`.
+            - If `asCompleted` is `True`: a generator of `(index, output)` tuples in the order of
+                completion, where `index` is the position of the parameters in `paramsList`.
+
+        Endpoints:
+            - `GET /query/{graph_name}/{query_name}`
+                See xref:tigergraph-server:API:built-in-endpoints.adoc#_run_an_installed_query_get[Run an installed query (GET)]
+            - `POST /query/{graph_name}/{query_name}`
+                See xref:tigergraph-server:API:built-in-endpoints.adoc#_run_an_installed_query_post[Run an installed query (POST)]
+        """
+        logger.info("entry: runInstalledQueryBatch")
+        if logger.level == logging.DEBUG:
+            logger.debug("params: " + self._locals(locals()))
+
+        def isTransient(e: Exception) -> bool:
+            if isinstance(e, (requests.exceptions.ConnectionError, requests.exceptions.Timeout)):
+                return True
+            if isinstance(e, requests.exceptions.HTTPError) and e.response is not None:
+                return e.response.status_code >= 500 or e.response.status_code == 429
+            return False
+
+        def run(params: Union[str, dict]) -> Union[list, Exception]:
+            for attempt in range(retries + 1):
+                try:
+                    return self.runInstalledQuery(queryName, params, timeout=timeout,
+                        sizeLimit=sizeLimit, usePost=usePost, replica=replica,
+                        threadLimit=threadLimit, memoryLimit=memoryLimit)
+                except Exception as e:
+                    if attempt < retries and isTransient(e):
+                        logger.warning("Retrying " + queryName + " after error: " + str(e))
+                        time.sleep(retryDelay * 2 ** attempt)
+                        continue
+                    if raiseErrors:
+                        raise
+                    logger.error(queryName + " failed: " + str(e))
+                    return e
+
+        if asCompleted:
+            def results() -> Iterator[tuple]:
+                with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+                    futures = {executor.submit(run, p): i for i, p in enumerate(paramsList)}
+                    try:
+                        for f in as_completed(futures):
+                            yield futures[f], f.result()
+                    finally:
+                        for f in futures:
+                            f.cancel()
+
+            logger.info("exit: runInstalledQueryBatch (as completed)")
+
+            return results()
+
+        ret = self._runConcurrently(run, paramsList, concurrency)
+
+        if logger.level == logging.DEBUG:
+            logger.debug("return: " + str(ret))
+        logger.info("exit: runInstalledQueryBatch")
+
+        return ret
+
+    def _queryCacheScope(self) -> str:
+        """Returns the scope of the cached query results of this connection.
+
+        Results depend on the server and, through the permissions, on the user, so both are part
+        of the cache keys. The credentials are hashed, so that they are not stored in the cache.
+        """
+        return self.restppUrl + "|" + hashlib.sha1(
+            self.base64_credential.encode("utf-8")).hexdigest()[:16]
+
+    def enableQueryCache(self, maxSize: int = 1024, ttl: float = None, queryTTLs: dict = None,
+            path: str = None) -> QueryResultCache:
+        """Enables the client-side cache of installed query results.
+
+        Once enabled, `runInstalledQuery()` returns the cached result of a previous call with the
+        same query name and parameters, instead of running the query again. The results of a query
+        are cached if it has a TTL in `queryTTLs`, or if `cache=True` is passed to
+        `runInstalledQuery()`.
+
+        Only cache the results of read-only queries. The cache is cleared when queries are
+        installed or dropped, or the schema is changed, through this connection; data changes must
+        be handled with `invalidateQueryCache()` (or TTLs).
+
+        Args:
+            maxSize:
+                The maximum number of results kept in memory (least recently used results are
+                evicted first).
+            ttl:
+                The default time to live of the results in seconds. `None` means no expiry.
+            queryTTLs:
+                Time to live of the results of specific queries, as `query_name: seconds` pairs.
+            path:
+                The path of an SQLite database file, used as a second tier of the cache. It can be
+                shared by multiple processes (and connections) on the same host; the results are
+                kept apart by server and user.
+
+        Returns:
+            The cache object.
+        """
+        logger.info("entry: enableQueryCache")
+        if logger.level == logging.DEBUG:
+            logger.debug("params: " + self._locals(locals()))
+
+        if self.queryCache:
+            self.queryCache.close()
+        self.queryCache = QueryResultCache(maxSize, ttl, queryTTLs, path)
+
+        logger.info("exit: enableQueryCache")
+
+        return self.queryCache
+
+    def disableQueryCache(self) -> None:
+        """Disables the client-side cache of installed query results.
+
+        The on-disk tier (if any) is kept, so that it can be reused later.
+        """
+        logger.info("entry: disableQueryCache")
+
+        if self.queryCache:
+            self.queryCache.close()
+        self.queryCache = None
+
+        logger.info("exit: disableQueryCache")
+
+    def invalidateQueryCache(self, queryName: str = None, tags: list = None) -> None:
+        """Removes results from the client-side cache of installed query results.
+
+        Args:
+            queryName:
+                Remove the results of this query.
+            tags:
+                Remove the results with any of these tags (see `cacheTags` in
+                `runInstalledQuery()`).
+
+            If neither is specified, all results are removed.
+        """
+        logger.info("entry: invalidateQueryCache")
+        if logger.level == logging.DEBUG:
+            logger.debug("params: " + self._locals(locals()))
+
+        if self.queryCache:
+            self.queryCache.invalidate(queryName, tags)
+
+        logger.info("exit: invalidateQueryCache")
 
     def checkQueryStatus(self, requestId: str = ""):
         """Checks the status of the queries running on the graph specified in the connection.
@@ -328,6 +708,8 @@ class pyTigerGraphQuery(pyTigerGraphUtils, pyTigerGraphSchema, pyTigerGraphGSQL)
             - For `SET<VERTEX>` (no vertex type specified) use
                 `"key": [(primary_id1, "vertex_type1"), (primary_id2, "vertex_type2"), ...]`
 
+            If enabled with `enableQueryPromotion()`, a query text that is run repeatedly is
+            installed and then run as an installed query.
 
         Endpoint:
             - `POST /gsqlserver/interpreted_query`
@@ -342,11 +724,18 @@ class pyTigerGraphQuery(pyTigerGraphUtils, pyTigerGraphSchema, pyTigerGraphGSQL)
 
         queryText = queryText.replace("$graphname", self.graphname)
         queryText = queryText.replace("@graphname@", self.graphname)
-        if isinstance(params, dict):
-            params = self._parseQueryParameters(params)
 
-        ret = self._post(self.gsUrl + "/gsqlserver/interpreted_query", data=queryText,
-            params=params, authMode="pwd")
+        queryName = None
+        if self.queryPromotionThreshold is not None:
+            queryName = self._promoteInterpretedQuery(queryText)
+        if queryName:
+            ret = self.runInstalledQuery(queryName, params)
+        else:
+            if isinstance(params, dict):
+                params = self._parseQueryParameters(params)
+
+            ret = self._post(self.gsUrl + "/gsqlserver/interpreted_query", data=queryText,
+                params=params, authMode="pwd")
 
         if logger.level == logging.DEBUG:
             logger.debug("return: " + str(ret))
@@ -354,6 +743,94 @@ class pyTigerGraphQuery(pyTigerGraphUtils, pyTigerGraphSchema, pyTigerGraphGSQL)
 
         return ret
 
+    def _promoteInterpretedQuery(self, queryText: str) -> Union[str, None]:
+        """Returns the name of the installed query promoted from an interpreted query.
+
+        The name is derived from the hash of the query text. The query is installed once the text
+        has been run `queryPromotionThreshold` times (unless it is already installed, e.g. by
+        another process).
+
+        Args:
+            queryText:
+                The text of the interpreted query (with the graph name already substituted).
+
+        Returns:
+            The name of the installed query, or `None` if the query is to be interpreted.
+        """
+        m = INTERPRET_QUERY.match(queryText)
+        if not m:
+            return None
+        queryName = "interpreted_" + hashlib.sha1(queryText.encode("utf-8")).hexdigest()[:16]
+        if queryName in self._promotionFailed:
+            return None
+        endpoint = "GET /query/" + self.graphname + "/" + queryName
+        if endpoint in self.getInstalledQueries():
+            return queryName
+        with self._metadataLock:
+            runs = self._interpretedRuns.get(queryName, 0) + 1
+            if runs < self.queryPromotionThreshold:
+                # Only the most recently run texts are counted
+                self._interpretedRuns[queryName] = runs
+                self._interpretedRuns.move_to_end(queryName)
+                if len(self._interpretedRuns) > MAX_COUNTED_INTERPRETED_QUERIES:
+                    self._interpretedRuns.popitem(last=False)
+                return None
+            self._interpretedRuns.pop(queryName, None)
+
+        try:
+            return self._installQueryOnce(queryName,
+                "CREATE QUERY " + queryName + queryText[m.end():])
+        except Exception as e:
+            logger.warning("Failed to install interpreted query as " + queryName + ": " + str(e))
+            with self._metadataLock:
+                self._promotionFailed.add(queryName)
+            return None
+
+    def enableQueryPromotion(self, threshold: int = 3) -> None:
+        """Enables the promotion of repeatedly run interpreted queries to installed queries.
+
+        Once the same interpreted query text has been run `threshold` times through this
+        connection, `runInterpretedQuery()` installs it under a name derived from the hash of the
+        text (`interpreted_<hash>`), and runs the installed query from then on, instead of
+        compiling the query text at every call. If a query of the derived name is already
+        installed (e.g. promoted by another process or in an earlier session), it is used right
+        away; the list of installed queries is cached (see `getInstalledQueries()`). Runs are
+        counted for the `MAX_COUNTED_INTERPRETED_QUERIES` most recently run query texts.
+
+        Installing a query takes time (up to minutes), so only enable this if the same queries are
+        run many times. Promoted queries are not dropped automatically. If a query cannot be
+        installed, it remains interpreted.
+
+        Args:
+            threshold:
+                The number of runs of an interpreted query text after which it is installed.
+        """
+        logger.info("entry: enableQueryPromotion")
+        if logger.level == logging.DEBUG:
+            logger.debug("params: " + self._locals(locals()))
+
+        if not threshold or threshold < 1:
+            raise TigerGraphException("threshold must be a positive integer.", None)
+        self.queryPromotionThreshold = threshold
+
+        logger.info("exit: enableQueryPromotion")
+
+    def disableQueryPromotion(self) -> None:
+        """Disables the promotion of interpreted queries to installed queries.
+
+        Interpreted queries are run as interpreted queries again; queries that have already been
+        promoted remain installed. The run counts and the record of failed installations are
+        reset.
+        """
+        logger.info("entry: disableQueryPromotion")
+
+        self.queryPromotionThreshold = None
+        with self._metadataLock:
+            self._interpretedRuns.clear()
+            self._promotionFailed.clear()
+
+        logger.info("exit: disableQueryPromotion")
+
     def getRunningQueries(self) -> dict:
         """Reports the statistics of currently running queries on the graph.
         """
@@ -391,7 +868,8 @@ class pyTigerGraphQuery(pyTigerGraphUtils, pyTigerGraphSchema, pyTigerGraphGSQL)
         else:
             raise TigerGraphException(res["message"], res["code"])
 
-    def parseQueryOutput(self, output: list, graphOnly: bool = True) -> dict:
+    def parseQueryOutput(self, output: list, graphOnly: bool = True,
+            trackOccurrences: bool = True, fmt: str = "py") -> dict:
         """Parses query output and separates vertex and edge data (and optionally other output) for
             easier use.
 
@@ -401,11 +879,21 @@ class pyTigerGraphQuery(pyTigerGraphUtils, pyTigerGraphSchema, pyTigerGraphGSQL)
             graphOnly:
                 If `True` (the default setting), restricts captured output to vertices and edges.
                 If `False`, captures values of variables and accumulators and any other plain text printed.
+            trackOccurrences:
+                If `True` (the default setting), counts and lists the occurrences of each vertex and
+                edge (in the `x_occurrences` and `x_sources` keys or columns, see below). Set it to
+                `False` to speed up the parsing of large outputs.
+            fmt:
+                Format of the vertex and edge data:
+                - "py":    Python dictionaries of the vertices/edges (the default setting)
+                - "df":    pandas DataFrames, one per vertex/edge type
+                - "arrow": Arrow tables, one per vertex/edge type
 
         Returns:
             A dictionary with two (or three) keys: `"vertices"`, `"edges"` and optionally `"output"`.
             The first two refer to another dictionary containing keys for each vertex and edge types
-            found and the instances of those vertex and edge types. `"output"` is a list of
+            found and the instances of those vertex and edge types (as a dictionary keyed by
+            vertex ID or edge ID, or as a DataFrame or Arrow table). `"output"` is a list of
             dictionaries containing the key/value pairs of any other output.
 
         The JSON output from a query can contain a mixture of results: vertex sets (the output of a
@@ -418,49 +906,31 @@ class pyTigerGraphQuery(pyTigerGraphUtils, pyTigerGraphSchema, pyTigerGraphGSQL)
         The output of this function can be used e.g. with the `vertexSetToDataFrame()` and
             `edgeSetToDataFrame()` functions or (after some transformation) to pass a subgraph to a
             visualization component.
-        """
-
-        def attCopy(src: dict, trg: dict):
-            """Copies the attributes of a vertex or edge into another vertex or edge, respectively.
-
-            args:
-                src:
-                    Source vertex or edge instance.
-                trg:
-                    Target vertex or edge instance.
-            """
-            srca = src["attributes"]
-            trga = trg["attributes"]
-            for att in srca:
-                trga[att] = srca[att]
-
-        def addOccurrences(obj: dict, src: str):
-            """Counts and lists the occurrences of a vertex or edge.
-
-            Args:
-                obj:
-                    The vertex or edge that was found in the output.
-                src:
-                    The label (variable name or alias) of the source where the vertex or edge
-                    was found.
-
-            A given vertex or edge can appear multiple times (in different vertex or edge sets) in
-            the output of a query. Each output has a label (either the variable name or an alias
-            used in the `PRINT` statement), `x_sources` contains a list of these labels.
-            """
-            if "x_occurrences" in obj:
-                obj["x_occurrences"] += 1
-            else:
-                obj["x_occurrences"] = 1
-            if "x_sources" in obj:
-                obj["x_sources"].append(src)
-            else:
-                obj["x_sources"] = [src]
 
+        A given vertex or edge can appear multiple times (in different vertex or edge sets) in the
+            output of a query; its attributes are merged. Each output has a label (either the
+            variable name or an alias used in the `PRINT` statement); `x_sources` contains the list
+            of these labels, `x_occurrences` the number of occurrences.
+        """
         logger.info("entry: parseQueryOutput")
         if logger.level == logging.DEBUG:
             logger.debug("params: " + self._locals(locals()))
 
+        if fmt == "df":
+            try:
+                import pandas  # noqa: F401
+            except ImportError:
+                raise ImportError("Pandas is required to use this function. "
+                    "Download pandas using 'pip install pandas'.")
+        elif fmt == "arrow":
+            try:
+                import pyarrow as pa
+            except ImportError:
+                raise ImportError("PyArrow is required to use this function. "
+                    "Download pyarrow using 'pip install pyarrow'.")
+        elif fmt != "py":
+            raise TigerGraphException("Unsupported output format: `" + str(fmt) + "`.", None)
+
         vs = {}
         es = {}
         ou = []
@@ -469,79 +939,69 @@ class pyTigerGraphQuery(pyTigerGraphUtils, pyTigerGraphSchema, pyTigerGraphGSQL)
         for o1 in output:
             # Next level data type is dictionary that could be vertex sets, edge sets or generic
             # output (of simple or complex data types)
-            for o2 in o1:
-                _o2 = o1[o2]
+            for label, value in o1.items():
                 # Is it an array of dictionaries?
-                if isinstance(_o2, list) and len(_o2) > 0 and isinstance(_o2[0], dict):
-                    # Iterate through the array
-                    for o3 in _o2:
-                        if "v_type" in o3:  # It's a vertex!
-
-                            # Handle vertex type first
-                            vType = o3["v_type"]
-                            vtm = {}
-                            # Do we have this type of vertices in our list
-                            # (which is actually a dictionary)?
-                            if vType in vs:
-                                vtm = vs[vType]
-                            # No, let's create a dictionary for them and add to the list
-                            else:
-                                vtm = {}
-                                vs[vType] = vtm
-
-                            # Then handle the vertex itself
-                            vId = o3["v_id"]
-                            # Do we have this specific vertex (identified by the ID) in our list?
-                            if vId in vtm:
-                                tmp = vtm[vId]
-                                attCopy(o3, tmp)
-                                addOccurrences(tmp, o2)
-                            else:  # No, add it
-                                addOccurrences(o3, o2)
-                                vtm[vId] = o3
-
-                        elif "e_type" in o3:  # It's an edge!
-
-                            # Handle edge type first
-                            eType = o3["e_type"]
-                            etm = {}
-                            # Do we have this type of edges in our list
-                            # (which is actually a dictionary)?
-                            if eType in es:
-                                etm = es[eType]
-                            # No, let's create a dictionary for them and add to the list
-                            else:
-                                etm = {}
-                                es[eType] = etm
-
-                            # Then handle the edge itself
-                            eId = o3["from_type"] + "(" + o3["from_id"] + ")->" + o3["to_type"] + \
-                                  "(" + o3["to_id"] + ")"
-                            o3["e_id"] = eId
-
-                            # Add reverse edge name, if applicable
-                            if eType["IsDirected"]:
-                                config = eType["Config"]
-                                rev = ""
-                                if "REVERSE_EDGE" in config:
-                                    rev = config["REVERSE_EDGE"]
-                                if rev:
-                                    o3["reverse_edge"] = rev
-
-                            # Do we have this specific edge (identified by the composite ID) in our
-                            # list?
-                            if eId in etm:
-                                tmp = etm[eId]
-                                attCopy(o3, tmp)
-                                addOccurrences(tmp, o2)
-                            else:  # No, add it
-                                addOccurrences(o3, o2)
-                                etm[eId] = o3
-
-                        else:  # It's a ... something else
-                            ou.append({"label": o2, "value": _o2})
-                else:  # It's a ... something else
-                    ou.append({"label": o2, "value": _o2})
+                if not (isinstance(value, list) and value and isinstance(value[0], dict)):
+                    ou.append({"label": label, "value": value})
+                    continue
+                # Iterate through the array
+                for o3 in value:
+                    if "v_type" in o3:  # It's a vertex!
+                        vtm = vs.get(o3["v_type"])
+                        if vtm is None:
+                            vtm = vs[o3["v_type"]] = {}
+                        key = o3["v_id"]
+                    elif "e_type" in o3:  # It's an edge!
+                        vtm = es.get(o3["e_type"])
+                        if vtm is None:
+                            vtm = es[o3["e_type"]] = {}
+                        key = (o3["from_type"], o3["from_id"], o3["to_type"], o3["to_id"])
+                    else:  # It's a ... something else
+                        ou.append({"label": label, "value": value})
+                        continue
+
+                    # Do we have this specific vertex or edge in our list?
+                    tmp = vtm.get(key)
+                    if tmp is None:  # No, add it
+                        vtm[key] = tmp = o3
+                        if trackOccurrences:
+                            tmp["x_occurrences"] = 0
+                            tmp["x_sources"] = []
+                    elif "attributes" in o3:
+                        tmp.setdefault("attributes", {}).update(o3["attributes"])
+                    if trackOccurrences:
+                        tmp["x_occurrences"] += 1
+                        tmp["x_sources"].append(label)
+
+        xKeys = ["x_occurrences", "x_sources"] if trackOccurrences else []
+
+        def convert(elements: dict, idKeys: list):
+            elementSet = list(elements.values())
+            if fmt == "df":
+                return self._elementSetToDataFrame(elementSet, idKeys + xKeys)
+            idCols, attrCols = self._elementSetToColumns(elementSet, idKeys + xKeys)
+            cols = dict(zip(idKeys + xKeys, idCols))
+            cols.update(attrCols)
+            return pa.table(cols)
+
+        if fmt == "py":
+            reverseEdges = self._getSchemaIndex()["reverseEdges"] if es else {}
+            for eType, etm in es.items():
+                # Add reverse edge name, if applicable
+                rev = reverseEdges.get(eType)
+                edges = {}
+                for e in etm.values():
+                    eId = e["from_type"] + "(" + e["from_id"] + ")->" + e["to_type"] + "(" + \
+                        e["to_id"] + ")"
+                    e["e_id"] = eId
+                    if rev:
+                        e["reverse_edge"] = rev
+                    edges[eId] = e
+                es[eType] = edges
+        else:
+            vs = {vType: convert(vtm, ["v_id"]) for vType, vtm in vs.items()}
+            es = {eType: convert(etm, ["from_type", "from_id", "to_type", "to_id"])
+                for eType, etm in es.items()}
 
         ret = {"vertices": vs, "edges": es}
         if not graphOnly:
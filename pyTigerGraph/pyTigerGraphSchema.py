@@ -53,6 +53,104 @@ class pyTigerGraphSchema(pyTigerGraphBase):
 
         return ret
 
+    def _getAttrDtypes(self, attributes: list) -> dict:
+        """Returns the compact pandas dtypes of the scalar attributes of a vertex or edge type.
+
+        Args:
+            attributes:
+                The `Attributes` list of a vertex or edge type in the schema metadata.
+
+        Returns:
+            A dictionary of `attribute_name: dtype` pairs. `"integer"` and `"unsigned"` denote
+            integer columns to be downcast to the smallest type that fits the actual values.
+            Attributes of other (e.g. container or DATETIME) types are not included.
+        """
+        dtypes = {}
+        for attr in attributes:
+            attrType = attr["AttributeType"]["Name"]
+            if attrType == "INT":
+                dtypes[attr["AttributeName"]] = "integer"
+            elif attrType == "UINT":
+                dtypes[attr["AttributeName"]] = "unsigned"
+            elif attrType == "FLOAT":
+                dtypes[attr["AttributeName"]] = "float32"
+            elif attrType == "DOUBLE":
+                dtypes[attr["AttributeName"]] = "float64"
+            elif attrType == "BOOL":
+                dtypes[attr["AttributeName"]] = "bool"
+            elif attrType == "STRING":
+                dtypes[attr["AttributeName"]] = "category"
+
+        return dtypes
+
+    def _elementSetToColumns(self, elementSet: list, idKeys: list) -> tuple:
+        """Collects the columns of a vertex or edge set in a single pass.
+
+        Args:
+            elementSet:
+                A vertex or edge set, as returned by queries.
+            idKeys:
+                The (non-attribute) keys of the set elements to be collected, e.g.
+                `["v_id", "v_type"]`.
+
+        Returns:
+            A tuple of the list of ID columns (in the order of `idKeys`) and the dictionary of
+            `attribute_name: column` pairs. Missing values are `None`.
+        """
+        n = len(elementSet)
+        idCols = [[None] * n for _ in idKeys]
+        attrCols = {}
+        for i, e in enumerate(elementSet):
+            for k, col in zip(idKeys, idCols):
+                col[i] = e.get(k)
+            for k, v in e.get("attributes", {}).items():
+                col = attrCols.get(k)
+                if col is None:
+                    col = attrCols[k] = [None] * n
+                col[i] = v
+
+        return idCols, attrCols
+
+    def _elementSetToDataFrame(self, elementSet: list, idKeys: list,
+            dtypes: dict = None) -> 'pd.DataFrame':
+        """Converts a vertex or edge set to pandas DataFrame in a single pass.
+
+        The columns are collected directly from the set (instead of materialising intermediate
+        dataframes), then the optional dtypes are applied.
+
+        Args:
+            elementSet:
+                A vertex or edge set, as returned by queries.
+            idKeys:
+                The (non-attribute) keys of the set elements to be included as the first columns,
+                e.g. `["v_id", "v_type"]`.
+            dtypes:
+                A dictionary of `attribute_name: dtype` pairs, as returned by `_getAttrDtypes()`.
+
+        Returns:
+            A pandas DataFrame with the ID columns followed by the attribute columns.
+        """
+        import pandas as pd
+
+        idCols, attrCols = self._elementSetToColumns(elementSet, idKeys)
+        ret = pd.DataFrame(attrCols)
+        if dtypes:
+            for k, dtype in dtypes.items():
+                if k not in ret.columns:
+                    continue
+                col = ret[k]
+                if dtype in ("integer", "unsigned"):
+                    ret[k] = pd.to_numeric(col, downcast=dtype)
+                elif dtype == "bool":
+                    if not col.isna().any():
+                        ret[k] = col.astype(dtype)
+                else:
+                    ret[k] = col.astype(dtype)
+        for i, (k, col) in enumerate(zip(idKeys, idCols)):
+            ret.insert(i, k, col, allow_duplicates=True)
+
+        return ret
+
     def _upsertAttrs(self, attributes: dict) -> dict:
         """Transforms attributes (provided as a table) into a hierarchy as expected by the upsert
             functions.
@@ -104,7 +202,8 @@ class pyTigerGraphSchema(pyTigerGraphBase):
                 If `True`, the output includes User-Defined Types in the schema details.
             force:
                 If `True`, retrieves the schema metadata again, otherwise returns a cached copy of
-                the schema metadata (if they were already fetched previously).
+                the schema metadata (if they were already fetched previously and have not expired;
+                see `metadataCacheTTL`).
 
         Returns:
             The schema metadata.
@@ -117,11 +216,12 @@ class pyTigerGraphSchema(pyTigerGraphBase):
         if logger.level == logging.DEBUG:
             logger.debug("params: " + self._locals(locals()))
 
-        if not self.schema or force:
-            self.schema = self._get(self.gsUrl + "/gsqlserver/gsql/schema?graph=" + self.graphname,
-                authMode="pwd")
-        if udts and ("UDTs" not in self.schema or force):
-            self.schema["UDTs"] = self._getUDTs()
+        schema = self._getCachedMetadata("schema", self.graphname,
+            lambda: self._get(self.gsUrl + "/gsqlserver/gsql/schema?graph=" + self.graphname,
+                authMode="pwd"), force)
+        if udts and ("UDTs" not in schema or force):
+            schema["UDTs"] = self._getCachedMetadata("udts", self.graphname, self._getUDTs, force)
+        self.schema = schema
 
         if logger.level == logging.DEBUG:
             logger.debug("return: " + str(self.schema))
@@ -129,6 +229,75 @@ class pyTigerGraphSchema(pyTigerGraphBase):
 
         return self.schema
 
+    def _getSchemaIndex(self, force: bool = False) -> dict:
+        """Returns the lookup tables built from the (cached) schema metadata.
+
+        The tables are rebuilt only when the schema metadata is retrieved again.
+
+        Args:
+            force:
+                If `True`, retrieves the schema metadata again.
+
+        Returns:
+            A dictionary of lookup tables, each keyed by vertex or edge type name:
+            - "vertexTypes", "edgeTypes": the metadata of the type
+            - "vertexAttrs", "edgeAttrs": the list of (attribute_name, attribute_type) tuples
+            - "edgeSources", "edgeTargets": the source/target vertex type(s) of the edge type, see
+                `getEdgeSourceVertexType()`
+            - "edgePairs": the list of (source_vertex_type, target_vertex_type) tuples
+            - "reverseEdges": the name of the reverse edge type (if defined)
+        """
+        schema = self.getSchema(force=force)
+        index = self._schemaIndex
+        if index and index["schema"] is schema:
+            return index
+
+        index = {
+            "schema": schema,
+            "vertexTypes": {},
+            "edgeTypes": {},
+            "vertexAttrs": {},
+            "edgeAttrs": {},
+            "edgeSources": {},
+            "edgeTargets": {},
+            "edgePairs": {},
+            "reverseEdges": {}
+        }
+        for vt in schema["VertexTypes"]:
+            name = vt["Name"]
+            index["vertexTypes"][name] = vt
+            index["vertexAttrs"][name] = [(at["AttributeName"], self._getAttrType(at["AttributeType"]))
+                for at in vt["Attributes"]]
+        for et in schema["EdgeTypes"]:
+            name = et["Name"]
+            index["edgeTypes"][name] = et
+            index["edgeAttrs"][name] = [(at["AttributeName"], self._getAttrType(at["AttributeType"]))
+                for at in et["Attributes"]]
+            if "EdgePairs" in et:
+                # v3.0 and later notation
+                pairs = [(ep["From"], ep["To"]) for ep in et["EdgePairs"]]
+            else:
+                pairs = [(et["FromVertexTypeName"], et["ToVertexTypeName"])]
+            index["edgePairs"][name] = pairs
+            if et["FromVertexTypeName"] != "*":
+                index["edgeSources"][name] = et["FromVertexTypeName"]
+            elif "EdgePairs" in et:
+                index["edgeSources"][name] = {p[0] for p in pairs}
+            else:
+                # 2.6.1 and earlier notation
+                index["edgeSources"][name] = "*"
+            if et["ToVertexTypeName"] != "*":
+                index["edgeTargets"][name] = et["ToVertexTypeName"]
+            elif "EdgePairs" in et:
+                index["edgeTargets"][name] = {p[1] for p in pairs}
+            else:
+                index["edgeTargets"][name] = "*"
+            if et["IsDirected"] and "REVERSE_EDGE" in et.get("Config", {}):
+                index["reverseEdges"][name] = et["Config"]["REVERSE_EDGE"]
+        self._schemaIndex = index
+
+        return index
+
     def upsertData(self, data: Union[str, object], atomic: bool = False, ackAll: bool = False,
             newVertexOnly: bool = False, vertexMustExist: bool = False,
             updateVertexOnly: bool = False) -> dict:
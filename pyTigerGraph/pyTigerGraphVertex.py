@@ -6,9 +6,11 @@ All functions in this module are called as methods on a link:https://docs.tigerg
 """
 import json
 import logging
+import math
+import re
 import warnings
 
-from typing import TYPE_CHECKING, Union
+from typing import TYPE_CHECKING, Iterator, Union
 
 if TYPE_CHECKING:
     import pandas as pd
@@ -37,9 +39,7 @@ class pyTigerGraphVertex(pyTigerGraphUtils, pyTigerGraphSchema):
         if logger.level == logging.DEBUG:
             logger.debug("params: " + self._locals(locals()))
 
-        ret = []
-        for vt in self.getSchema(force=force)["VertexTypes"]:
-            ret.append(vt["Name"])
+        ret = list(self._getSchemaIndex(force)["vertexTypes"])
 
         if logger.level == logging.DEBUG:
             logger.debug("return: " + str(ret))
@@ -66,11 +66,7 @@ class pyTigerGraphVertex(pyTigerGraphUtils, pyTigerGraphSchema):
         if logger.level == logging.DEBUG:
             logger.debug("params: " + self._locals(locals()))
 
-        et = self.getVertexType(vertexType)
-        ret = []
-
-        for at in et["Attributes"]:
-            ret.append((at["AttributeName"], self._getAttrType(at["AttributeType"])))
+        ret = list(self._getSchemaIndex()["vertexAttrs"][vertexType])
 
         if logger.level == logging.DEBUG:
             logger.debug("return: " + str(ret))
@@ -95,36 +91,45 @@ class pyTigerGraphVertex(pyTigerGraphUtils, pyTigerGraphSchema):
         if logger.level == logging.DEBUG:
             logger.debug("params: " + self._locals(locals()))
 
-        for vt in self.getSchema(force=force)["VertexTypes"]:
-            if vt["Name"] == vertexType:
-                if logger.level == logging.DEBUG:
-                    logger.debug("return: " + str(vt))
-                logger.info("exit: getVertexType (found)")
+        vt = self._getSchemaIndex(force)["vertexTypes"].get(vertexType)
+        if vt:
+            if logger.level == logging.DEBUG:
+                logger.debug("return: " + str(vt))
+            logger.info("exit: getVertexType (found)")
 
-                return vt
+            return vt
 
         logger.warning("Vertex type `" + vertexType + "` was not found.")
         logger.info("exit: getVertexType (not found)")
 
         return {}  # Vertex type was not found
 
-    def getVertexCount(self, vertexType: Union[str, list] = "*", where: str = "", realtime: bool = False) -> Union[int, dict]:
+    def getVertexCount(self, vertexType: Union[str, list] = "*", where: Union[str, dict] = "",
+            realtime: bool = False, concurrency: int = 4) -> Union[int, dict]:
         """Returns the number of vertices of the specified type.
 
         Args:
             vertexType (Union[str, list], optional):
                 The name of the vertex type. If `vertexType` == "*", then count the instances of all 
                 vertex types (`where` cannot be specified in this case). Defaults to "*".
-            where (str, optional):
+            where (Union[str, dict], optional):
                 A comma separated list of conditions that are all applied on each vertex's
                 attributes. The conditions are in logical conjunction (i.e. they are "AND'ed"
-                together). Defaults to "".
+                together). If `vertexType` is a list, the conditions can also be specified per
+                vertex type, as a dictionary of `vertex_type: conditions` pairs (vertex types
+                without conditions are not filtered). Defaults to "".
             realtime (bool, optional):
                 Whether to get the most up-to-date number by force. When there are frequent updates happening, 
                 a slightly outdated number (up to 30 seconds delay) might be fetched. Set `realtime=True` to
                 force the system to recount the vertices, which will get a more up-to-date result but will
                 also take more time. This parameter only works with TigerGraph DB 3.6 and above.
-                Defaults to False.
+                Otherwise, if enabled by setting `metadataCacheTTL["vertexCount"]` (`0`, i.e.
+                disabled, by default), the counts are cached by the connection for up to that many
+                seconds (or until vertices are modified through this connection). Defaults to False.
+            concurrency (int, optional):
+                The maximum number of vertex types counted in parallel if `vertexType` is a list
+                and `where` is specified (each vertex type requires a separate request).
+                Defaults to 4.
 
         Returns:
             - A dictionary of <vertex_type>: <vertex_count> pairs if `vertexType` is a list or "*".
@@ -133,7 +138,7 @@ class pyTigerGraphVertex(pyTigerGraphUtils, pyTigerGraphSchema):
         Uses:
             - If `vertexType` is specified only: count of the instances of the given vertex type(s).
             - If `vertexType` and `where` are specified: count of the instances of the given vertex
-                type after being filtered by `where` condition(s).
+                type(s) after being filtered by `where` condition(s).
 
         Raises:
             `TigerGraphException` when "*" is specified as vertex type and a `where` condition is
@@ -149,15 +154,23 @@ class pyTigerGraphVertex(pyTigerGraphUtils, pyTigerGraphSchema):
         if logger.level == logging.DEBUG:
             logger.debug("params: " + self._locals(locals()))
 
+        if isinstance(where, dict) and isinstance(vertexType, str) and vertexType != "*":
+            where = where.get(vertexType, "")
+
         # If WHERE condition is not specified, use /builtins else use /vertices
         if isinstance(vertexType, str) and vertexType != "*":
             if where:
-                res = self._get(self.restppUrl + "/graph/" + self.graphname + "/vertices/" + vertexType
-                    + "?count_only=true" + "&filter=" + where)[0]["count"]
+                res = self._getCachedMetadata("vertexCount", (self.graphname, vertexType, where),
+                    lambda: self._get(self.restppUrl + "/graph/" + self.graphname + "/vertices/"
+                        + vertexType + "?count_only=true" + "&filter=" + where)[0]["count"],
+                    realtime)
             else:
-                res = self._post(self.restppUrl + "/builtins/" + self.graphname + ("?realtime=true" if realtime else ""),
-                                 data={"function": "stat_vertex_number", "type": vertexType},
-                                 jsonData=True)[0]["count"]
+                res = self._getCachedMetadata("vertexCount", (self.graphname, vertexType, ""),
+                    lambda: self._post(self.restppUrl + "/builtins/" + self.graphname
+                        + ("?realtime=true" if realtime else ""),
+                        data={"function": "stat_vertex_number", "type": vertexType},
+                        jsonData=True)[0]["count"],
+                    realtime)
 
             if logger.level == logging.DEBUG:
                 logger.debug("return: " + str(res))
@@ -169,13 +182,25 @@ class pyTigerGraphVertex(pyTigerGraphUtils, pyTigerGraphSchema):
             if vertexType == "*":
                 raise TigerGraphException(
                     "VertexType cannot be \"*\" if where condition is specified.", None)
-            else:
-                raise TigerGraphException(
-                    "VertexType cannot be a list if where condition is specified.", None)
 
-        res = self._post(self.restppUrl + "/builtins/" + self.graphname + ("?realtime=true" if realtime else ""),
-                         data={"function": "stat_vertex_number", "type": "*"},
-                         jsonData=True)
+            conditions = where if isinstance(where, dict) else dict.fromkeys(vertexType, where)
+            counts = self._runConcurrently(
+                lambda vt: self.getVertexCount(vt, conditions.get(vt, ""), realtime),
+                vertexType, concurrency)
+            ret = dict(zip(vertexType, counts))
+
+            if logger.level == logging.DEBUG:
+                logger.debug("return: " + str(ret))
+            logger.info("exit: getVertexCount (3)")
+
+            return ret
+
+        res = self._getCachedMetadata("vertexCount", (self.graphname, "*", ""),
+            lambda: self._post(self.restppUrl + "/builtins/" + self.graphname
+                + ("?realtime=true" if realtime else ""),
+                data={"function": "stat_vertex_number", "type": "*"},
+                jsonData=True),
+            realtime)
         ret = {d["v_type"]: d["count"] for d in res}
 
         if isinstance(vertexType, list):
@@ -459,6 +484,201 @@ class pyTigerGraphVertex(pyTigerGraphUtils, pyTigerGraphSchema):
 
         return ret
 
+    def _filterToCondition(self, vertexType: str, where: str, alias: str = "s") -> str:
+        """Converts a REST++ style filter to a GSQL `WHERE` condition.
+
+        Args:
+            vertexType:
+                The name of the vertex type the filter is applied to.
+            where:
+                Comma separated list of conditions, as used by `getVertices()`, e.g.
+                `"a01>1,name=Thorin"`.
+            alias:
+                The vertex alias used in the GSQL query.
+
+        Returns:
+            The GSQL condition, e.g. `s.a01 > 1 AND s.name == "Thorin"`.
+
+        Raises:
+            `TigerGraphException` if a condition cannot be parsed, refers to an unknown attribute
+            or an attribute of a type other than string, datetime, numeric and boolean, or if the
+            value is not valid for the type of the attribute.
+        """
+        attrTypes = dict(self.getVertexAttrs(vertexType))
+        vt = self.getVertexType(vertexType)
+        if vt and vt["PrimaryId"].get("PrimaryIdAsAttribute"):
+            attrTypes[vt["PrimaryId"]["AttributeName"]] = vt["PrimaryId"]["AttributeType"]["Name"]
+
+        conds = []
+        for cond in where.split(","):
+            m = re.match(r"^\s*(\w+)\s*(!=|>=|<=|=|>|<)\s*(.*?)\s*$", cond)
+            if not m:
+                raise TigerGraphException("Invalid filter condition: " + cond, None)
+            attr, op, val = m.groups()
+            if attr not in attrTypes:
+                raise TigerGraphException(
+                    "Attribute `" + attr + "` is not defined for vertex type `" + vertexType + "`.",
+                    None)
+            attrType = attrTypes[attr].upper()
+            try:
+                if attrType.startswith("STRING"):
+                    val = json.dumps(val.strip('"'))
+                elif attrType == "DATETIME":
+                    val = "to_datetime(" + json.dumps(val.strip('"')) + ")"
+                elif attrType in ("INT", "UINT"):
+                    val = str(int(val))
+                elif attrType in ("FLOAT", "DOUBLE"):
+                    num = float(val)
+                    if not math.isfinite(num):
+                        raise ValueError(val)
+                    val = repr(num)
+                elif attrType == "BOOL" and val.lower() in ("true", "false", "1", "0"):
+                    val = "TRUE" if val.lower() in ("true", "1") else "FALSE"
+                else:
+                    raise ValueError(val)
+            except ValueError:
+                raise TigerGraphException("Invalid value in filter condition `" + cond +
+                    "` for attribute `" + attr + "` of type " + attrType + ".", None)
+            conds.append("{}.{} {} {}".format(alias, attr, "==" if op == "=" else op, val))
+
+        return " AND ".join(conds)
+
+    def iterVertices(self, vertexType: str, select: str = "", where: str = "",
+            chunkSize: int = 10000, fmt: str = "py", withId: bool = True, withType: bool = False,
+            prefetch: int = 0, compact: bool = False,
+            partition: tuple = None) -> Iterator[Union[list, str, 'pd.DataFrame']]:
+        """Iterates over all vertices of the given vertex type, page by page.
+
+        Unlike `getVertices()`, which returns all matching vertices in a single response (and thus
+        may hit the response size limit or exhaust memory on large vertex types), this function
+        retrieves the vertices in pages of `chunkSize` vertices, in the order of their internal ID.
+        Each page starts after the last vertex of the previous page, so every vertex is retrieved
+        exactly once.
+
+        The pages are retrieved by an installed query, which is created and installed at the first
+        call for a given combination of vertex type, `select` and `where` (this can take a minute
+        or so). The query is named `iterVertices_<vertex_type>_<hash>`; it is reused by later
+        calls, including those of other processes and sessions.
+
+        NOTE: The server cannot start a scan at the cursor: each page is selected by scanning all
+        vertices of the type and keeping the `chunkSize` vertices with the smallest internal IDs
+        after the cursor. Retrieving `N` vertices thus scans `N * N / chunkSize` vertices in
+        total, i.e. the cost grows quadratically with the size of the type for a given
+        `chunkSize`. Use pages as large as memory allows; for a one-off retrieval of a type that
+        fits into a single response, `getVertices()` is cheaper.
+
+        Args:
+            vertexType:
+                The name of the vertex type.
+            select:
+                Comma separated list of vertex attributes to be retrieved.
+            where:
+                Comma separated list of conditions that are all applied on each vertex' attributes.
+                The conditions are in logical conjunction (i.e. they are "AND'ed" together).
+                Same format as in `getVertices()`.
+            chunkSize:
+                The number of vertices in a page (the last page can be smaller).
+            fmt:
+                Format of the pages:
+                - "py":   Python objects
+                - "json": JSON document
+                - "df":   pandas DataFrame
+            withId:
+                (When the output format is "df") should the vertex ID be included in the dataframe?
+            withType:
+                (When the output format is "df") should the vertex type be included in the dataframe?
+            prefetch:
+                The number of pages retrieved (in a background thread) ahead of the consumption of
+                the pages. Default is `0`, i.e. a page is retrieved only when it is requested.
+            compact:
+                (When the output format is "df") Should compact, schema derived dtypes be used in
+                the dataframe? See `vertexSetToDataFrame()`.
+            partition:
+                An `(i, n)` tuple: only the vertices of the `i`-th of `n` disjoint partitions (by
+                internal ID) are retrieved. Iterating over the `n` partitions in parallel retrieves
+                all vertices. The default is to retrieve all vertices.
+
+        Returns:
+            A generator of the pages of vertex instances, as lists, JSON strings or pandas
+            DataFrames.
+
+        Example:
+            [source.wrap,python]
+            ----
+            for df in conn.iterVertices("Person", select="age", chunkSize=100000, fmt="df"):
+                process(df)
+            ----
+
+        Endpoints:
+            - `POST /gsqlserver/gsql/file` (at the first call)
+            - `GET /query/{graph_name}/iterVertices_<vertex_type>_<hash>`
+        """
+        logger.info("entry: iterVertices")
+        if logger.level == logging.DEBUG:
+            logger.debug("params: " + self._locals(locals()))
+
+        if not chunkSize or chunkSize <= 0:
+            raise TigerGraphException("chunkSize must be a positive integer.", None)
+        part, parts = partition or (0, 1)
+        if not 0 <= part < parts:
+            raise TigerGraphException("Invalid partition: " + str(partition), None)
+
+        condition = ""
+        if where:
+            condition = " AND " + self._filterToCondition(vertexType, where)
+        printed = "vertices"
+        if select:
+            printed += "[" + ", ".join(
+                "vertices." + a.strip() for a in select.split(",") if a.strip()) + "]"
+
+        # The page is the `page_size` vertices following the cursor (the internal ID of the last
+        # vertex of the previous page)
+        queryBody = \
+            '(INT after, INT page_size, INT part, INT parts) FOR GRAPH $graphname { \
+                MaxAccum<INT> @@last; \
+                start = {$vertexType.*}; \
+                vertices = \
+                    SELECT s \
+                    FROM   start:s \
+                    WHERE  getvid(s) > after AND getvid(s) % parts == part$condition \
+                    ORDER BY getvid(s) ASC \
+                    LIMIT  page_size; \
+                vertices = \
+                    SELECT s \
+                    FROM   vertices:s \
+                    ACCUM  @@last += getvid(s); \
+                PRINT @@last AS last; \
+                PRINT $printed; \
+            }'
+        queryBody = queryBody.replace("$graphname", self.graphname) \
+            .replace("$vertexType", vertexType) \
+            .replace("$condition", condition) \
+            .replace("$printed", printed)
+        queryName = self._pagingQueryName("iterVertices_" + vertexType, queryBody)
+        self._installQueryOnce(queryName, "CREATE QUERY " + queryName + queryBody)
+
+        def fetch(after: int) -> tuple:
+            res = self.runInstalledQuery(queryName, {"after": after, "page_size": chunkSize,
+                "part": part, "parts": parts})
+            ret = res[1]["vertices"]
+            if select:
+                # Selected attributes are printed with the vertex set name as prefix
+                for v in ret:
+                    v["attributes"] = {k.rsplit(".", 1)[-1]: a for k, a in v["attributes"].items()}
+            return ret, (res[0]["last"] if len(ret) == chunkSize else None)
+
+        for ret in self._iterCursor(fetch, -1, prefetch):
+            if not ret:
+                continue
+            if fmt == "json":
+                ret = json.dumps(ret)
+            elif fmt == "df":
+                ret = self.vertexSetToDataFrame(ret, withId, withType, compact)
+
+            yield ret
+
+        logger.info("exit: iterVertices")
+
     def getVertexDataframe(self, vertexType: str, select: str = "", where: str = "",
             limit: Union[int, str] = None, sort: str = "", timeout: int = 0) -> 'pd.DataFrame':
         """DEPRECATED
@@ -474,7 +694,7 @@ class pyTigerGraphVertex(pyTigerGraphUtils, pyTigerGraphSchema):
 
     def getVerticesById(self, vertexType: str, vertexIds: Union[int, str, list], select: str = "",
             fmt: str = "py", withId: bool = True, withType: bool = False,
-            timeout: int = 0) -> Union[list, str, 'pd.DataFrame']:
+            timeout: int = 0, concurrency: int = 1) -> Union[list, str, 'pd.DataFrame']:
         """Retrieves vertices of the given vertex type, identified by their ID.
 
         Args:
@@ -495,10 +715,15 @@ class pyTigerGraphVertex(pyTigerGraphUtils, pyTigerGraphSchema):
                 (If the output format is "df") should the vertex type be included in the dataframe?
             timeout:
                 Time allowed for successful execution (0 = no limit, default).
+            concurrency:
+                The maximum number of vertices retrieved in parallel. The endpoint accepts a single
+                vertex ID per request, so for long lists of IDs the request latency dominates;
+                sending several requests at the same time hides most of it. Default is `1`, i.e.
+                the vertices are retrieved one after the other.
 
         Returns:
             The (selected) details of the (matching) vertex instances as dictionary, JSON or pandas
-            DataFrame.
+            DataFrame. The vertices are listed in the order of `vertexIds`.
 
         Endpoint:
             - `GET /graph/{graph_name}/vertices/{vertex_type}/{vertex_id}`
@@ -520,8 +745,9 @@ class pyTigerGraphVertex(pyTigerGraphUtils, pyTigerGraphSchema):
         url = self.restppUrl + "/graph/" + self.graphname + "/vertices/" + vertexType + "/"
 
         ret = []
-        for vid in vids:
-            ret += self._get(url + self._safeChar(vid))
+        for res in self._runConcurrently(lambda vid: self._get(url + self._safeChar(vid)), vids,
+                concurrency):
+            ret += res
 
         if fmt == "json":
             ret = json.dumps(ret)
@@ -576,7 +802,8 @@ class pyTigerGraphVertex(pyTigerGraphUtils, pyTigerGraphSchema):
 
         return self.getVertexDataFrameById(vertexType, vertexIds, select)
 
-    def getVertexStats(self, vertexTypes: Union[str, list], skipNA: bool = False) -> dict:
+    def getVertexStats(self, vertexTypes: Union[str, list], skipNA: bool = False,
+            concurrency: int = 4) -> dict:
         """Returns vertex attribute statistics.
 
         Args:
@@ -586,6 +813,9 @@ class pyTigerGraphVertex(pyTigerGraphUtils, pyTigerGraphSchema):
             skipNA:
                 Skip those non-applicable vertices that do not have attributes or none of their
                 attributes have statistics gathered.
+            concurrency:
+                The maximum number of vertex types processed in parallel (each vertex type
+                requires a separate request). Defaults to 4.
 
         Returns:
             A dictionary of various vertex stats for each vertex type specified.
@@ -606,11 +836,13 @@ class pyTigerGraphVertex(pyTigerGraphUtils, pyTigerGraphSchema):
         else:
             vts = vertexTypes
 
-        ret = {}
-        for vt in vts:
+        def stats(vt: str) -> dict:
             data = '{"function":"stat_vertex_attr","type":"' + vt + '"}'
-            res = self._post(self.restppUrl + "/builtins/" + self.graphname, data=data, resKey="",
-                skipCheck=True)
+            return self._post(self.restppUrl + "/builtins/" + self.graphname, data=data,
+                resKey="", skipCheck=True)
+
+        ret = {}
+        for vt, res in zip(vts, self._runConcurrently(stats, vts, concurrency)):
             if res["error"]:
                 if "stat_vertex_attr is skip" in res["message"]:
                     if not skipNA:
@@ -694,7 +926,7 @@ class pyTigerGraphVertex(pyTigerGraphUtils, pyTigerGraphSchema):
         return ret
 
     def delVerticesById(self, vertexType: str, vertexIds: Union[int, str, list],
-            permanent: bool = False, timeout: int = 0) -> int:
+            permanent: bool = False, timeout: int = 0, concurrency: int = 1) -> int:
         """Deletes vertices from graph identified by their ID.
 
         Args:
@@ -707,6 +939,10 @@ class pyTigerGraphVertex(pyTigerGraphUtils, pyTigerGraphSchema):
                 dropped or the graph store is cleared.
             timeout:
                 Time allowed for successful execution (0 = no limit, default).
+            concurrency:
+                The maximum number of vertices deleted in parallel (the endpoint accepts a single
+                vertex ID per request). Default is `1`, i.e. the vertices are deleted one after the
+                other.
 
         Returns:
             A single number of vertices deleted.
@@ -733,9 +969,8 @@ class pyTigerGraphVertex(pyTigerGraphUtils, pyTigerGraphSchema):
             url2 = "?permanent=true"
         if timeout and timeout > 0:
             url2 += ("&" if url2 else "?") + "timeout=" + str(timeout)
-        ret = 0
-        for vid in vids:
-            ret += self._delete(url1 + str(vid) + url2)["deleted_vertices"]
+        ret = sum(self._runConcurrently(
+            lambda vid: self._delete(url1 + str(vid) + url2)["deleted_vertices"], vids, concurrency))
 
         if logger.level == logging.DEBUG:
             logger.debug("return: " + str(ret))
@@ -751,7 +986,7 @@ class pyTigerGraphVertex(pyTigerGraphUtils, pyTigerGraphSchema):
     # TODO GET /deleted_vertex_check/{graph_name}
 
     def vertexSetToDataFrame(self, vertexSet: list, withId: bool = True,
-            withType: bool = False) -> 'pd.DataFrame':
+            withType: bool = False, compact: bool = False) -> 'pd.DataFrame':
         """Converts a vertex set to Pandas DataFrame.
 
         Vertex sets are used for both the input and output of `SELECT` statements. They contain
@@ -786,6 +1021,10 @@ class pyTigerGraphVertex(pyTigerGraphUtils, pyTigerGraphSchema):
                 Whether to include vertex primary ID as a column.
             withType:
                 Whether to include vertex type info as a column.
+            compact:
+                Whether to apply compact dtypes derived from the (cached) schema of the vertex type:
+                the smallest integer types fitting the values, `float32` for `FLOAT`, `bool` for
+                `BOOL` and `category` for `STRING` attributes. Recommended for large vertex sets.
 
         Returns:
             A pandas DataFrame containing the vertex attributes (and optionally the vertex primary
@@ -801,15 +1040,18 @@ class pyTigerGraphVertex(pyTigerGraphUtils, pyTigerGraphSchema):
             raise ImportError("Pandas is required to use this function. "
                 "Download pandas using 'pip install pandas'.")
 
-        df = pd.DataFrame(vertexSet)
-        cols = []
+        idKeys = []
         if withId:
-            cols.append(df["v_id"])
+            idKeys.append("v_id")
         if withType:
-            cols.append(df["v_type"])
-        cols.append(pd.DataFrame(df["attributes"].tolist()))
-
-        ret = pd.concat(cols, axis=1)
+            idKeys.append("v_type")
+        dtypes = None
+        if compact and vertexSet:
+            vt = self.getVertexType(vertexSet[0]["v_type"])
+            if vt:
+                dtypes = self._getAttrDtypes(vt["Attributes"])
+
+        ret = self._elementSetToDataFrame(vertexSet, idKeys, dtypes)
 
         if logger.level == logging.DEBUG:
             logger.debug("return: " + str(ret))
@@ -0,0 +1,175 @@
+"""Query Result Cache
+
+A client-side cache of the results of installed queries, used by `runInstalledQuery()` once
+enabled with `enableQueryCache()` on a `TigerGraphConnection` object.
+
+The results are kept in memory (with a least recently used eviction policy) and, optionally, in an
+SQLite database file that can be shared by multiple processes on the same host.
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Iterable, Union
+
+
+class QueryResultCache:
+    """Two-tier (memory and, optionally, SQLite) cache of query results.
+
+    Only cache the results of read-only queries; the cache is not invalidated when data is modified.
+    Entries can be invalidated explicitly, by query name or by tags.
+
+    Args:
+        maxSize (int, optional):
+            The maximum number of results kept in memory. Defaults to 1024.
+        ttl (float, optional):
+            The default time to live of the results in seconds. `None` means no expiry.
+        queryTTLs (dict, optional):
+            Time to live of the results of specific queries, as `query_name: seconds` pairs.
+        path (str, optional):
+            The path of the SQLite database file of the shared, on-disk tier. If not specified,
+            results are only cached in memory.
+    """
+
+    def __init__(self, maxSize: int = 1024, ttl: float = None, queryTTLs: dict = None,
+            path: str = None) -> None:
+        """NO DOC"""
+        self.maxSize = maxSize
+        self.ttl = ttl
+        self.queryTTLs = queryTTLs or {}
+        self.path = path
+        self._entries = OrderedDict()  # key -> (expires, query, tags, serialised result)
+        self._lock = threading.Lock()
+        self._db = None
+        if path:
+            dirname = os.path.dirname(os.path.abspath(path))
+            os.makedirs(dirname, exist_ok=True)
+            self._db = sqlite3.connect(path, timeout=30, check_same_thread=False,
+                isolation_level=None)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, "
+                "query TEXT, tags TEXT, expires REAL, value TEXT)")
+            self._db.execute("CREATE TABLE IF NOT EXISTS tags (tag TEXT, key TEXT)")
+            self._db.execute("CREATE INDEX IF NOT EXISTS tags_tag ON tags (tag)")
+
+    @staticmethod
+    def makeKey(graphname: str, queryName: str, params: Union[str, dict, None],
+            scope: str = "") -> str:
+        """Returns the cache key of a query call.
+
+        Dictionary parameters are canonicalised (sorted by name, tuples converted to lists, sets
+        sorted), so that equivalent calls share the same key. The scope (e.g. the server and the
+        identity of the user) separates the results of different servers and users sharing the
+        same SQLite file.
+        """
+        def canonical(o):
+            if isinstance(o, (set, frozenset)):
+                return sorted(o, key=str)
+            return str(o)
+
+        if isinstance(params, dict):
+            params = json.dumps(params, sort_keys=True, separators=(",", ":"), default=canonical)
+        else:
+            params = params or ""
+        return (scope + "|" if scope else "") + graphname + "/" + queryName + "?" + params
+
+    def get(self, key: str) -> Union[list, None]:
+        """Returns the cached result, or `None` if it is not cached or has expired."""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry:
+                if entry[0] is None or entry[0] > now:
+                    self._entries.move_to_end(key)
+                    return json.loads(entry[3])
+                del self._entries[key]
+            if not self._db:
+                return None
+            row = self._db.execute("SELECT query, tags, expires, value FROM results WHERE key = ?",
+                (key,)).fetchone()
+            if not row:
+                return None
+            if row[2] is not None and row[2] <= now:
+                self._db.execute("DELETE FROM results WHERE key = ?", (key,))
+                self._db.execute("DELETE FROM tags WHERE key = ?", (key,))
+                return None
+            self._store(key, (row[2], row[0], json.loads(row[1]), row[3]))
+            return json.loads(row[3])
+
+    def put(self, key: str, queryName: str, result: list, ttl: float = None,
+            tags: Iterable[str] = None) -> None:
+        """Caches a query result.
+
+        Args:
+            key:
+                The key, as returned by `makeKey()`.
+            queryName:
+                The name of the query.
+            result:
+                The (JSON serialisable) result of the query.
+            ttl:
+                The time to live of the result in seconds. If not specified, the TTL of the query
+                (or the default TTL) is used.
+            tags:
+                Tags of the result, used for invalidation.
+        """
+        if ttl is None:
+            ttl = self.queryTTLs.get(queryName, self.ttl)
+        expires = time.time() + ttl if ttl is not None else None
+        tags = list(tags or [])
+        value = json.dumps(result)
+        with self._lock:
+            self._store(key, (expires, queryName, tags, value))
+            if self._db:
+                self._db.execute("INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?)",
+                    (key, queryName, json.dumps(tags), expires, value))
+                self._db.execute("DELETE FROM tags WHERE key = ?", (key,))
+                self._db.executemany("INSERT INTO tags VALUES (?, ?)", [(t, key) for t in tags])
+
+    def _store(self, key: str, entry: tuple) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxSize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, queryName: str = None, tags: Iterable[str] = None) -> None:
+        """Removes results from the cache.
+
+        Args:
+            queryName:
+                Remove the results of this query.
+            tags:
+                Remove the results having any of these tags.
+
+            If neither is specified, all results are removed.
+        """
+        tags = set(tags or [])
+        with self._lock:
+            if not queryName and not tags:
+                self._entries.clear()
+                if self._db:
+                    self._db.execute("DELETE FROM results")
+                    self._db.execute("DELETE FROM tags")
+                return
+            for k in [k for k, e in self._entries.items()
+                    if e[1] == queryName or tags.intersection(e[2])]:
+                del self._entries[k]
+            if self._db:
+                if queryName:
+                    self._db.execute("DELETE FROM tags WHERE key IN "
+                        "(SELECT key FROM results WHERE query = ?)", (queryName,))
+                    self._db.execute("DELETE FROM results WHERE query = ?", (queryName,))
+                for t in tags:
+                    self._db.execute("DELETE FROM results WHERE key IN "
+                        "(SELECT key FROM tags WHERE tag = ?)", (t,))
+                    self._db.execute("DELETE FROM tags WHERE key IN "
+                        "(SELECT key FROM tags WHERE tag = ?)", (t,))
+
+    def close(self) -> None:
+        """Closes the on-disk tier (if any). The in-memory tier remains usable."""
+        with self._lock:
+            if self._db:
+                self._db.close()
+                self._db = None
@@ -0,0 +1,213 @@
+"""Query Jobs
+
+Track queries running in detached (asynchronous) mode as `concurrent.futures.Future` objects.
+A `QueryJobManager` polls the status of all outstanding queries of a connection in a single
+background thread, with adaptive backoff, and completes the futures when the queries finish. The
+futures can be used with `concurrent.futures.wait()`, `concurrent.futures.as_completed()` and
+`add_done_callback()`.
+
+The job manager of a connection is used by `runInstalledQueryAsync()` on a `TigerGraphConnection`
+object.
+"""
+import logging
+import threading
+from concurrent.futures import Future
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .pyTigerGraph import TigerGraphConnection
+
+from .pyTigerGraphException import TigerGraphException
+
+logger = logging.getLogger(__name__)
+
+
+class QueryJob(Future):
+    """A query running in detached mode.
+
+    The result of the future is the output of the query (see `getQueryResult()`). If the query is
+    aborted or times out, or its status cannot be checked several times in a row, the future raises
+    a `TigerGraphException`.
+    Note that the future remains in pending state (i.e. `running()` returns `False`) until the
+    query finishes, so that it can be cancelled.
+    """
+
+    def __init__(self, manager: "QueryJobManager", requestId: str) -> None:
+        """NO DOC"""
+        super().__init__()
+        self.manager = manager
+        self.requestId = requestId
+        self.pollFailures = 0  # The number of consecutive failed status polls
+
+    def cancel(self) -> bool:
+        """Cancels the future and aborts the query.
+
+        Returns:
+            `False` if the query has already finished, `True` otherwise.
+        """
+        if not super().cancel():
+            return False
+        try:
+            self.manager.conn.abortQuery(self.requestId)
+        except Exception as e:
+            logger.warning("Failed to abort query " + self.requestId + ": " + str(e))
+        return True
+
+
+class QueryJobManager:
+    """Polls the status of detached queries and completes their futures.
+
+    Args:
+        conn (TigerGraphConnection):
+            Connection to the TigerGraph database.
+        minInterval (float, optional):
+            The shortest time between status polls in seconds, used right after a query was
+            submitted or finished. Defaults to 0.05.
+        maxInterval (float, optional):
+            The longest time between status polls in seconds. Defaults to 2.
+        backoff (float, optional):
+            The factor the poll interval is multiplied by after each poll without finished queries.
+            Defaults to 1.5.
+        maxPollFailures (int, optional):
+            The number of consecutive failed status polls (e.g. timeouts or server errors) of a
+            query after which its future fails. Failed polls are retried with the same backoff as
+            other polls, as the query might still be running. Defaults to 10.
+    """
+
+    def __init__(self, conn: "TigerGraphConnection", minInterval: float = 0.05,
+            maxInterval: float = 2, backoff: float = 1.5, maxPollFailures: int = 10) -> None:
+        """NO DOC"""
+        self.conn = conn
+        self.minInterval = minInterval
+        self.maxInterval = maxInterval
+        self.backoff = backoff
+        self.maxPollFailures = maxPollFailures
+        self._jobs = {}
+        self._cond = threading.Condition()
+        self._interval = minInterval
+        self._thread = None
+
+    def track(self, requestId: str) -> QueryJob:
+        """Returns the future of a query running in detached mode.
+
+        Args:
+            requestId:
+                The request ID of the query, as returned by `runInstalledQuery(runAsync=True)`.
+
+        Returns:
+            The future of the query.
+        """
+        with self._cond:
+            job = self._jobs.get(requestId)
+            if job is None:
+                job = self._jobs[requestId] = QueryJob(self, requestId)
+            self._interval = self.minInterval
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._poll, daemon=True,
+                    name="pyTigerGraph-query-jobs")
+                self._thread.start()
+            self._cond.notify()
+        return job
+
+    def _statuses(self, requestIds: set) -> tuple:
+        """Returns the status of the queries, preferably with a single request.
+
+        Returns:
+            The statuses (by request ID) and the exceptions raised by the failed status polls (by
+            request ID).
+        """
+        ret = {}
+        errors = {}
+        try:
+            for s in self.conn.checkQueryStatus("all"):
+                ret[s.get("requestid")] = s
+        except Exception as e:
+            logger.debug("Checking the status of all queries failed: " + str(e))
+        for rid in requestIds:
+            if rid not in ret:
+                # Finished queries might not be listed
+                try:
+                    res = self.conn.checkQueryStatus(rid)
+                    if res:
+                        ret[rid] = res[0]
+                except Exception as e:
+                    errors[rid] = e
+        return ret, errors
+
+    def _poll(self) -> None:
+        while True:
+            with self._cond:
+                for rid in [rid for rid, job in self._jobs.items() if job.cancelled()]:
+                    del self._jobs[rid]
+                if not self._jobs:
+                    self._thread = None
+                    return
+                requestIds = set(self._jobs)
+
+            finished = 0
+            statuses, errors = self._statuses(requestIds)
+            for rid, e in errors.items():
+                with self._cond:
+                    job = self._jobs.get(rid)
+                    if job is None:
+                        continue
+                    job.pollFailures += 1
+                    logger.debug("Checking the status of query " + rid + " failed (" +
+                        str(job.pollFailures) + " times in a row): " + str(e))
+                    if job.pollFailures < self.maxPollFailures:
+                        continue
+                    del self._jobs[rid]
+                if not job.set_running_or_notify_cancel():
+                    continue
+                finished += 1
+                exc = TigerGraphException("Checking the status of query " + rid + " failed " +
+                    str(job.pollFailures) + " times in a row: " + str(e), None)
+                exc.__cause__ = e
+                job.set_exception(exc)
+            for rid, status in statuses.items():
+                if rid not in requestIds:
+                    continue
+                with self._cond:
+                    job = self._jobs.get(rid)
+                    if job is None:
+                        continue
+                    job.pollFailures = 0
+                    if status.get("status") == "running":
+                        continue
+                    del self._jobs[rid]
+                if not job.set_running_or_notify_cancel():
+                    continue
+                finished += 1
+                if status.get("status") == "success":
+                    try:
+                        job.set_result(self.conn.getQueryResult(rid))
+                    except Exception as e:
+                        job.set_exception(e)
+                else:
+                    job.set_exception(TigerGraphException("Query " + rid + " did not succeed: "
+                        + str(status.get("status")) + " " + str(status.get("message", "")), None))
+
+            with self._cond:
+                if finished:
+                    self._interval = self.minInterval
+                else:
+                    self._interval = min(self._interval * self.backoff, self.maxInterval)
+                if self._jobs:
+                    self._cond.wait(self._interval)
+
+    def shutdown(self, cancel: bool = False) -> None:
+        """Stops tracking the outstanding queries.
+
+        Unless cancelled, the futures of the outstanding queries will not complete.
+
+        Args:
+            cancel:
+                If `True`, the outstanding queries are aborted (and their futures cancelled).
+        """
+        with self._cond:
+            jobs = list(self._jobs.values())
+            if not cancel:
+                self._jobs.clear()
+        if cancel:
+            for job in jobs:
+                job.cancel()
@@ -60,6 +60,7 @@ setup(
     ],
     extras_require={
         "gds": ["pandas", "kafka-python", "numpy", "tqdm"],
+        "export": ["pyarrow"],
     },
     project_urls={
         "Bug Reports": "https://github.com/tigergraph/pyTigerGraph/issues",
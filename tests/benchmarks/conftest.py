@@ -0,0 +1,50 @@
+"""Options and fixtures of the benchmark suite."""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from standInServer import StandInServer
+
+DEFAULT_SIZES = "10000,100000"
+
+
+def pytest_addoption(parser):
+    parser.addoption("--benchmark-sizes", default=os.environ.get("PYTG_BENCHMARK_SIZES",
+        DEFAULT_SIZES), help="Comma separated list of the number of rows (vertices, edges, "
+        "predictions etc.) to benchmark with, e.g. 10000,100000,1000000,10000000. Defaults to "
+        "$PYTG_BENCHMARK_SIZES or " + DEFAULT_SIZES + ".")
+
+
+def pytest_generate_tests(metafunc):
+    if "size" in metafunc.fixturenames:
+        sizes = [int(s) for s in metafunc.config.getoption("--benchmark-sizes").split(",") if s]
+        metafunc.parametrize("size", sizes, ids=[str(s) for s in sizes], scope="session")
+
+
+@pytest.fixture(scope="session")
+def server():
+    with StandInServer() as server:
+        server.addVertexType("Person", {"age": "INT", "score": "DOUBLE", "active": "BOOL",
+            "city": "STRING"})
+        server.addEdgeType("Knows", "Person", "Person", {"weight": "DOUBLE"}, directed=False)
+        yield server
+
+
+@pytest.fixture
+def conn(server, monkeypatch):
+    """A connection to the stand-in server whose upserts are not sent.
+
+    Only the client side (serialisation of the payload) of upserts is measured: `_post()` returns
+    the number of accepted vertices and edges without sending the request.
+    """
+    conn = server.connection()
+    conn.getSchema()
+
+    def post(url, data=None, **kwargs):
+        return [{"accepted_vertices": 0, "accepted_edges": 0}]
+
+    monkeypatch.setattr(conn, "_post", post)
+    return conn
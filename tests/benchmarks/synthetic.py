@@ -0,0 +1,149 @@
+"""Synthetic data of the benchmark suite.
+
+The data is generated with fixed seeds and without using pyTigerGraph itself, so that the results
+of different versions of the package (saved with `--benchmark-save`) are comparable.
+"""
+from functools import lru_cache
+
+import numpy as np
+
+SEED = 42
+
+
+def rounds(size: int) -> int:
+    """The number of rounds of benchmarks that need fresh input for each round."""
+    return max(3, min(20, 1000000 // size))
+
+
+# Schema of the synthetic graph. Vertex IDs are integers; in the heterogeneous graph even IDs
+# belong to `A` vertices and odd IDs to `B` vertices.
+
+V_ATTR_TYPES = {"x": "LIST:DOUBLE", "y": "INT", "train_mask": "BOOL", "name": "STRING"}
+E_ATTR_TYPES = {"weight": "DOUBLE", "time": "INT"}
+E_TYPES = {
+    "AA": ("A", "A", True),
+    "AB": ("A", "B", False)
+}
+FEATURE_DIM = 4
+
+
+def loaderArgs(inFormat: str, hetero: bool) -> dict:
+    """The attribute arguments of `BaseLoader._parse_data()` for the synthetic batches."""
+    vArgs = {
+        "v_in_feats": ["x"],
+        "v_out_labels": ["y"],
+        "v_extra_feats": ["train_mask", "name"],
+        "v_attr_types": dict(V_ATTR_TYPES)
+    }
+    eArgs = {
+        "e_in_feats": ["weight"],
+        "e_out_labels": [],
+        "e_extra_feats": ["time"],
+        "e_attr_types": dict(E_ATTR_TYPES)
+    }
+    if hetero:
+        vArgs = {k: {vt: v for vt in ("A", "B")} for k, v in vArgs.items()}
+        eArgs = {k: {et: v for et in E_TYPES} for k, v in eArgs.items()}
+        for et, (src, tgt, directed) in E_TYPES.items():
+            eArgs["e_attr_types"][et] = dict(E_ATTR_TYPES, FromVertexTypeName=src,
+                ToVertexTypeName=tgt, IsDirected=directed)
+    ret = {"is_hetero": hetero}
+    if inFormat in ("vertex", "graph"):
+        ret.update(vArgs)
+    if inFormat in ("edge", "graph"):
+        ret.update(eArgs)
+    return ret
+
+
+def _join(*cols) -> np.ndarray:
+    ret = cols[0].astype(str)
+    for col in cols[1:]:
+        ret = np.char.add(np.char.add(ret, "|"), col.astype(str))
+    return ret
+
+
+@lru_cache(maxsize=None)
+def vertexBatch(size: int, hetero: bool = False, seed: int = SEED) -> str:
+    """A vertex batch of `size` vertices, in the format of the loader queries."""
+    rng = np.random.default_rng(seed)
+    vids = np.arange(size)
+    feats = np.round(rng.random((size, FEATURE_DIM)), 4).astype(str)
+    x = feats[:, 0]
+    for i in range(1, FEATURE_DIM):
+        x = np.char.add(np.char.add(x, " "), feats[:, i])
+    cols = [vids, x, rng.integers(0, 10, size), rng.integers(0, 2, size),
+        np.char.add("v", vids.astype(str))]
+    if hetero:
+        cols.insert(0, np.where(vids % 2 == 0, "A", "B"))
+    return "\n".join(_join(*cols).tolist()) + "\n"
+
+
+@lru_cache(maxsize=None)
+def edgeBatch(size: int, numVertices: int = None, hetero: bool = False,
+        seed: int = SEED + 1) -> str:
+    """An edge batch of `size` edges between `numVertices` vertices."""
+    rng = np.random.default_rng(seed)
+    numVertices = numVertices or size
+    src = rng.integers(0, numVertices, size)
+    tgt = rng.integers(0, numVertices, size)
+    cols = [src, tgt, np.round(rng.random(size), 4), rng.integers(0, 1700000000, size)]
+    if hetero:
+        # Sources are `A` vertices, targets are `A` or `B` vertices depending on the edge type
+        eTypes = np.where(rng.random(size) < 0.5, "AA", "AB")
+        lastB = numVertices - 1 if numVertices % 2 == 0 else numVertices - 2
+        cols[0] = src - src % 2
+        cols[1] = np.where(eTypes == "AA", tgt - tgt % 2, np.minimum(tgt - tgt % 2 + 1, lastB))
+        cols.insert(0, eTypes)
+    return "\n".join(_join(*cols).tolist()) + "\n"
+
+
+def graphBatch(size: int, hetero: bool = False) -> tuple:
+    """A (vertex batch, edge batch) pair of `size` vertices and `size` edges."""
+    return vertexBatch(size, hetero), edgeBatch(size, size, hetero)
+
+
+@lru_cache(maxsize=1)
+def vertexSet(size: int, seed: int = SEED) -> list:
+    """A vertex set of `size` `Person` vertices, as returned by queries. Do not modify it."""
+    rng = np.random.default_rng(seed)
+    ages = rng.integers(0, 100, size).tolist()
+    scores = np.round(rng.random(size), 4).tolist()
+    flags = (rng.random(size) < 0.5).tolist()
+    cities = rng.choice(["Austin", "Berlin", "Calcutta", "Dublin"], size).tolist()
+    return [{"v_id": str(i), "v_type": "Person", "attributes": {"age": ages[i],
+        "score": scores[i], "active": flags[i], "city": cities[i]}} for i in range(size)]
+
+
+@lru_cache(maxsize=1)
+def edgeSet(size: int, seed: int = SEED + 1) -> list:
+    """An edge set of `size` `Knows` edges, as returned by queries. Do not modify it."""
+    rng = np.random.default_rng(seed)
+    src = rng.integers(0, size, size).tolist()
+    tgt = rng.integers(0, size, size).tolist()
+    weights = np.round(rng.random(size), 4).tolist()
+    return [{"e_type": "Knows", "directed": False, "from_type": "Person", "from_id": str(src[i]),
+        "to_type": "Person", "to_id": str(tgt[i]), "attributes": {"weight": weights[i]}}
+        for i in range(size)]
+
+
+def queryOutput(size: int) -> list:
+    """The output of a query printing a vertex set, an edge set and an overlapping vertex set.
+
+    The elements are copies, as `parseQueryOutput()` updates them in place.
+    """
+    vs = [dict(v, attributes=dict(v["attributes"])) for v in vertexSet(size)]
+    es = [dict(e, attributes=dict(e["attributes"])) for e in edgeSet(size)]
+    return [{"Result": vs}, {"Edges": es},
+        {"Sample": [{"v_id": v["v_id"], "v_type": "Person", "attributes": {"age": 0}}
+            for v in vs[::10]]}, {"total": size}]
+
+
+@lru_cache(maxsize=None)
+def predictions(size: int, numClasses: int = 10, seed: int = SEED) -> tuple:
+    """Predicted and true class labels, and scores and binary labels for ranking metrics."""
+    rng = np.random.default_rng(seed)
+    labels = rng.integers(0, numClasses, size)
+    preds = np.where(rng.random(size) < 0.7, labels, rng.integers(0, numClasses, size))
+    scores = rng.random(size)
+    relevant = (rng.random(size) < 0.1).astype(int)
+    return preds, labels, scores, relevant
@@ -0,0 +1,154 @@
+"""Benchmarks of the core functions converting data from and to the formats of the REST++ API.
+
+The connection is backed by the stand-in server; upserts are serialised but not sent (see the
+`conn` fixture).
+
+Arguments are only passed if they differ from their defaults, and benchmarks of functions or
+arguments that the installed version of pyTigerGraph does not have are skipped, so that the suite
+also runs against earlier versions (e.g. to save their results as baseline).
+"""
+import inspect
+from datetime import datetime
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+pd = pytest.importorskip("pandas")
+
+from standInServer import StandInServer
+from synthetic import edgeSet, queryOutput, rounds, vertexSet
+
+# Page size of the paging benchmarks; it is fixed, so the number of pages grows with the size
+PAGE_SIZE = 10000
+
+
+def requires(obj: object, name: str, *kwargs: str) -> None:
+    """Skips the benchmark unless `obj` has the method `name` with the keyword arguments."""
+    func = getattr(obj, name, None)
+    if func is None:
+        pytest.skip("{} is not available in this version.".format(name))
+    missing = [k for k in kwargs if k not in inspect.signature(func).parameters]
+    if missing:
+        pytest.skip("{}() has no {} argument in this version.".format(name, ", ".join(missing)))
+
+
+def test_upsertEdges(benchmark, conn, size):
+    edges = [(str(i), str((i * 7919) % size), {"weight": (i % 1000) / 1000})
+        for i in range(size)]
+
+    benchmark.group = "upsertEdges"
+    benchmark.extra_info["rows"] = size
+    benchmark(conn.upsertEdges, "Person", "Knows", "Person", edges)
+
+
+def test_upsertVertexDataFrame(benchmark, conn, size):
+    df = pd.DataFrame([{"id": v["v_id"], **v["attributes"]} for v in vertexSet(size)])
+
+    benchmark.group = "upsertVertexDataFrame"
+    benchmark.extra_info["rows"] = size
+    benchmark(conn.upsertVertexDataFrame, df, "Person", v_id="id",
+        attributes={"age": "age", "score": "score", "active": "active", "city": "city"})
+
+
+@pytest.mark.parametrize("compact", [False, True], ids=["default", "compact"])
+def test_vertexSetToDataFrame(benchmark, conn, size, compact):
+    kwargs = {"compact": True} if compact else {}
+    requires(conn, "vertexSetToDataFrame", *kwargs)
+    vs = vertexSet(size)
+
+    benchmark.group = "vertexSetToDataFrame"
+    benchmark.extra_info["rows"] = size
+    benchmark(conn.vertexSetToDataFrame, vs, withType=True, **kwargs)
+
+
+@pytest.mark.parametrize("trackOccurrences", [True, False], ids=["track", "notrack"])
+@pytest.mark.parametrize("fmt", ["py", "df", "arrow"])
+def test_parseQueryOutput(benchmark, conn, size, fmt, trackOccurrences):
+    if fmt == "arrow":
+        pytest.importorskip("pyarrow")
+    kwargs = {"graphOnly": False}
+    if not trackOccurrences:
+        kwargs["trackOccurrences"] = False
+    if fmt != "py":
+        kwargs["fmt"] = fmt
+    # Versions without the `fmt` argument fail on the edges of the output; see
+    # test_parseQueryOutputVertices() for a benchmark that runs with them
+    requires(conn, "parseQueryOutput", "fmt", *kwargs)
+
+    benchmark.group = "parseQueryOutput"
+    benchmark.extra_info["rows"] = size
+    # The output is updated in place, so each round needs a fresh copy
+    benchmark.pedantic(conn.parseQueryOutput, setup=lambda: ((queryOutput(size),), kwargs),
+        rounds=rounds(size))
+
+
+def test_parseQueryOutputVertices(benchmark, conn, size):
+    """Parses the vertex sets of the query output only, as all versions can."""
+    benchmark.group = "parseQueryOutputVertices"
+    benchmark.extra_info["rows"] = size
+    benchmark.pedantic(conn.parseQueryOutput,
+        setup=lambda: (([o for o in queryOutput(size) if "Edges" not in o],),
+            {"graphOnly": False}),
+        rounds=rounds(size))
+
+
+def test_parseQueryParameters(benchmark, conn, size):
+    params = {
+        "ids": list(range(size // 2)),
+        "vertices": [(str(i), "Person") for i in range(size - size // 2)],
+        "source": ("0", "Person"),
+        "name": "Grace Hopper & co.",
+        "since": datetime(2021, 1, 1)
+    }
+
+    benchmark.group = "parseQueryParameters"
+    benchmark.extra_info["rows"] = size
+    benchmark(conn._parseQueryParameters, params)
+
+
+def test_iterVertices(benchmark, size):
+    """Iterates over all vertices of a type in pages of `PAGE_SIZE` vertices.
+
+    Like the installed query, the stand-in server selects each page by scanning and sorting all
+    vertices of the type, so the time grows with `size * size / PAGE_SIZE` (see `scanned`).
+    """
+    with StandInServer() as server:
+        requires(server.connection(), "iterVertices")
+        server.addVertexType("Person", {"age": "INT", "score": "DOUBLE", "active": "BOOL",
+            "city": "STRING"})
+        server.addVertices("Person", [(v["v_id"], v["attributes"]) for v in vertexSet(size)])
+        conn = server.connection()
+        next(conn.iterVertices("Person", chunkSize=PAGE_SIZE))  # Installs the query
+
+        pages = -(-size // PAGE_SIZE)
+        benchmark.group = "iterVertices"
+        benchmark.extra_info["rows"] = size
+        benchmark.extra_info["pages"] = pages
+        benchmark.extra_info["scanned"] = pages * size
+        benchmark.pedantic(lambda: sum(len(p) for p in
+            conn.iterVertices("Person", chunkSize=PAGE_SIZE)), rounds=rounds(size))
+
+
+def test_iterEdges(benchmark, size):
+    """Iterates over all edges of a type in pages of about `PAGE_SIZE` edges.
+
+    Each page is the edges of the next source vertices; like the installed query, the stand-in
+    server selects them by scanning and sorting all source vertices (see `scanned`).
+    """
+    with StandInServer() as server:
+        requires(server.connection(), "iterEdges")
+        server.addVertexType("Person", {})
+        server.addEdgeType("Knows", "Person", "Person", {"weight": "DOUBLE"}, directed=False)
+        server.addVertices("Person", [str(i) for i in range(size)])
+        server.addEdges("Knows", [(e["from_id"], e["to_id"], e["attributes"])
+            for e in edgeSet(size)])
+        conn = server.connection()
+        next(conn.iterEdges("Knows", chunkSize=PAGE_SIZE))  # Installs the query
+
+        pages = -(-size // PAGE_SIZE)
+        benchmark.group = "iterEdges"
+        benchmark.extra_info["rows"] = size
+        benchmark.extra_info["pages"] = pages
+        benchmark.extra_info["scanned"] = pages * size
+        benchmark.pedantic(lambda: sum(len(p) for p in
+            conn.iterEdges("Knows", chunkSize=PAGE_SIZE)), rounds=rounds(size))
@@ -0,0 +1,68 @@
+"""Benchmarks of the GDS metrics and transforms."""
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+np = pytest.importorskip("numpy")
+
+from synthetic import predictions, rounds
+from pyTigerGraph.gds import metrics
+
+CLASSIFICATION = {
+    "Accuracy": metrics.Accuracy,
+    "ConfusionMatrix": lambda: metrics.ConfusionMatrix(10),
+    "Recall": lambda: metrics.Recall(10),
+    "Precision": lambda: metrics.Precision(10)
+}
+REGRESSION = {
+    "MSE": metrics.MSE,
+    "RMSE": metrics.RMSE,
+    "MAE": metrics.MAE
+}
+RANKING = {
+    "HitsAtK": lambda: metrics.HitsAtK(100),
+    "RecallAtK": lambda: metrics.RecallAtK(100)
+}
+
+
+def _update(metric, preds, labels):
+    metric.update(preds, labels)
+    return metric.value
+
+
+@pytest.mark.parametrize("name", list(CLASSIFICATION) + list(REGRESSION) + list(RANKING))
+def test_metrics_update(benchmark, size, name):
+    preds, labels, scores, relevant = predictions(size)
+    if name in REGRESSION:
+        factory, preds, labels = REGRESSION[name], preds.astype(float), labels.astype(float)
+    elif name in RANKING:
+        factory, preds, labels = RANKING[name], scores, relevant
+    else:
+        factory = CLASSIFICATION[name]
+
+    benchmark.group = "metrics-" + name
+    benchmark.extra_info["rows"] = size
+    benchmark.pedantic(_update, setup=lambda: ((factory(), preds, labels), {}),
+        rounds=rounds(size))
+
+
+def test_TemporalPyGTransform(benchmark, size):
+    torch = pytest.importorskip("torch")
+    pyg = pytest.importorskip("torch_geometric")
+    from pyTigerGraph.gds.transforms.pyg_transforms import TemporalPyGTransform
+
+    numSteps = 10
+    gen = torch.Generator().manual_seed(42)
+    data = pyg.data.Data()
+    data.x = torch.rand(size, 4, generator=gen)
+    data.edge_index = torch.randint(0, size, (2, size), generator=gen)
+    data.vertex_start = torch.randint(0, numSteps, (size,), generator=gen)
+    data.vertex_end = data.vertex_start + torch.randint(1, numSteps, (size,), generator=gen)
+    data.edge_start = torch.randint(0, numSteps, (size,), generator=gen)
+    data.edge_end = data.edge_start + torch.randint(1, numSteps, (size,), generator=gen)
+    transform = TemporalPyGTransform(vertex_start_attrs="vertex_start",
+        vertex_end_attrs="vertex_end", edge_start_attrs="edge_start", edge_end_attrs="edge_end",
+        start_dt=0, end_dt=numSteps, timestep=1)
+
+    benchmark.group = "TemporalPyGTransform"
+    benchmark.extra_info["rows"] = size
+    benchmark.pedantic(transform, setup=lambda: ((data.clone(),), {}), rounds=rounds(size))
@@ -0,0 +1,40 @@
+"""Benchmarks of parsing the batches of the GDS data loaders."""
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+pytest.importorskip("pandas")
+
+from synthetic import edgeBatch, graphBatch, loaderArgs, vertexBatch
+from pyTigerGraph.gds.dataloaders import BaseLoader
+
+# The packages required by each output format, in addition to pandas
+OUT_FORMATS = {
+    "dataframe": [],
+    "pyg": ["torch", "torch_geometric"],
+    "dgl": ["torch", "dgl"],
+    "spektral": ["tensorflow", "scipy", "spektral"]
+}
+COMBINATIONS = [("vertex", "dataframe"), ("edge", "dataframe")] + \
+    [("graph", f) for f in OUT_FORMATS]
+
+
+@pytest.mark.parametrize("hetero", [False, True], ids=["homo", "hetero"])
+@pytest.mark.parametrize("inFormat,outFormat", COMBINATIONS,
+    ids=["-".join(c) for c in COMBINATIONS])
+def test_parse_data(benchmark, size, inFormat, outFormat, hetero):
+    for module in OUT_FORMATS[outFormat]:
+        pytest.importorskip(module)
+    if outFormat == "spektral" and hetero:
+        pytest.skip("Heterogeneous graphs are not supported in spektral format.")
+
+    if inFormat == "vertex":
+        raw = vertexBatch(size, hetero)
+    elif inFormat == "edge":
+        raw = edgeBatch(size, hetero=hetero)
+    else:
+        raw = graphBatch(size, hetero)
+    args = loaderArgs(inFormat, hetero)
+
+    benchmark.group = "parse_data-{}-{}".format(inFormat, outFormat)
+    benchmark.extra_info["rows"] = size
+    benchmark(BaseLoader._parse_data, raw, in_format=inFormat, out_format=outFormat, **args)
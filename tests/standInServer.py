@@ -0,0 +1,1182 @@
+"""Stand-in TigerGraph Server
+
+An in-memory stand-in for the REST++ and GSQL server endpoints used by pyTigerGraph, so that
+client-side code (parsing, upserts, loaders, etc.) can be tested and benchmarked offline on a single
+machine, without a TigerGraph database.
+
+The server keeps the schema and the data of a single graph in memory and serves the following
+endpoints on one port (use it as both `restppPort` and `gsPort`):
+
+- `/echo`, `/requesttoken` and `/endpoints`
+- `/graph` (upserting, listing and deleting vertices and edges, with simple filters)
+- `/builtins` (`stat_vertex_number`, `stat_edge_number`, `stat_vertex_attr`, `stat_edge_attr`)
+- `/ddl` (loading jobs registered with `addLoadingJob()`)
+- `/query` (queries registered with `addQuery()` and the GDS loader queries, see below)
+- `/gsqlserver/gsql/file` (`CREATE QUERY`, `INSTALL QUERY`, `DROP QUERY`, `CREATE SECRET` and
+    `ADD ATTRIBUTE` schema changes), `/gsqlserver/gsql/schema`, `/gsqlserver/gsql/udtlist` and
+    `/gsqlserver/gsql/userdefinedfunction`
+
+The GDS vertex, edge, graph and neighbor loader queries are emulated once installed (with
+`INSTALL QUERY` via `gsql()`): the `@@v_batch += (...)` and `@@e_batch += (...)` statements of the
+query text are evaluated on the in-memory graph, so the batches have the same format as the output of
+the real queries. Sampling is deterministic for a given `seed`.
+
+The paging queries of `iterVertices()` and `iterEdges()` are emulated the same way. Like the real
+queries, each page is selected by scanning and sorting all vertices of the (source) vertex type, so
+the cost of a page grows with the size of the type.
+
+Authentication is not checked, and queries always run synchronously.
+
+Example:
+    ----
+    with StandInServer() as server:
+        server.addVertexType("Person", {"age": "INT", "emb": "LIST<DOUBLE>"})
+        server.addEdgeType("Knows", "Person", "Person", {"since": "DATETIME"}, directed=False)
+        server.addVertices("Person", [("alice", {"age": 30}), ("bob", {"age": 40})])
+        server.addEdges("Knows", [("alice", "bob", {"since": "2020-01-01 00:00:00"})])
+        conn = server.connection()
+        conn.getVertexCount("Person")
+    ----
+"""
+import calendar
+import json
+import math
+import random
+import re
+import secrets
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Iterable, Union
+from urllib.parse import parse_qs, unquote, unquote_plus, urlsplit
+
+from pyTigerGraph import TigerGraphConnection
+
+DEFAULTS = {
+    "INT": 0,
+    "UINT": 0,
+    "FLOAT": 0.0,
+    "DOUBLE": 0.0,
+    "BOOL": False,
+    "STRING": "",
+    "DATETIME": "1970-01-01 00:00:00"
+}
+NUMERIC = ("INT", "UINT", "FLOAT", "DOUBLE")
+
+CREATE_QUERY = re.compile(r"CREATE\s+(?:OR\s+REPLACE\s+)?(?:DISTRIBUTED\s+)?QUERY\s+(\w+)\s*\(",
+    re.IGNORECASE)
+INSTALL_QUERY = re.compile(r"^\s*INSTALL\s+QUERY\s+(?:-\w+\s+)*(.+?)\s*$",
+    re.IGNORECASE | re.MULTILINE)
+DROP_QUERY = re.compile(r"^\s*DROP\s+QUERY\s+(.+?)\s*$", re.IGNORECASE | re.MULTILINE)
+CREATE_SECRET = re.compile(r"^\s*CREATE\s+SECRET\s*(\w*)\s*$", re.IGNORECASE | re.MULTILINE)
+ADD_ATTRIBUTE = re.compile(r"ALTER\s+(VERTEX|EDGE)\s+(\w+)\s+ADD\s+ATTRIBUTE\s*\((.+?)\)\s*;",
+    re.IGNORECASE)
+RUN_SCHEMA_CHANGE = re.compile(r"^\s*RUN\s+(GLOBAL\s+)?SCHEMA_CHANGE\s+JOB", re.IGNORECASE | re.MULTILINE)
+BATCH = re.compile(r'(?:IF\s+(\w)\.type\s*==\s*"([^"]+)"\s+THEN\s+)?'
+    r"@@(v|e)_batch\s*\+=\s*\((.+)\)\s*[,;]?\s*$", re.MULTILINE)
+CONDITION = re.compile(r"^\s*(\w+)\s*(>=|<=|!=|=|>|<)\s*(.*?)\s*$")
+LOADERS = ("vertex_loader", "edge_loader", "graph_loader", "neighbor_loader")
+PAGING = ("iterVertices", "iterEdges")
+GSQL_CONDITION = re.compile(r"^\s*\w\.(\w+)\s*(==|!=|>=|<=|>|<)\s*(?:to_datetime\((.*)\)|(.*?))\s*$")
+MIN_INT = -2 ** 63
+
+
+class StandInError(Exception):
+    """An error reported in the JSON response (`"error": true`) rather than as HTTP status."""
+
+    def __init__(self, message: str, code: str = "REST-30000") -> None:
+        """NO DOC"""
+        super().__init__(message)
+        self.message = message
+        self.code = code
+
+
+class NotFoundError(StandInError):
+    """An error reported with HTTP status 404."""
+
+
+def _attributeType(attrType: str) -> dict:
+    """Converts a GSQL attribute type (e.g. `LIST<INT>` or `MAP<STRING,DOUBLE>`) to schema metadata."""
+    attrType = attrType.strip().upper().replace(" ", "")
+    m = re.match(r"^(LIST|SET)<(\w+)>$", attrType)
+    if m:
+        return {"Name": m.group(1), "ValueTypeName": m.group(2)}
+    m = re.match(r"^MAP<(\w+),(\w+)>$", attrType)
+    if m:
+        return {"Name": "MAP", "KeyTypeName": m.group(1), "ValueTypeName": m.group(2)}
+    if attrType == "MAP":
+        return {"Name": "MAP", "KeyTypeName": "STRING", "ValueTypeName": "STRING"}
+    if attrType == "STRINGCOMPRESS":
+        attrType = "STRING"
+    return {"Name": attrType}
+
+
+def _default(attrType: dict) -> object:
+    if attrType["Name"] in ("LIST", "SET"):
+        return []
+    if attrType["Name"] == "MAP":
+        return {}
+    return DEFAULTS.get(attrType["Name"], "")
+
+
+def _convert(value: object, attrType: dict) -> object:
+    """Converts an (upserted or loaded) value to the Python representation of the attribute type."""
+    name = attrType["Name"]
+    if name in ("INT", "UINT"):
+        return int(value)
+    if name in ("FLOAT", "DOUBLE"):
+        return float(value)
+    if name == "BOOL":
+        if isinstance(value, str):
+            return value.strip().lower() in ("true", "1", "t")
+        return bool(value)
+    if name in ("LIST", "SET"):
+        if isinstance(value, str):
+            value = value.split() if value else []
+        return [_convert(v, {"Name": attrType["ValueTypeName"]}) for v in value]
+    if name == "MAP":
+        if isinstance(value, list):
+            # [{"key": k, "value": v}] (REST++) format
+            value = {v["key"]: v["value"] for v in value}
+        return {k: _convert(v, {"Name": attrType["ValueTypeName"]}) for k, v in value.items()}
+    return str(value)
+
+
+def _stringify(value: object) -> str:
+    """Formats a value like the GSQL `stringify()` function."""
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, float):
+        ret = repr(value)
+        return ret[:-2] if ret.endswith(".0") else ret
+    if isinstance(value, (list, tuple)):
+        return " ".join(_stringify(v) for v in value)
+    if isinstance(value, dict):
+        return "".join("({},{}) ".format(_stringify(k), _stringify(v)) for k, v in value.items())
+    return str(value)
+
+
+def _epoch(value: str) -> int:
+    return calendar.timegm(time.strptime(value, "%Y-%m-%d %H:%M:%S"))
+
+
+def _splitTerms(expr: str) -> list:
+    """Splits a GSQL string expression into its top level `+` separated terms."""
+    terms = []
+    depth = 0
+    quoted = False
+    escaped = False
+    start = 0
+    for i, c in enumerate(expr):
+        if quoted:
+            if escaped:
+                escaped = False
+            elif c == "\\":
+                escaped = True
+            elif c == '"':
+                quoted = False
+        elif c == '"':
+            quoted = True
+        elif c == "(":
+            depth += 1
+        elif c == ")":
+            depth -= 1
+        elif c == "+" and depth == 0:
+            terms.append(expr[start:i].strip())
+            start = i + 1
+    terms.append(expr[start:].strip())
+    return terms
+
+
+def _compileTerm(term: str) -> Callable:
+    """Compiles a term of a loader query's batch expression into a function of the row context.
+
+    The context maps the aliases of the query (`s`, `t`, `e`) to `(type, attributes, vid)` tuples,
+    and `delimiter` to the delimiter of the request.
+    """
+    if term.startswith('"'):
+        literal = json.loads(term)
+        return lambda ctx: literal
+    if term.startswith("(") and term.endswith(")"):
+        terms = [_compileTerm(t) for t in _splitTerms(term[1:-1])]
+        return lambda ctx: "".join(_stringify(f(ctx)) for f in terms)
+    if term == "delimiter":
+        return lambda ctx: ctx["delimiter"]
+    m = re.match(r"^(\w+)\((.*)\)$", term)
+    if m:
+        func, inner = m.group(1), _compileTerm(m.group(2).strip())
+        if func == "stringify":
+            return lambda ctx: _stringify(inner(ctx))
+        if func == "getvid":
+            return lambda ctx: inner(ctx)[2]
+        if func == "datetime_to_epoch":
+            return lambda ctx: _epoch(inner(ctx))
+        raise ValueError("Function {} is not supported by the stand-in server.".format(func))
+    m = re.match(r"^(\w)\.(\w+)$", term)
+    if m:
+        alias, attr = m.group(1), m.group(2)
+        if attr == "type":
+            return lambda ctx: ctx[alias][0]
+        return lambda ctx: ctx[alias][1][attr]
+    if re.match(r"^\w$", term):
+        return lambda ctx: ctx[term]
+    raise ValueError("Expression {} is not supported by the stand-in server.".format(term))
+
+
+def _compileFormats(queryText: str) -> dict:
+    """Returns the line formats of the batches printed by a GDS loader query.
+
+    The keys are `(kind, type, flag)` tuples, where kind is "v" (vertex batch) or "e" (edge batch),
+    type is the vertex or edge type (or `None` if the line does not depend on the type) and flag is
+    the seed flag of the neighbor loaders ("1" for seeds, "0" for other vertices, `None` if the line
+    has no flag).
+    """
+    formats = {}
+    for m in BATCH.finditer(queryText):
+        terms = _splitTerms(m.group(4))
+        flag = None
+        if terms[-1] in ('"1\\n"', '"0\\n"'):
+            flag = terms[-1][1]
+        funcs = [_compileTerm(t) for t in terms]
+        formats.setdefault((m.group(3), m.group(2), flag), funcs)
+    return formats
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+    def _respond(self, method: str) -> None:
+        url = urlsplit(self.path)
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        params = parse_qs(url.query, keep_blank_values=True)
+        status = 200
+        contentType = "application/json"
+        try:
+            ret = self.server.standIn._route(method, unquote(url.path), params, body, self.headers)
+            if isinstance(ret, str):
+                contentType = "text/plain"
+                payload = ret.encode("utf-8")
+            else:
+                payload = json.dumps(ret).encode("utf-8")
+        except StandInError as e:
+            if isinstance(e, NotFoundError):
+                status = 404
+            payload = json.dumps({"version": {"edition": "enterprise", "api": "v2"},
+                "error": True, "message": e.message, "code": e.code}).encode("utf-8")
+        except Exception as e:
+            status = 500
+            payload = json.dumps({"error": True, "message": repr(e)}).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", contentType)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self) -> None:
+        self._respond("GET")
+
+    def do_POST(self) -> None:
+        self._respond("POST")
+
+    def do_PUT(self) -> None:
+        self._respond("PUT")
+
+    def do_DELETE(self) -> None:
+        self._respond("DELETE")
+
+
+class StandInServer:
+    """In-memory stand-in for a TigerGraph server with a single graph.
+
+    Args:
+        graphname (str, optional):
+            The name of the graph. Defaults to "tests".
+        host (str, optional):
+            The address the server listens on. Defaults to "127.0.0.1".
+        port (int, optional):
+            The port the server listens on. Defaults to 0, i.e. a free port picked by the OS.
+        seed (int, optional):
+            Seed of the random number generator used for shuffling and neighbor sampling.
+    """
+
+    def __init__(self, graphname: str = "tests", host: str = "127.0.0.1", port: int = 0,
+            seed: int = 0) -> None:
+        """NO DOC"""
+        self.graphname = graphname
+        self.host = host
+        self.port = port
+        self.seed = seed
+        self.schema = {"GraphName": graphname, "VertexTypes": [], "EdgeTypes": [], "UDTs": []}
+        self.vertices = {}  # type -> {primary id: attributes}
+        self.edges = {}  # type -> {(from type, from id, to type, to id): attributes}
+        self.queries = {}  # name -> {"handler", "text", "formats", "installed"}
+        self.loadingJobs = {}  # (job name, file tag) -> mapper
+        self.requestCounts = {}  # "METHOD /endpoint" -> number of requests
+        self._vids = {}  # (type, primary id) -> internal ID
+        self._adjacency = {}  # (type, primary id) -> {(edge type, edge key, reversed)}
+        self._nextVid = 0
+        self._random = random.Random(seed)
+        self._lock = threading.RLock()
+        self._httpd = None
+        self._thread = None
+
+    # Server lifecycle
+
+    def start(self) -> "StandInServer":
+        """Starts serving requests in a background thread.
+
+        Returns:
+            The server itself.
+        """
+        self._httpd = ThreadingHTTPServer((self.host, self.port), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.standIn = self
+        self.port = self._httpd.server_address[1]
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True,
+            name="pyTigerGraph-stand-in-server")
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stops the server."""
+        if self._httpd:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._thread.join()
+            self._httpd = None
+            self._thread = None
+
+    def __enter__(self) -> "StandInServer":
+        return self.start()
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    @property
+    def url(self) -> str:
+        """The base URL of the server."""
+        return "http://{}:{}".format(self.host, self.port)
+
+    def connection(self, **kwargs) -> TigerGraphConnection:
+        """Returns a connection to the server.
+
+        Args:
+            kwargs:
+                Additional arguments of `TigerGraphConnection`.
+        """
+        return TigerGraphConnection(host="http://" + self.host, graphname=self.graphname,
+            restppPort=self.port, gsPort=self.port, **kwargs)
+
+    # Schema
+
+    def addVertexType(self, name: str, attributes: dict = None, primaryIdType: str = "STRING",
+            primaryIdAsAttribute: bool = False, primaryIdName: str = "id") -> None:
+        """Adds a vertex type to the schema.
+
+        Args:
+            name:
+                The name of the vertex type.
+            attributes:
+                The attributes as `name: GSQL type` pairs, e.g. `{"x": "LIST<DOUBLE>"}`.
+            primaryIdType:
+                The type of the primary ID.
+            primaryIdAsAttribute:
+                If `True`, the primary ID is also an attribute (`WITH primary_id_as_attribute`).
+            primaryIdName:
+                The name of the primary ID.
+        """
+        with self._lock:
+            self.schema["VertexTypes"].append({
+                "Name": name,
+                "PrimaryId": {
+                    "AttributeName": primaryIdName,
+                    "AttributeType": _attributeType(primaryIdType),
+                    "PrimaryIdAsAttribute": primaryIdAsAttribute
+                },
+                "Attributes": [{"AttributeName": k, "AttributeType": _attributeType(v)}
+                    for k, v in (attributes or {}).items()],
+                "Config": {"STATS": "OUTDEGREE_BY_EDGETYPE", "PRIMARY_ID_AS_ATTRIBUTE":
+                    primaryIdAsAttribute},
+                "IsLocal": True
+            })
+            self.vertices.setdefault(name, {})
+
+    def addEdgeType(self, name: str, fromType: str, toType: str, attributes: dict = None,
+            directed: bool = True, reverseEdge: str = None) -> None:
+        """Adds an edge type to the schema.
+
+        Args:
+            name:
+                The name of the edge type.
+            fromType:
+                The source vertex type.
+            toType:
+                The target vertex type.
+            attributes:
+                The attributes as `name: GSQL type` pairs.
+            directed:
+                Whether the edge type is directed.
+            reverseEdge:
+                The name of the reverse edge type of a directed edge type (only recorded in the
+                schema).
+        """
+        with self._lock:
+            self.schema["EdgeTypes"].append({
+                "Name": name,
+                "FromVertexTypeName": fromType,
+                "ToVertexTypeName": toType,
+                "IsDirected": directed,
+                "Attributes": [{"AttributeName": k, "AttributeType": _attributeType(v)}
+                    for k, v in (attributes or {}).items()],
+                "Config": {"REVERSE_EDGE": reverseEdge} if reverseEdge else {},
+                "IsLocal": True
+            })
+            self.edges.setdefault(name, {})
+
+    def _vertexType(self, name: str) -> dict:
+        for vt in self.schema["VertexTypes"]:
+            if vt["Name"] == name:
+                return vt
+        raise StandInError("The input vertex type {} is not a valid vertex type.".format(name),
+            "REST-30000")
+
+    def _edgeType(self, name: str) -> dict:
+        for et in self.schema["EdgeTypes"]:
+            if et["Name"] == name:
+                return et
+        raise StandInError("The input edge type {} is not a valid edge type.".format(name),
+            "REST-30000")
+
+    def _attributeTypes(self, typeDef: dict) -> dict:
+        ret = {a["AttributeName"]: a["AttributeType"] for a in typeDef["Attributes"]}
+        if typeDef.get("PrimaryId", {}).get("PrimaryIdAsAttribute"):
+            ret[typeDef["PrimaryId"]["AttributeName"]] = typeDef["PrimaryId"]["AttributeType"]
+        return ret
+
+    def _addAttribute(self, kind: str, typeName: str, attrName: str, attrType: str) -> None:
+        typeDef = self._vertexType(typeName) if kind == "VERTEX" else self._edgeType(typeName)
+        if attrName in self._attributeTypes(typeDef):
+            raise StandInError("Attribute {} already exists in {}.".format(attrName, typeName))
+        attrType = _attributeType(attrType)
+        typeDef["Attributes"].append({"AttributeName": attrName, "AttributeType": attrType})
+        elements = self.vertices[typeName] if kind == "VERTEX" else self.edges[typeName]
+        for attrs in elements.values():
+            attrs[attrName] = _default(attrType)
+
+    # Data
+
+    def _upsertVertex(self, vertexType: str, vertexId: str, attributes: dict = None) -> bool:
+        typeDef = self._vertexType(vertexType)
+        types = self._attributeTypes(typeDef)
+        vertexId = str(vertexId)
+        vertices = self.vertices[vertexType]
+        current = vertices.get(vertexId)
+        created = current is None
+        if created:
+            current = {k: _default(v) for k, v in types.items()}
+            if typeDef["PrimaryId"].get("PrimaryIdAsAttribute"):
+                current[typeDef["PrimaryId"]["AttributeName"]] = _convert(vertexId,
+                    typeDef["PrimaryId"]["AttributeType"])
+            vertices[vertexId] = current
+            self._vids[(vertexType, vertexId)] = self._nextVid
+            self._nextVid += 1
+        self._update(current, types, attributes or {})
+        return created
+
+    def _upsertEdge(self, edgeType: str, fromType: str, fromId: str, toType: str, toId: str,
+            attributes: dict = None) -> None:
+        typeDef = self._edgeType(edgeType)
+        types = self._attributeTypes(typeDef)
+        fromId, toId = str(fromId), str(toId)
+        for vt, vid in ((fromType, fromId), (toType, toId)):
+            if vid not in self.vertices.get(vt, {}):
+                self._upsertVertex(vt, vid)
+        key = (fromType, fromId, toType, toId)
+        edges = self.edges[edgeType]
+        current = edges.get(key)
+        if current is None:
+            current = edges[key] = {k: _default(v) for k, v in types.items()}
+            self._adjacency.setdefault((fromType, fromId), set()).add((edgeType, key, False))
+            if not typeDef["IsDirected"]:
+                self._adjacency.setdefault((toType, toId), set()).add((edgeType, key, True))
+        self._update(current, types, attributes or {})
+
+    @staticmethod
+    def _update(current: dict, types: dict, attributes: dict) -> None:
+        for k, v in attributes.items():
+            if k not in types:
+                raise StandInError("Unknown attribute {}.".format(k), "REST-30200")
+            op = None
+            if isinstance(v, dict) and "value" in v:
+                op = v.get("op")
+                v = v["value"]
+            v = _convert(v, types[k])
+            if op in ("add", "+"):
+                if isinstance(v, dict):
+                    current[k] = {**current[k], **v}
+                else:
+                    current[k] = current[k] + v
+            elif op == "max":
+                current[k] = max(current[k], v)
+            elif op == "min":
+                current[k] = min(current[k], v)
+            else:
+                current[k] = v
+
+    def _deleteVertex(self, vertexType: str, vertexId: str) -> None:
+        del self.vertices[vertexType][vertexId]
+        del self._vids[(vertexType, vertexId)]
+        for edgeType, key, _ in list(self._adjacency.pop((vertexType, vertexId), ())):
+            self._deleteEdge(edgeType, key)
+        for et in self.edges:
+            for key in [k for k in self.edges[et] if k[2] == vertexType and k[3] == vertexId]:
+                self._deleteEdge(et, key)
+
+    def _deleteEdge(self, edgeType: str, key: tuple) -> None:
+        if self.edges[edgeType].pop(key, None) is None:
+            return
+        self._adjacency.get((key[0], key[1]), set()).discard((edgeType, key, False))
+        self._adjacency.get((key[2], key[3]), set()).discard((edgeType, key, True))
+
+    def addVertices(self, vertexType: str, vertices: Iterable[Union[tuple, str]]) -> None:
+        """Adds (upserts) vertices without going through the REST++ endpoint.
+
+        Args:
+            vertexType:
+                The vertex type.
+            vertices:
+                The primary IDs or `(primary ID, attributes)` tuples of the vertices.
+        """
+        with self._lock:
+            for v in vertices:
+                if isinstance(v, tuple):
+                    self._upsertVertex(vertexType, v[0], v[1])
+                else:
+                    self._upsertVertex(vertexType, v)
+
+    def addEdges(self, edgeType: str, edges: Iterable[tuple]) -> None:
+        """Adds (upserts) edges without going through the REST++ endpoint.
+
+        Missing source and target vertices are created with default attribute values.
+
+        Args:
+            edgeType:
+                The edge type.
+            edges:
+                `(source ID, target ID)` or `(source ID, target ID, attributes)` tuples.
+        """
+        with self._lock:
+            typeDef = self._edgeType(edgeType)
+            for e in edges:
+                self._upsertEdge(edgeType, typeDef["FromVertexTypeName"], e[0],
+                    typeDef["ToVertexTypeName"], e[1], e[2] if len(e) > 2 else None)
+
+    def addQuery(self, name: str, handler: Callable) -> None:
+        """Adds an installed query.
+
+        Args:
+            name:
+                The name of the query.
+            handler:
+                A function called with the server and the query parameters (a dictionary) that
+                returns the output (a list) of the query.
+        """
+        with self._lock:
+            self.queries[name] = {"handler": handler, "text": None, "formats": None,
+                "installed": True}
+
+    def addLoadingJob(self, jobName: str, fileTag: str, mapper: Callable) -> None:
+        """Adds a loading job.
+
+        Args:
+            jobName:
+                The name of the loading job.
+            fileTag:
+                The name of the file variable of the loading job.
+            mapper:
+                A function called with the fields of a line of the loaded file that returns the data
+                to be upserted, in the format of `upsertData()`. Lines for which the function raises
+                an exception are rejected.
+        """
+        with self._lock:
+            self.loadingJobs[(jobName, fileTag)] = mapper
+
+    # Routing
+
+    def _route(self, method: str, path: str, params: dict, body: bytes, headers) -> object:
+        parts = [p for p in path.split("/") if p]
+        if parts and parts[0] == "restpp":
+            parts = parts[1:]
+        if not parts:
+            raise NotFoundError("Endpoint is not found from url = " + path, "REST-1000")
+        endpoint = parts[0] if parts[0] != "gsqlserver" else "/".join(parts[:3])
+        key = method + " /" + endpoint
+        with self._lock:
+            self.requestCounts[key] = self.requestCounts.get(key, 0) + 1
+        queryParams = {k: (v if len(v) > 1 else v[0]) for k, v in params.items()}
+        params = {k: v[-1] for k, v in params.items()}
+        if len(parts) > 1 and parts[0] not in ("gsqlserver", "requesttoken") and \
+                parts[1] != self.graphname:
+            raise StandInError("Graph {} does not exist.".format(parts[1]), "REST-1004")
+
+        if endpoint == "echo":
+            return self._ok(message="Hello GSQL")
+        if endpoint == "requesttoken":
+            return self._requestToken(method, params, body)
+        if endpoint == "endpoints":
+            return self._endpoints(params)
+        if endpoint == "graph":
+            return self._graph(method, parts[2:], params, body)
+        if endpoint == "builtins" and method == "POST":
+            return self._builtins(json.loads(body or b"{}"))
+        if endpoint == "ddl" and method == "POST":
+            return self._ddl(params, body)
+        if endpoint == "query" and len(parts) == 3:
+            if method == "POST":
+                queryParams = json.loads(body) if body else {}
+            return self._ok(self._runQuery(parts[2], queryParams))
+        if endpoint == "gsqlserver/gsql/file" and method == "POST":
+            return self._gsql(unquote_plus(body.decode("utf-8")))
+        if endpoint == "gsqlserver/gsql/schema":
+            with self._lock:
+                return self._ok(json.loads(json.dumps(self.schema)))
+        if endpoint == "gsqlserver/gsql/udtlist":
+            return self._ok([])
+        if endpoint == "gsqlserver/gsql/userdefinedfunction":
+            if params.get("filename") == "ExprUtil":
+                return self._ok("class KafkaProducer {};")
+            return self._ok("inline int64_t init_kafka_producer() { return 0; }")
+        raise NotFoundError("Endpoint is not found from url = " + path, "REST-1000")
+
+    @staticmethod
+    def _ok(results: object = None, message: str = "") -> dict:
+        return {"version": {"edition": "enterprise", "api": "v2", "schema": 0}, "error": False,
+            "message": message, "results": results}
+
+    def _requestToken(self, method: str, params: dict, body: bytes) -> dict:
+        if body:
+            params = {**params, **json.loads(body)}
+        lifetime = int(params.get("lifetime") or 2592000)
+        token = params.get("token") or secrets.token_hex(16)
+        if method == "DELETE":
+            return {"code": "REST-0000", "error": False, "message": "Successfully deleted token."}
+        return {"code": "REST-0000", "expiration": int(time.time()) + lifetime, "error": False,
+            "message": "Generate new token successfully.", "token": token}
+
+    def _endpoints(self, params: dict) -> dict:
+        ret = {}
+        if params.get("builtin") == "true":
+            for ep in ("GET /echo", "POST /builtins/{graph_name}", "POST /ddl/{graph_name}",
+                    "GET /endpoints/{graph_name}", "POST /graph/{graph_name}",
+                    "GET /graph/{graph_name}/vertices/{vertex_type}",
+                    "GET /graph/{graph_name}/edges/{source_vertex_type}/{source_vertex_id}"):
+                ret[ep] = {"parameters": {}}
+        if params.get("dynamic") == "true":
+            with self._lock:
+                for name, q in self.queries.items():
+                    if q["installed"]:
+                        for m in ("GET", "POST"):
+                            ret["{} /query/{}/{}".format(m, self.graphname, name)] = {
+                                "enabled": True, "parameters": {}, "readDataList": {}}
+        return ret
+
+    # /graph
+
+    def _graph(self, method: str, parts: list, params: dict, body: bytes) -> dict:
+        if not parts:
+            if method != "POST":
+                raise NotFoundError("Endpoint is not found.", "REST-1000")
+            return self._ok([self._upsert(json.loads(body), params)])
+        with self._lock:
+            if parts[0] == "vertices" and len(parts) in (2, 3):
+                vertexType = parts[1]
+                self._vertexType(vertexType)
+                if len(parts) == 3:
+                    ids = [parts[2]] if parts[2] in self.vertices[vertexType] else []
+                    if not ids:
+                        raise StandInError("Input vertex id '{}' is not a valid vertex id for vertex"
+                            " type = {}.".format(parts[2], vertexType), "REST-30000")
+                else:
+                    ids = [i for i, a in self.vertices[vertexType].items()
+                        if self._matches(a, params.get("filter"))]
+                    if params.get("limit"):
+                        ids = ids[:int(params["limit"])]
+                if method == "DELETE":
+                    for i in ids:
+                        self._deleteVertex(vertexType, i)
+                    return self._ok({"v_type": vertexType, "deleted_vertices": len(ids)})
+                if params.get("count_only") == "true":
+                    return self._ok([{"v_type": vertexType, "count": len(ids)}])
+                select = [s for s in params.get("select", "").split(",") if s]
+                if select and "-_" in select[0]:
+                    select = []
+                return self._ok([{"v_id": i, "v_type": vertexType, "attributes":
+                    self._attributes(self.vertices[vertexType][i], select)} for i in ids])
+            if parts[0] == "edges" and 3 <= len(parts) <= 6:
+                keys = [(et, k, r) for et, k, r in self._edgesFrom(*parts[1:])
+                    if self._matches(self.edges[et][k], params.get("filter"))]
+                if params.get("limit"):
+                    keys = keys[:int(params["limit"])]
+                if method == "DELETE":
+                    counts = {}
+                    for et, k, _ in keys:
+                        self._deleteEdge(et, k)
+                        counts[et] = counts.get(et, 0) + 1
+                    return self._ok([{"e_type": et, "deleted_edges": n} for et, n in counts.items()])
+                if params.get("count_only") == "true":
+                    counts = {}
+                    for et, _, _ in keys:
+                        counts[et] = counts.get(et, 0) + 1
+                    return self._ok([{"e_type": et, "count": n} for et, n in counts.items()])
+                select = [s for s in params.get("select", "").split(",") if s]
+                ret = []
+                for et, k, r in keys:
+                    s, t = ((k[2], k[3]), (k[0], k[1])) if r else ((k[0], k[1]), (k[2], k[3]))
+                    ret.append({"e_type": et, "directed": self._edgeType(et)["IsDirected"],
+                        "from_id": s[1], "from_type": s[0], "to_id": t[1], "to_type": t[0],
+                        "attributes": self._attributes(self.edges[et][k], select)})
+                return self._ok(ret)
+        raise NotFoundError("Endpoint is not found.", "REST-1000")
+
+    def _edgesFrom(self, fromType: str, fromId: str, edgeType: str = "_", toType: str = "_",
+            toId: str = None) -> list:
+        # Returns (edge type, edge key, reversed) tuples; undirected edges are listed from both of
+        # their endpoints.
+        ret = []
+        for et, key, reverse in sorted(self._adjacency.get((fromType, fromId), ())):
+            target = (key[0], key[1]) if reverse else (key[2], key[3])
+            if edgeType not in ("_", "*", et) or toType not in ("_", "*", target[0]) or \
+                    (toId is not None and toId != target[1]):
+                continue
+            ret.append((et, key, reverse))
+        return ret
+
+    @staticmethod
+    def _attributes(attrs: dict, select: list) -> dict:
+        if select:
+            return {k: v for k, v in attrs.items() if k in select}
+        return dict(attrs)
+
+    @staticmethod
+    def _matches(attrs: dict, where: str) -> bool:
+        if not where:
+            return True
+        for cond in where.split(","):
+            m = CONDITION.match(cond)
+            if not m:
+                raise StandInError("Invalid filter: {}".format(cond), "REST-30000")
+            attr, op, value = m.groups()
+            if attr not in attrs:
+                raise StandInError("Unknown attribute {} in filter.".format(attr), "REST-30000")
+            actual = attrs[attr]
+            if value.startswith('"') and value.endswith('"'):
+                value = value[1:-1]
+            elif isinstance(actual, bool):
+                value = value.lower() in ("true", "1")
+            elif isinstance(actual, (int, float)):
+                value = float(value)
+            if op == "=" and not actual == value or op == "!=" and not actual != value \
+                    or op == ">" and not actual > value or op == "<" and not actual < value \
+                    or op == ">=" and not actual >= value or op == "<=" and not actual <= value:
+                return False
+        return True
+
+    def _upsert(self, data: dict, params: dict) -> dict:
+        vertexMustExist = params.get("vertex_must_exist") in ("true", "True")
+        newVertexOnly = params.get("new_vertex_only") in ("true", "True")
+        updateVertexOnly = params.get("update_vertex_only") in ("true", "True")
+        acceptedVertices = 0
+        acceptedEdges = 0
+        skippedEdges = 0
+        with self._lock:
+            for vt, vertices in data.get("vertices", {}).items():
+                for vid, attrs in vertices.items():
+                    exists = str(vid) in self.vertices.get(vt, {})
+                    if (newVertexOnly and exists) or (updateVertexOnly and not exists):
+                        continue
+                    self._upsertVertex(vt, vid, attrs)
+                    acceptedVertices += 1
+            for st, sources in data.get("edges", {}).items():
+                for sid, edgeTypes in sources.items():
+                    for et, targets in edgeTypes.items():
+                        for tt, tids in targets.items():
+                            for tid, attrs in tids.items():
+                                if vertexMustExist and (str(sid) not in self.vertices.get(st, {})
+                                        or str(tid) not in self.vertices.get(tt, {})):
+                                    skippedEdges += 1
+                                    continue
+                                self._upsertEdge(et, st, sid, tt, tid, attrs)
+                                acceptedEdges += 1
+        ret = {"accepted_vertices": acceptedVertices, "accepted_edges": acceptedEdges}
+        if skippedEdges:
+            ret["skipped_edges"] = skippedEdges
+        return ret
+
+    # /builtins
+
+    def _builtins(self, data: dict) -> dict:
+        function = data.get("function")
+        typeName = data.get("type", "*")
+        with self._lock:
+            if function == "stat_vertex_number":
+                types = list(self.vertices) if typeName == "*" else [typeName]
+                for t in types:
+                    self._vertexType(t)
+                return self._ok([{"v_type": t, "count": len(self.vertices[t])} for t in types])
+            if function == "stat_edge_number":
+                types = list(self.edges) if typeName == "*" else [typeName]
+                ret = []
+                for t in types:
+                    self._edgeType(t)
+                    ret.append({"e_type": t, "count": sum(1 for k in self.edges[t]
+                        if data.get("from_type", "*") in ("*", k[0])
+                        and data.get("to_type", "*") in ("*", k[2]))})
+                return self._ok(ret)
+            if function in ("stat_vertex_attr", "stat_edge_attr"):
+                isVertex = function == "stat_vertex_attr"
+                typeDef = self._vertexType(typeName) if isVertex else self._edgeType(typeName)
+                elements = (self.vertices if isVertex else self.edges)[typeName].values()
+                if not elements:
+                    raise StandInError("{} is skip".format(function) if isVertex
+                        else "No valid edge for the input edge type.", "REST-30000")
+                stats = {}
+                for attr in typeDef["Attributes"]:
+                    name, attrType = attr["AttributeName"], attr["AttributeType"]["Name"]
+                    values = [e[name] for e in elements]
+                    if attrType == "BOOL":
+                        trues = sum(1 for v in values if v)
+                        stats[name] = {"TRUE": trues, "FALSE": len(values) - trues}
+                    elif attrType in NUMERIC:
+                        stats[name] = {"MAX": max(values), "MIN": min(values),
+                            "AVG": sum(values) / len(values)}
+                if not stats:
+                    raise StandInError("{} is skip".format(function), "REST-30000")
+                return self._ok([{"v_type" if isVertex else "e_type": typeName,
+                    "attributes": stats}])
+        raise StandInError("Unknown function {}.".format(function), "REST-30000")
+
+    # /ddl
+
+    def _ddl(self, params: dict, body: bytes) -> dict:
+        mapper = self.loadingJobs.get((params.get("tag"), params.get("filename")))
+        if mapper is None:
+            raise StandInError("Loading job {} with file tag {} does not exist.".format(
+                params.get("tag"), params.get("filename")), "REST-3200")
+        sep = params.get("sep") or ","
+        eol = params.get("eol") or "\n"
+        valid = 0
+        rejected = 0
+        vertexCounts = {}
+        edgeCounts = {}
+        for line in body.decode("utf-8").split(eol):
+            if not line.strip():
+                continue
+            try:
+                data = mapper(line.rstrip("\r").split(sep))
+                self._upsert(data, {})
+            except Exception:
+                rejected += 1
+                continue
+            valid += 1
+            for vt, vertices in data.get("vertices", {}).items():
+                vertexCounts[vt] = vertexCounts.get(vt, 0) + len(vertices)
+            for sources in data.get("edges", {}).values():
+                for edgeTypes in sources.values():
+                    for et, targets in edgeTypes.items():
+                        edgeCounts[et] = edgeCounts.get(et, 0) + sum(len(t) for t in targets.values())
+        return self._ok([{"sourceFileName": "Online_POST", "statistics": {
+            "validLine": valid,
+            "rejectLine": rejected,
+            "failedConditionLine": 0,
+            "notEnoughToken": 0,
+            "invalidJson": 0,
+            "oversizeToken": 0,
+            "vertex": [{"typeName": t, "validObject": n, "noIdFound": 0, "invalidAttribute": 0,
+                "invalidPrimaryId": 0} for t, n in vertexCounts.items()],
+            "edge": [{"typeName": t, "validObject": n, "noIdFound": 0, "invalidAttribute": 0,
+                "invalidVertexType": 0} for t, n in edgeCounts.items()],
+            "deleteVertex": [],
+            "deleteEdge": []
+        }}])
+
+    # /gsqlserver/gsql/file
+
+    def _gsql(self, text: str) -> str:
+        out = []
+        with self._lock:
+            starts = [m for m in CREATE_QUERY.finditer(text)]
+            install = INSTALL_QUERY.search(text)
+            for i, m in enumerate(starts):
+                end = starts[i + 1].start() if i + 1 < len(starts) else \
+                    (install.start() if install and install.start() > m.start() else len(text))
+                name = m.group(1)
+                self.queries[name] = {"handler": None, "text": text[m.start():end],
+                    "formats": None, "installed": False}
+                out.append("Successfully created queries: [{}].".format(name))
+            rest = text[:starts[0].start()] if starts else text
+            if install and (not starts or install.start() > starts[-1].start()):
+                rest += text[install.start():]
+
+            for m in DROP_QUERY.finditer(rest):
+                names = [n.strip() for n in m.group(1).split(",")]
+                if names == ["ALL"] or names == ["*"]:
+                    names = list(self.queries)
+                for n in names:
+                    self.queries.pop(n, None)
+                out.append("Successfully dropped queries on the graph '{}': [{}].".format(
+                    self.graphname, ", ".join(names)))
+            for m in CREATE_SECRET.finditer(rest):
+                out.append("The secret: {} has been created for user \"tigergraph\".".format(
+                    secrets.token_hex(16)))
+            changes = ADD_ATTRIBUTE.findall(rest)
+            for kind, typeName, attrs in changes:
+                for attr in re.split(r",(?![^<]*>)", attrs):
+                    attrName, attrType = attr.strip().split(None, 1)
+                    self._addAttribute(kind.upper(), typeName, attrName, attrType)
+            for m in RUN_SCHEMA_CHANGE.finditer(rest):
+                out.append("{} schema change succeeded.".format("Global" if m.group(1) else "Local"))
+            if install:
+                names = [n.strip() for n in install.group(1).split(",")]
+                if names == ["ALL"] or names == ["*"]:
+                    names = list(self.queries)
+                for n in names:
+                    if n not in self.queries:
+                        return "\n".join(out + ["Semantic Check Fails: query {} does not exist."
+                            .format(n), "Query installation failed!"])
+                for n in names:
+                    q = self.queries[n]
+                    if q["text"] and n.rsplit("_", 1)[0] in LOADERS:
+                        q["formats"] = _compileFormats(q["text"])
+                    q["installed"] = True
+                out.append("Start installing queries, about 1 minute ...")
+                out.append("Query installation finished.")
+        return "\n".join(out)
+
+    # /query
+
+    def _runQuery(self, name: str, params: dict) -> list:
+        with self._lock:
+            query = self.queries.get(name)
+            if query is None or not query["installed"]:
+                raise NotFoundError("Endpoint is not found from url = /query/{}/{}, please check"
+                    " whether the query is installed.".format(self.graphname, name), "REST-1000")
+            if query["handler"]:
+                return query["handler"](self, params)
+            kind = name.rsplit("_", 1)[0]
+            if query["text"] and kind.split("_")[0] in PAGING:
+                return getattr(self, "_" + kind.split("_")[0])(query["text"], params)
+            if query["formats"] is None:
+                raise StandInError("Query {} is not emulated by the stand-in server.".format(name),
+                    "REST-30000")
+            return getattr(self, "_" + kind.split("_")[0] + "Loader")(query["formats"], params)
+
+    @staticmethod
+    def _pagingFilter(queryText: str) -> str:
+        """Converts the `WHERE` condition of an `iterVertices()` query to a `/graph` filter."""
+        m = re.search(r"getvid\(s\) % parts == part AND (.+?)\s+ORDER BY", queryText)
+        if not m:
+            return ""
+        conds = []
+        for cond in m.group(1).split(" AND "):
+            c = GSQL_CONDITION.match(cond)
+            if not c:
+                raise StandInError("Condition {} is not supported by the stand-in server."
+                    .format(cond), "REST-30000")
+            attr, op, value = c.group(1), c.group(2), c.group(3) or c.group(4)
+            conds.append(attr + ("=" if op == "==" else op) + value)
+        return ",".join(conds)
+
+    def _page(self, vertexType: str, where: str, params: dict) -> list:
+        """The `page_size` vertices of the partition following the `after` internal ID, in the
+        order of the IDs."""
+        after = int(params.get("after", -1))
+        part, parts = int(params.get("part", 0)), int(params.get("parts", 1))
+        keys = sorted(((vertexType, i) for i, a in self.vertices[vertexType].items()
+            if self._matches(a, where)), key=lambda k: self._vids[k])
+        keys = [k for k in keys if self._vids[k] > after and self._vids[k] % parts == part]
+        return keys[:int(params["page_size"])]
+
+    def _iterVertices(self, queryText: str, params: dict) -> list:
+        vertexType = re.search(r"start = \{(\w+)\.\*\}", queryText).group(1)
+        page = self._page(vertexType, self._pagingFilter(queryText), params)
+        select = re.search(r"PRINT vertices\[(.*?)\];", queryText)
+        select = [a.strip().split(".", 1)[1] for a in select.group(1).split(",")] if select else []
+        vertices = []
+        for k in page:
+            attrs = self._attributes(self.vertices[vertexType][k[1]], select)
+            if select:
+                attrs = {"vertices." + a: v for a, v in attrs.items()}
+            vertices.append({"v_id": k[1], "v_type": vertexType, "attributes": attrs})
+        return [{"last": max((self._vids[k] for k in page), default=MIN_INT)},
+            {"vertices": vertices}]
+
+    def _iterEdges(self, queryText: str, params: dict) -> list:
+        sourceType = re.search(r"start = \{(\w+)\.\*\}", queryText).group(1)
+        edgeType = re.search(r"-\((\w+):e\)->", queryText).group(1)
+        once = "getvid(s) <= getvid(t)" in queryText
+        page = self._page(sourceType, "", params)
+        edges = []
+        for s in page:
+            for et, k, reverse, t in self._traversals(s, [edgeType], list(self.vertices)):
+                if once and (s[0], self._vids[s]) > (t[0], self._vids[t]):
+                    continue
+                edges.append({"e_type": et, "directed": self._edgeType(et)["IsDirected"],
+                    "from_id": s[1], "from_type": s[0], "to_id": t[1], "to_type": t[0],
+                    "attributes": dict(self.edges[et][k])})
+        return [{"last": max((self._vids[k] for k in page), default=MIN_INT), "size": len(page),
+            "edges": edges}]
+
+    def _vertexContext(self, key: tuple) -> tuple:
+        return (key[0], self.vertices[key[0]][key[1]], self._vids[key])
+
+    def _renderVertex(self, formats: dict, key: tuple, flag: str, delimiter: str) -> str:
+        funcs = formats.get(("v", key[0], flag)) or formats.get(("v", None, flag))
+        if not funcs:
+            return ""
+        ctx = {"s": self._vertexContext(key), "delimiter": delimiter}
+        return "".join(_stringify(f(ctx)) for f in funcs)
+
+    def _renderEdge(self, formats: dict, edgeType: str, key: tuple, reverse: bool,
+            delimiter: str) -> str:
+        funcs = formats.get(("e", edgeType, None)) or formats.get(("e", None, None))
+        if not funcs:
+            return ""
+        s, t = ((key[2], key[3]), (key[0], key[1])) if reverse else \
+            ((key[0], key[1]), (key[2], key[3]))
+        ctx = {"s": self._vertexContext(s), "t": self._vertexContext(t),
+            "e": (edgeType, self.edges[edgeType][key], None), "delimiter": delimiter}
+        return "".join(_stringify(f(ctx)) for f in funcs)
+
+    @staticmethod
+    def _types(requested: Union[list, str, None], available: Iterable) -> list:
+        if not requested:
+            return list(available)
+        if isinstance(requested, str):
+            requested = [requested]
+        return [t for t in available if t in requested]
+
+    @staticmethod
+    def _filtered(attrs: dict, filterBy: Union[str, None]) -> bool:
+        return not filterBy or bool(attrs.get(filterBy))
+
+    def _batches(self, elements: list, params: dict) -> list:
+        """Splits the elements into the batches of the request, like the loader queries."""
+        if params.get("shuffle") in (True, "true"):
+            elements = list(elements)
+            random.Random(self._random.random()).shuffle(elements)
+        numBatches = int(params.get("num_batches") or 1)
+        batchSize = params.get("batch_size")
+        batchSize = int(batchSize) if batchSize else math.ceil(len(elements) / numBatches)
+        return [elements[i * batchSize:(i + 1) * batchSize] for i in range(numBatches)]
+
+    def _inputVertices(self, params: dict) -> list:
+        return [(v["type"], str(v["id"])) for v in params.get("input_vertices") or []]
+
+    def _seedVertices(self, vertexTypes: list, params: dict) -> list:
+        return sorted(((vt, i) for vt in vertexTypes for i, a in self.vertices[vt].items()
+            if self._filtered(a, params.get("filter_by"))), key=lambda k: self._vids[k])
+
+    def _vertexLoader(self, formats: dict, params: dict) -> list:
+        delimiter = params.get("delimiter", ",")
+        batches = [self._inputVertices(params)]
+        if not batches[0]:
+            vertexTypes = self._types(params.get("v_types"), self.vertices)
+            batches = self._batches(self._seedVertices(vertexTypes, params), params)
+        return [{"vertex_batch": "".join(self._renderVertex(formats, k, None, delimiter)
+            for k in batch)} for batch in batches]
+
+    def _edgeLoader(self, formats: dict, params: dict) -> list:
+        delimiter = params.get("delimiter", ",")
+        edgeTypes = self._types(params.get("e_types"), self.edges)
+        edges = [(et, k) for et in edgeTypes for k, a in self.edges[et].items()
+            if self._filtered(a, params.get("filter_by"))]
+        return [{"edge_batch": "".join(self._renderEdge(formats, et, k, False, delimiter)
+            for et, k in batch)} for batch in self._batches(edges, params)]
+
+    def _traversals(self, key: tuple, edgeTypes: list, vertexTypes: list) -> list:
+        # Edges traversed from a vertex: directed edges from their source, undirected edges from
+        # both of their endpoints.
+        ret = []
+        for et, k, reverse in self._adjacency.get(key, ()):
+            target = (k[0], k[1]) if reverse else (k[2], k[3])
+            if et in edgeTypes and target[0] in vertexTypes:
+                ret.append((et, k, reverse, target))
+        return sorted(ret, key=lambda x: (x[0], x[1], x[2]))
+
+    def _graphLoader(self, formats: dict, params: dict) -> list:
+        delimiter = params.get("delimiter", ",")
+        vertexTypes = self._types(params.get("v_types"), self.vertices)
+        edgeTypes = self._types(params.get("e_types"), self.edges)
+        numBatches = int(params.get("num_batches") or 1)
+        tmpIds = dict(self._vids)
+        if params.get("shuffle") in (True, "true"):
+            keys = list(tmpIds)
+            ids = list(range(len(keys)))
+            random.Random(self._random.random()).shuffle(ids)
+            tmpIds = dict(zip(keys, ids))
+        batches = [([], []) for _ in range(numBatches)]
+        for vt in vertexTypes:
+            for vid in self.vertices[vt]:
+                s = (vt, vid)
+                for et, k, reverse, t in self._traversals(s, edgeTypes, vertexTypes):
+                    if not self._filtered(self.edges[et][k], params.get("filter_by")):
+                        continue
+                    a, b = tmpIds[s], tmpIds[t]
+                    vertices, edges = batches[((a + b) * (a + b + 1) // 2 + b) % numBatches]
+                    edges.append((et, k, reverse))
+                    vertices.extend((s, t))
+        ret = []
+        for vertices, edges in batches:
+            vertices = sorted(set(vertices), key=lambda k: self._vids[k])
+            ret.append({
+                "vertex_batch": "".join(self._renderVertex(formats, k, None, delimiter)
+                    for k in vertices),
+                "edge_batch": "".join(self._renderEdge(formats, et, k, r, delimiter)
+                    for et, k, r in edges)})
+        return ret
+
+    def _neighborLoader(self, formats: dict, params: dict) -> list:
+        delimiter = params.get("delimiter", ",")
+        vertexTypes = self._types(params.get("v_types"), self.vertices)
+        edgeTypes = self._types(params.get("e_types"), self.edges)
+        numNeighbors = int(params.get("num_neighbors") or 10)
+        numHops = int(params.get("num_hops") or 2)
+        rng = random.Random(self._random.random())
+        inputs = self._inputVertices(params)
+        batches = [inputs]
+        if not inputs:
+            seedTypes = self._types(params.get("seed_types") or params.get("v_types"),
+                self.vertices)
+            batches = self._batches(self._seedVertices(seedTypes, params), params)
+        ret = []
+        for seeds in batches:
+            printed = dict.fromkeys(seeds)
+            vLines = [self._renderVertex(formats, k, "1", delimiter) for k in seeds]
+            eLines = []
+            printedEdges = set()
+            frontier = seeds
+            for _ in range(numHops):
+                nextFrontier = {}
+                for s in frontier:
+                    edges = self._traversals(s, edgeTypes, vertexTypes)
+                    if len(edges) > numNeighbors:
+                        edges = rng.sample(edges, numNeighbors)
+                    for et, k, reverse, t in edges:
+                        if (et, k) not in printedEdges:
+                            printedEdges.add((et, k))
+                            eLines.append(self._renderEdge(formats, et, k, reverse, delimiter))
+                        nextFrontier[t] = None
+                for t in nextFrontier:
+                    if t not in printed:
+                        printed[t] = None
+                        vLines.append(self._renderVertex(formats, t, "0", delimiter))
+                frontier = list(nextFrontier)
+            batch = {"vertex_batch": "".join(vLines), "edge_batch": "".join(eLines)}
+            if inputs:
+                batch["pids"] = {str(self._vids[k]): k[1] for k in printed}
+            ret.append(batch)
+        return ret
@@ -1,8 +1,9 @@
 import unittest
+from unittest.mock import patch
 
 from pyTigerGraphUnitTest import make_connection
 
-from pyTigerGraph.gds.utilities import is_query_installed
+from pyTigerGraph.gds.utilities import add_attribute, is_query_installed
 
 
 class TestGDSDataLoaders(unittest.TestCase):
@@ -102,6 +103,50 @@ class TestGDSDataLoaders(unittest.TestCase):
         self.assertTrue(is_query_installed(self.conn, loader.query_name))
         self.assertEqual(loader.num_batches, 11)
 
+    def test_prepare(self):
+        with self.conn.gds.prepare():
+            splitter = self.conn.gds.vertexSplitter(train_mask=0.6, val_mask=0.2)
+            loader = self.conn.gds.vertexLoader(
+                attributes=["x", "y", "train_mask"],
+                batch_size=16,
+                shuffle=True,
+                filter_by="train_mask",
+                loader_id=None,
+                buffer_size=4,
+            )
+            self.assertEqual([splitter.query_name, loader.query_name],
+                [q[0] for q in self.conn.gds._pending_installs])
+        self.assertIsNone(self.conn.gds._pending_installs)
+        self.assertTrue(is_query_installed(self.conn, splitter.query_name))
+        self.assertTrue(is_query_installed(self.conn, loader.query_name))
+
+    def test_prepare_schema_changes(self):
+        with patch.object(self.conn, "gsql", wraps=self.conn.gsql) as mock_gsql:
+            with self.conn.gds.prepare():
+                vsplitter = self.conn.gds.vertexSplitter(prep_train=0.6, prep_val=0.2)
+                esplitter = self.conn.gds.edgeSplitter(e_types=["Cite"], prep_edge=0.5)
+                ret = add_attribute(self.conn, "VERTEX", "FLOAT", "prep_score", ["Paper"])
+                self.assertEqual(ret, "Schema change pending.")
+                self.assertIn(("VERTEX", "Paper", "prep_train", "BOOL"),
+                    self.conn.gds._pending_schema_changes)
+                self.assertIn(("EDGE", "Cite", "prep_edge", "BOOL"),
+                    self.conn.gds._pending_schema_changes)
+            self.assertIsNone(self.conn.gds._pending_schema_changes)
+            jobs = [c for c in mock_gsql.call_args_list if "RUN SCHEMA_CHANGE JOB" in c[0][0]]
+            # All attributes (of local types) are added by a single job
+            self.assertEqual(len(jobs), 1)
+        attrs = [a["AttributeName"] for a in self.conn.getVertexType("Paper")["Attributes"]]
+        self.assertIn("prep_train", attrs)
+        self.assertIn("prep_val", attrs)
+        self.assertIn("prep_score", attrs)
+        attrs = [a["AttributeName"] for a in self.conn.getEdgeType("Cite")["Attributes"]]
+        self.assertIn("prep_edge", attrs)
+        # Running the splitters does not change the schema again
+        with patch.object(self.conn, "gsql", wraps=self.conn.gsql) as mock_gsql:
+            vsplitter.run()
+            esplitter.run()
+            self.assertFalse([c for c in mock_gsql.call_args_list if "SCHEMA_CHANGE" in c[0][0]])
+
     def test_configureKafka(self):
         self.conn.gds.configureKafka(kafka_address="kafka:9092")
         loader = self.conn.gds.neighborLoader(
@@ -192,6 +237,8 @@ if __name__ == "__main__":
     suite.addTest(TestGDSDataLoaders("test_vertexLoader"))
     suite.addTest(TestGDSDataLoaders("test_edgeLoader"))
     suite.addTest(TestGDSDataLoaders("test_edgeNeighborLoader"))
+    suite.addTest(TestGDSDataLoaders("test_prepare"))
+    suite.addTest(TestGDSDataLoaders("test_prepare_schema_changes"))
     suite.addTest(TestGDSDataLoaders("test_configureKafka"))
     # suite.addTest(TestGDSDataLoaders("test_configureKafka_sasl_plaintext"))
     # suite.addTest(TestGDSDataLoaders("test_configureKafka_sasl_ssl"))
@@ -1,4 +1,5 @@
 import os
+import tempfile
 import unittest
 from io import StringIO
 from textwrap import dedent
@@ -33,6 +34,18 @@ class test_Featurizer(unittest.TestCase):
         self.assertIsInstance(algo_dict, dict)
         self.assertIn("Centrality", algo_dict)
 
+    def test_algorithm_cache(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            feat = Featurizer(self.conn, algo_version="3.8", cache_dir=cache_dir)
+            manifest = os.path.join(cache_dir, "raw.githubusercontent.com", "tigergraph",
+                "gsql-graph-algorithms", "3.8", "manifest.json")
+            self.assertTrue(os.path.exists(manifest))
+            query = feat._get_query("tg_pagerank")
+            # A warm cache is used without accessing the repository
+            with patch("requests.get", side_effect=AssertionError("network access")):
+                feat = Featurizer(self.conn, algo_version="3.8", cache_dir=cache_dir)
+                self.assertEqual(query, feat._get_query("tg_pagerank"))
+
     @patch('sys.stdout', new_callable=StringIO)
     def test_listAlgorithms(self, mock_stdout):
         self.featurizer.listAlgorithms()
@@ -165,6 +178,13 @@ class test_Featurizer(unittest.TestCase):
         }
         self.assertDictEqual(params, truth)
 
+        # The signature is cached, and the returned parameters are copies
+        params["v_type"] = "Paper"
+        with patch.object(self.featurizer, "_get_query",
+                side_effect=AssertionError("signature not cached")):
+            self.assertDictEqual(
+                self.featurizer.getParams("tg_pagerank", printout=False), truth)
+
     @patch('sys.stdout', new_callable=StringIO)
     def test_getParams_print(self, mock_stdout):
         _ = self.featurizer.getParams("tg_pagerank", printout=True)
@@ -286,8 +306,72 @@ class test_Featurizer(unittest.TestCase):
             'file_path': '',
             'display_edges': True}
         ret = self.featurizer.runAlgorithm("tg_pagerank", params=params, runAsync=True)
+        self.assertIs(ret.future, ret.future)
         self.assertIsNotNone(ret.wait())
 
+    def test10_runPipeline(self):
+        steps = {
+            "pagerank": {
+                "algorithm": "tg_pagerank",
+                "params": {"v_type": "Paper", "e_type": "Cite", "result_attribute": "pr_pipeline"}
+            },
+            "degree": {
+                "algorithm": "tg_pagerank",
+                "params": {"v_type": "Paper", "e_type": "Cite", "result_attribute": "pr_pipeline2"},
+                "threadLimit": 2
+            },
+            "simple": {
+                "algorithm": "simple_query",
+                "params": {},
+                "custom_query": True,
+                "depends_on": ["pagerank", "degree"]
+            }
+        }
+        with patch.object(self.conn, "gsql", wraps=self.conn.gsql) as mock_gsql:
+            report = self.featurizer.runPipeline(steps, concurrency=2, threadLimit=4)
+        # The result attributes of all steps are added by a single job
+        jobs = [c for c in mock_gsql.call_args_list if "RUN SCHEMA_CHANGE JOB" in c[0][0]]
+        self.assertEqual(len(jobs), 1)
+        attrs = [a["AttributeName"] for a in self.conn.getVertexType("Paper")["Attributes"]]
+        self.assertIn("pr_pipeline", attrs)
+        self.assertIn("pr_pipeline2", attrs)
+        self.assertEqual(list(report), ["pagerank", "degree", "simple"])
+        self.assertGreaterEqual(report["simple"]["start"],
+            max(report["pagerank"]["end"], report["degree"]["end"]))
+        for step in report.values():
+            self.assertIsNotNone(step["result"])
+            self.assertGreaterEqual(step["seconds"], 0)
+
+        with self.assertRaises(ValueError) as error:
+            self.featurizer.runPipeline({
+                "a": {"algorithm": "tg_pagerank", "depends_on": ["b"]},
+                "b": {"algorithm": "tg_pagerank", "depends_on": ["a"]}})
+        self.assertIn("form a cycle", str(error.exception))
+
+        with self.assertRaises(ValueError):
+            self.featurizer.runPipeline(steps, concurrency=0)
+
+    def test11_iterResults(self):
+        params = {"v_type": "Paper", "e_type": "Cite", "result_attribute": "pagerank",
+            "print_results": True, "top_k": 10}
+        out = self.featurizer.runAlgorithm("tg_pagerank", params=params)
+        pages = list(self.featurizer.iterResults("tg_pagerank", params=params, chunkSize=1000))
+        self.assertEqual({name for name, _ in pages}, {"Paper"})
+        self.assertEqual(sum(len(df) for _, df in pages), self.conn.getVertexCount("Paper"))
+        self.assertEqual(list(pages[0][1].columns), ["v_id", "pagerank"])
+        self.assertEqual(str(pages[0][1]["pagerank"].dtype), "float32")
+        # Printed results
+        pages = list(self.featurizer.iterResults("tg_pagerank", results=out, fmt="arrow"))
+        self.assertEqual(pages[0][1].num_rows, 10)
+
+        with tempfile.TemporaryDirectory() as path:
+            manifest = self.featurizer.exportResults(path, "tg_pagerank", params=params,
+                chunkSize=1000)
+            self.assertEqual(manifest["results"]["Paper"]["rows"],
+                self.conn.getVertexCount("Paper"))
+            for file in manifest["results"]["Paper"]["files"]:
+                self.assertTrue(os.path.isfile(os.path.join(path, file)))
+
     def test_get_template_queries(self):
         if (self.featurizer.major_ver != "master" and (
                 int(self.featurizer.major_ver) < 3 or (
@@ -328,6 +412,7 @@ if __name__ == '__main__':
     suite = unittest.TestSuite()
     suite.addTest(test_Featurizer("test_get_db_version"))
     suite.addTest(test_Featurizer("test_get_algo_dict"))
+    suite.addTest(test_Featurizer("test_algorithm_cache"))
     suite.addTest(test_Featurizer("test_listAlgorithms"))
     suite.addTest(test_Featurizer("test_listAlgorithms_category"))
     suite.addTest(test_Featurizer("test_install_query_file"))
@@ -350,6 +435,8 @@ if __name__ == '__main__':
     suite.addTest(test_Featurizer("test07_runCustomAlgorithm"))
     suite.addTest(test_Featurizer("test08_runAlgorithm_async_qid"))
     suite.addTest(test_Featurizer("test09_runAlgorithm_async_wait"))
+    suite.addTest(test_Featurizer("test10_runPipeline"))
+    suite.addTest(test_Featurizer("test11_iterResults"))
     suite.addTest(test_Featurizer("test_get_template_queries"))
     suite.addTest(test_Featurizer("test_template_query"))
     
@@ -1,5 +1,8 @@
 import os
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from threading import Thread
+from time import sleep
 
 from pyTigerGraphUnitTest import make_connection
 
@@ -56,6 +59,73 @@ class TestGDSUtilsQuery(unittest.TestCase):
             utils.is_query_installed(self.conn, "simple_query_something_special")
         )
 
+    def test_install_query_files(self):
+        replace = {
+            "{QUERYSUFFIX}": "something_special",
+            "{VERTEXATTRS}": "s.id,s.x,s.y",
+        }
+        resp = utils.install_query_files(
+            self.conn,
+            [
+                os.path.join(os.path.dirname(__file__), "fixtures/create_query_simple.gsql"),
+                (os.path.join(os.path.dirname(__file__), "fixtures/create_query_template.gsql"),
+                 replace)
+            ],
+            force=True
+        )
+        self.assertEqual(resp, ["simple_query", "simple_query_something_special"])
+        resp = self.conn.runInstalledQuery("simple_query")
+        self.assertEqual(resp[0]["message"], "Hello World!")
+        self.assertTrue(
+            utils.is_query_installed(self.conn, "simple_query_something_special")
+        )
+
+    def test_install_lock(self):
+        events = []
+
+        def install(i):
+            with utils.install_lock(self.conn):
+                events.append(("start", i))
+                sleep(0.1)
+                events.append(("end", i))
+
+        threads = [Thread(target=install, args=(i,)) for i in range(3)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        for i in range(0, len(events), 2):
+            self.assertEqual(events[i][1], events[i + 1][1])
+
+    def test_install_lock_state(self):
+        states = {}
+
+        def holder():
+            with utils.install_lock(self.conn) as lock:
+                states["holder"] = lock["installed_by_others"]
+                sleep(0.3)
+                lock["installed"] = True
+
+        def waiter():
+            sleep(0.1)
+            with utils.install_lock(self.conn) as lock:
+                states["waiter"] = lock["installed_by_others"]
+
+        threads = [Thread(target=holder), Thread(target=waiter)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual({"holder": False, "waiter": True}, states)
+
+    def test_install_existing_queries_concurrently(self):
+        path = os.path.join(os.path.dirname(__file__), "fixtures/create_query_simple.gsql")
+        utils.install_query_file(self.conn, path)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            res = list(executor.map(lambda _: utils.install_query_file(self.conn, path),
+                range(4)))
+        self.assertEqual(["simple_query"] * 4, res)
+
 
 if __name__ == "__main__":
     suite = unittest.TestSuite()
@@ -64,5 +134,9 @@ if __name__ == "__main__":
     suite.addTest(TestGDSUtilsQuery("test_install_exist_query"))
     suite.addTest(TestGDSUtilsQuery("test_install_query_by_force"))
     suite.addTest(TestGDSUtilsQuery("test_install_query_template"))
+    suite.addTest(TestGDSUtilsQuery("test_install_query_files"))
+    suite.addTest(TestGDSUtilsQuery("test_install_lock"))
+    suite.addTest(TestGDSUtilsQuery("test_install_lock_state"))
+    suite.addTest(TestGDSUtilsQuery("test_install_existing_queries_concurrently"))
     runner = unittest.TextTestRunner(verbosity=2, failfast=True)
     runner.run(suite)
@@ -1,5 +1,7 @@
 import json
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from time import sleep
 
 from pyTigerGraphUnitTest import make_connection
 
@@ -93,6 +95,63 @@ class test_pyTigerGraphBase(unittest.TestCase):
                 "/vertices/non_existent_vertex_type/1")
         self.assertEqual("REST-30000", tge.exception.code)
 
+    def test_05_metadataCache(self):
+        res = self.conn.getSchema()
+        self.assertIs(res, self.conn.getSchema())
+        self.assertIsNot(res, self.conn.getSchema(force=True))
+
+        cnt = self.conn.getVertexCount("vertex4")
+        self.conn.upsertVertex("vertex4", 1001, {"a01": 1001})
+        self.assertEqual(cnt + 1, self.conn.getVertexCount("vertex4", realtime=True))
+        self.conn.delVerticesById("vertex4", 1001)
+        self.assertEqual(cnt, self.conn.getVertexCount("vertex4", realtime=True))
+
+        # Vertex counts are cached only if enabled; writes drop them without invalidating the
+        # other kinds of metadata
+        self.assertEqual(0, self.conn.metadataCacheTTL["vertexCount"])
+        self.conn.metadataCacheTTL["vertexCount"] = 30
+        try:
+            self.conn.getVertexCount("vertex4")
+            schema = self.conn.getSchema()
+            version = self.conn._metadataVersion
+            self.conn.upsertVertex("vertex4", 1001, {"a01": 1001})
+            self.assertEqual(cnt + 1, self.conn.getVertexCount("vertex4"))
+            self.assertEqual(version, self.conn._metadataVersion)
+            self.assertIs(schema, self.conn.getSchema())
+            self.conn.delVerticesById("vertex4", 1001)
+        finally:
+            self.conn.metadataCacheTTL["vertexCount"] = 0
+
+        self.conn.invalidateMetadataCache("schema")
+        self.assertIsNone(self.conn.schema)
+        self.assertIsNot(res, self.conn.getSchema())
+
+    def test_06_singleflight(self):
+        calls = []
+
+        def func():
+            calls.append(1)
+            sleep(0.5)
+            return {"a": [1]}
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            res = list(executor.map(lambda _: self.conn._singleflight("key", func), range(8)))
+        self.assertEqual(1, len(calls))
+        self.assertTrue(all(r == {"a": [1]} for r in res))
+        self.assertEqual(8, len({id(r) for r in res}))
+        self.assertEqual({}, self.conn._inflight)
+
+    def test_07_isReadOnlyEndpoint(self):
+        self.assertTrue(self.conn._isReadOnlyEndpoint(self.conn.restppUrl + "/graph/" +
+            self.conn.graphname + "/vertices/vertex4"))
+        self.assertTrue(self.conn._isReadOnlyEndpoint(self.conn.gsUrl + "/gsqlserver/gsql/schema"))
+        self.assertFalse(self.conn._isReadOnlyEndpoint(self.conn.restppUrl + "/query/" +
+            self.conn.graphname + "/query1"))
+        self.assertFalse(self.conn._isReadOnlyEndpoint(self.conn.restppUrl + "/abortquery/" +
+            self.conn.graphname))
+        self.assertFalse(self.conn._isReadOnlyEndpoint(self.conn.restppUrl + "/rebuildnow/" +
+            self.conn.graphname))
+
 
 if __name__ == '__main__':
     unittest.main()
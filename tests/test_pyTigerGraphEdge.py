@@ -335,6 +335,15 @@ class test_pyTigerGraphEdge(unittest.TestCase):
     def test_18_edgeSetToDataFrame(self):
         pass
 
+    def test_19_iterEdges(self):
+        res = list(self.conn.iterEdges("edge1_undirected", chunkSize=3))
+        self.assertTrue(all(isinstance(p, list) for p in res))
+        self.assertEqual(8, sum(len(p) for p in res))
+
+        res = list(self.conn.iterEdges("edge4_many_to_many", chunkSize=2, fmt="df", prefetch=2))
+        self.assertTrue(all(isinstance(p, pandas.DataFrame) for p in res))
+        self.assertIn("to_type", res[0].columns)
+
 
 if __name__ == '__main__':
     unittest.main()
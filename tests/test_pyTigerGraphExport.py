@@ -0,0 +1,40 @@
+import json
+import os
+import tempfile
+import unittest
+
+import pyarrow.parquet
+from pyTigerGraphUnitTest import make_connection
+
+
+class test_pyTigerGraphExport(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.conn = make_connection()
+
+    def test_01_exportGraph(self):
+        with tempfile.TemporaryDirectory() as path:
+            res = self.conn.exportGraph(path, vertexTypes="vertex4",
+                edgeTypes=["edge1_undirected"], chunkSize=2)
+            self.assertEqual(self.conn.getVertexCount("vertex4"), res["vertices"]["vertex4"]["rows"])
+            self.assertEqual(8, res["edges"]["edge1_undirected"]["rows"])
+
+            with open(os.path.join(path, "manifest.json")) as f:
+                self.assertEqual(res, json.load(f))
+
+            table = pyarrow.parquet.read_table(
+                os.path.join(path, res["vertices"]["vertex4"]["files"][0]))
+            self.assertEqual(["v_id", "a01"], table.column_names)
+            self.assertEqual("int64", str(table.schema.field("a01").type))
+
+    def test_02_exportGraphArrow(self):
+        with tempfile.TemporaryDirectory() as path:
+            res = self.conn.exportGraph(path, vertexTypes=[], edgeTypes="edge4_many_to_many",
+                format="arrow")
+            self.assertEqual([], list(res["vertices"]))
+            self.assertTrue(all(f.endswith(".arrow")
+                for f in res["edges"]["edge4_many_to_many"]["files"]))
+
+
+if __name__ == '__main__':
+    unittest.main()
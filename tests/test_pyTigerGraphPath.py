@@ -170,6 +170,21 @@ class test_pyTigerGraphPath(unittest.TestCase):
              self._check_edges(res[0]["edges"], es))
         )
 
+    def test_04_pathBatch(self):
+        pairs = [(("vertex4", 10), ("vertex4", 50)), (("vertex4", 10), ("vertex4", 40))]
+        res = self.conn.allPathsBatch(pairs, maxLength=4, concurrency=2)
+        self.assertEqual([self.conn.allPaths(p[0], p[1], maxLength=4) for p in pairs], res)
+
+        res = self.conn.shortestPathBatch(pairs, allShortestPaths=True, compact=True)
+        self.assertEqual([0, 7], list(res["vertexOffsets"][:2]))
+        self.assertEqual(len(res["edges"]), res["edgeOffsets"][-1])
+        self.assertEqual(["edge6_loop"], res["edgeTypeNames"])
+        ids = list(res["ids"])
+        es = [(int(ids[f][1]), int(ids[t][1]))
+            for f, t in res["edges"][res["edgeOffsets"][0]:res["edgeOffsets"][1]]]
+        self.assertCountEqual([(10, 20), (20, 30), (30, 40), (40, 50), (10, 60), (60, 70),
+            (70, 40)], es)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,4 +1,8 @@
+import json
+import os
+import tempfile
 import unittest
+from concurrent.futures import as_completed
 from datetime import datetime
 from time import sleep
 
@@ -117,6 +121,125 @@ class test_pyTigerGraphQuery(unittest.TestCase):
     def test_10_abortQuery(self):
         abort_ret = self.conn.abortQuery("all")
         self.assertEqual(abort_ret["results"], [{'aborted_queries': []}])
-        
+
+    def test_11_queryCache(self):
+        with tempfile.TemporaryDirectory() as path:
+            cache = self.conn.enableQueryCache(maxSize=2, queryTTLs={"query1": 60},
+                path=os.path.join(path, "cache.db"))
+            try:
+                res = self.conn.runInstalledQuery("query1", cacheTags=["t1"])
+                key = cache.makeKey(self.conn.graphname, "query1", None,
+                    self.conn._queryCacheScope())
+                self.assertEqual(res, cache.get(key))
+                self.assertEqual(res, self.conn.runInstalledQuery("query1"))
+
+                # Results of other servers or users are kept apart
+                self.assertIsNone(cache.get(cache.makeKey(self.conn.graphname, "query1", None,
+                    "http://other:9000|user")))
+
+                self.conn.invalidateQueryCache(tags=["t1"])
+                self.assertIsNone(cache.get(key))
+            finally:
+                self.conn.disableQueryCache()
+        self.assertIsNone(self.conn.queryCache)
+
+    def test_12_runInstalledQueryBatch(self):
+        exp = self.conn.runInstalledQuery("query1")
+        res = self.conn.runInstalledQueryBatch("query1", [None, None, None], concurrency=2)
+        self.assertEqual([exp, exp, exp], res)
+
+        res = list(self.conn.runInstalledQueryBatch("non_existent_query", [None, None],
+            asCompleted=True))
+        self.assertEqual([0, 1], sorted(i for i, _ in res))
+        self.assertTrue(all(isinstance(r, Exception) for _, r in res))
+
+    def test_13_runInstalledQueryAsync(self):
+        jobs = [self.conn.runInstalledQueryAsync("query1") for _ in range(3)]
+        done = []
+        jobs[0].add_done_callback(done.append)
+        for job in as_completed(jobs, timeout=30):
+            self.assertEqual(15, job.result()[0]["ret"])
+        self.assertEqual([jobs[0]], done)
+        self.assertFalse(jobs[0].cancel())
+
+    def test_14_queryParameters(self):
+        params = {"p13_set_vertex": [([1, 2], "vertex4"), (3, "vertex4")]}
+        self.assertEqual("p13_set_vertex[0]=1&p13_set_vertex[0].type=vertex4&"
+            "p13_set_vertex[1]=2&p13_set_vertex[1].type=vertex4&"
+            "p13_set_vertex[2]=3&p13_set_vertex[2].type=vertex4",
+            self.conn._parseQueryParameters(params))
+        self.assertEqual({"p13_set_vertex": [{"id": 1, "type": "vertex4"},
+            {"id": 2, "type": "vertex4"}, {"id": 3, "type": "vertex4"}]},
+            self.conn._queryParametersToJson(params))
+
+        # Exceeds the maximum URL length, so POST is used automatically
+        params = {
+            "p13_set_vertex": [(list(range(1, 4)) * 1000, "vertex4")],
+            "p14_set_vertex_vertex4": [1, 2, 3]
+        }
+        res = self.conn.runInstalledQuery("query4_all_param_types", params)
+        self.assertEqual(["1", "2", "3"], sorted(res[11]["p13_set_vertex"]))
+
+    def test_15_parseQueryOutput(self):
+        output = [
+            {"vs1": [{"v_id": "1", "v_type": "vertex4", "attributes": {"a01": 1}}]},
+            {"vs2": [{"v_id": "1", "v_type": "vertex4", "attributes": {"@acc": 2}},
+                {"v_id": "2", "v_type": "vertex4", "attributes": {"a01": 3}}]},
+            {"es": [{"e_type": "edge3_directed_with_reverse", "from_type": "vertex4",
+                "from_id": "1", "to_type": "vertex5", "to_id": "2", "attributes": {}}]},
+            {"n": 5}
+        ]
+
+        res = self.conn.parseQueryOutput(json.loads(json.dumps(output)), graphOnly=False)
+        v = res["vertices"]["vertex4"]["1"]
+        self.assertEqual({"a01": 1, "@acc": 2}, v["attributes"])
+        self.assertEqual(2, v["x_occurrences"])
+        self.assertEqual(["vs1", "vs2"], v["x_sources"])
+        e = res["edges"]["edge3_directed_with_reverse"]["vertex4(1)->vertex5(2)"]
+        self.assertEqual("edge3_directed_with_reverse_reverse_edge", e["reverse_edge"])
+        self.assertEqual([{"label": "n", "value": 5}], res["output"])
+
+        res = self.conn.parseQueryOutput(json.loads(json.dumps(output)), trackOccurrences=False,
+            fmt="df")
+        df = res["vertices"]["vertex4"]
+        self.assertEqual(["v_id", "a01", "@acc"], list(df.columns))
+        self.assertEqual(2, len(df))
+        self.assertEqual(["from_type", "from_id", "to_type", "to_id"],
+            list(res["edges"]["edge3_directed_with_reverse"].columns))
+
+
+    def test_16_queryPromotion(self):
+        queryText = \
+"""INTERPRET QUERY (INT offset) FOR GRAPH $graphname {
+  SumAccum<INT> @@summa;
+  start = {vertex4.*};
+  res =
+    SELECT src
+    FROM   start:src
+    ACCUM  @@summa += src.a01 + offset;
+  PRINT @@summa AS ret;
+}"""
+        self.conn.enableQueryPromotion(threshold=2)
+        try:
+            res = [self.conn.runInterpretedQuery(queryText, {"offset": 0}) for _ in range(3)]
+            self.assertEqual([15, 15, 15], [r[0]["ret"] for r in res])
+            promoted = [q for q in self.conn.getInstalledQueries(force=True)
+                if q.startswith("GET /query/" + self.conn.graphname + "/interpreted_")]
+            self.assertEqual(1, len(promoted))
+            queryName = promoted[0].split("/")[-1]
+
+            # Another connection reuses the installed query right away
+            conn = make_connection()
+            conn.enableQueryPromotion(threshold=100)
+            self.assertEqual(queryName, conn._promoteInterpretedQuery(
+                queryText.replace("$graphname", conn.graphname)))
+        finally:
+            self.conn.disableQueryPromotion()
+            for q in self.conn.getInstalledQueries(force=True):
+                if q.startswith("GET /query/" + self.conn.graphname + "/interpreted_"):
+                    self.conn.gsql("USE GRAPH " + self.conn.graphname + "\nDROP QUERY " +
+                        q.split("/")[-1])
+
+
 if __name__ == '__main__':
     unittest.main()
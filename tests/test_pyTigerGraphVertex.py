@@ -66,10 +66,14 @@ class test_pyTigerGraphVertex(unittest.TestCase):
         self.assertEqual("VertexType cannot be \"*\" if where condition is specified.",
             tge.exception.message)
 
-        with self.assertRaises(TigerGraphException) as tge:
-            self.conn.getVertexCount(["vertex4", "vertex5", "vertex6"], "a01>=3")
-        self.assertEqual("VertexType cannot be a list if where condition is specified.",
-            tge.exception.message)
+        res = self.conn.getVertexCount(["vertex4", "vertex5"], "a01>=3")
+        self.assertEqual({"vertex4": self.conn.getVertexCount("vertex4", "a01>=3"),
+            "vertex5": self.conn.getVertexCount("vertex5", "a01>=3")}, res)
+
+        res = self.conn.getVertexCount(["vertex4", "vertex5"], {"vertex4": "a01>=3"},
+            concurrency=1)
+        self.assertEqual({"vertex4": self.conn.getVertexCount("vertex4", "a01>=3"),
+            "vertex5": self.conn.getVertexCount("vertex5")}, res)
 
         with self.assertRaises(TigerGraphException) as tge:
             self.conn.getVertexCount("non_existing_vertex_type")
@@ -178,6 +182,10 @@ class test_pyTigerGraphVertex(unittest.TestCase):
         res = self.conn.getVerticesById("vertex4", [1, 3, 5], fmt="df")
         self.assertIsInstance(res, pandas.DataFrame)
 
+        res = self.conn.getVerticesById("vertex4", [1, 3, 5], concurrency=3)
+        self.assertIsInstance(res, list)
+        self.assertEqual(["1", "3", "5"], [v["v_id"] for v in res])
+
     def test_10_getVertexDataFrameById(self):
         res = self.conn.getVertexDataFrameById("vertex4", [1, 3, 5])
         self.assertIsInstance(res, pandas.DataFrame)
@@ -200,6 +208,9 @@ class test_pyTigerGraphVertex(unittest.TestCase):
         res = self.conn.getVertexStats("vertex5", skipNA=True)
         self.assertEqual({}, res)
 
+        self.assertEqual(self.conn.getVertexStats("*", concurrency=1),
+            self.conn.getVertexStats("*", concurrency=8))
+
     def test_12_delVertices(self):
         vs = [
             (300, {"a01": 300}),
@@ -225,7 +236,7 @@ class test_pyTigerGraphVertex(unittest.TestCase):
         self.assertIsInstance(res, int)
         self.assertEqual(1, res)
 
-        res = self.conn.delVerticesById("vertex4", [301, 302])
+        res = self.conn.delVerticesById("vertex4", [301, 302], concurrency=2)
         self.assertIsInstance(res, int)
         self.assertEqual(2, res)
 
@@ -238,11 +249,34 @@ class test_pyTigerGraphVertex(unittest.TestCase):
         self.assertIsInstance(res, list)
         self.assertEqual(5, len(res))
 
-        res = self.conn.vertexSetToDataFrame(res)
+        vs = res
+        res = self.conn.vertexSetToDataFrame(vs)
         self.assertIsInstance(res, pandas.DataFrame)
         self.assertEqual(5, len(res.index))
         self.assertEqual(["v_id","a01"], list(res.columns))
 
+        res = self.conn.vertexSetToDataFrame(vs, withType=True, compact=True)
+        self.assertEqual(["v_id","v_type","a01"], list(res.columns))
+        self.assertEqual("int8", str(res["a01"].dtype))
+
+    def test_16_iterVertices(self):
+        res = list(self.conn.iterVertices("vertex4", chunkSize=2))
+        self.assertTrue(all(isinstance(p, list) for p in res))
+        self.assertEqual(5, sum(len(p) for p in res))
+
+        res = list(self.conn.iterVertices("vertex4", select="a01", where="a01>=3", chunkSize=2,
+            fmt="df", prefetch=2))
+        self.assertTrue(all(isinstance(p, pandas.DataFrame) for p in res))
+        self.assertEqual(3, sum(len(p.index) for p in res))
+        self.assertEqual(["v_id", "a01"], list(res[0].columns))
+
+    def test_17_filterToCondition(self):
+        self.assertEqual("s.a01 >= 3", self.conn._filterToCondition("vertex4", "a01>=3"))
+        with self.assertRaises(TigerGraphException):
+            self.conn._filterToCondition("vertex4", "a01>=3 OR TRUE")
+        with self.assertRaises(TigerGraphException):
+            self.conn._filterToCondition("vertex4", "a01=[1, 2]")
+
 
 if __name__ == '__main__':
     unittest.main()
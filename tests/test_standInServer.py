@@ -0,0 +1,84 @@
+import unittest
+
+from pyTigerGraph.pyTigerGraphException import TigerGraphException
+from standInServer import StandInServer
+
+
+class test_standInServer(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = StandInServer().start()
+        cls.server.addVertexType("Person", {"age": "INT", "emb": "LIST<DOUBLE>", "train": "BOOL"})
+        cls.server.addEdgeType("Knows", "Person", "Person", {"weight": "DOUBLE"}, directed=False)
+        cls.server.addVertices("Person", [(str(i), {"age": i, "emb": [i, i / 2],
+            "train": i % 2 == 0}) for i in range(10)])
+        cls.server.addEdges("Knows", [(str(i), str((i + 1) % 10), {"weight": i / 10})
+            for i in range(10)])
+        cls.conn = cls.server.connection()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def test_01_schema(self):
+        self.assertEqual(["Person"], self.conn.getVertexTypes())
+        self.assertEqual(["Knows"], self.conn.getEdgeTypes())
+        self.assertEqual("LIST", self.conn.getVertexType("Person")["Attributes"][1]
+            ["AttributeType"]["Name"])
+
+    def test_02_counts(self):
+        self.assertEqual(10, self.conn.getVertexCount("Person"))
+        self.assertEqual(5, self.conn.getVertexCount("Person", where="age>=5"))
+        self.assertEqual(10, self.conn.getEdgeCount("Knows"))
+        stats = self.conn.getVertexStats("Person")
+        self.assertEqual({"TRUE": 5, "FALSE": 5}, stats["Person"]["train"])
+
+    def test_03_upsertAndGet(self):
+        self.assertEqual(1, self.conn.upsertVertices("Person", [("new", {"age": 42})]))
+        self.assertEqual(1, self.conn.upsertEdges("Person", "Knows", "Person",
+            [("new", "0", {"weight": 1.0})]))
+        res = self.conn.getVerticesById("Person", "new")
+        self.assertEqual(42, res[0]["attributes"]["age"])
+        res = self.conn.getEdges("Person", "new")
+        self.assertEqual(["0"], [e["to_id"] for e in res])
+        self.assertEqual(1, self.conn.delVerticesById("Person", "new"))
+        self.assertEqual(10, self.conn.getEdgeCount("Knows"))
+
+    def test_04_queries(self):
+        self.server.addQuery("echo_params", lambda server, params: [params])
+        self.assertIn("GET /query/tests/echo_params", self.conn.getInstalledQueries())
+        res = self.conn.runInstalledQuery("echo_params", {"p": 1}, usePost=True)
+        self.assertEqual([{"p": 1}], res)
+
+    def test_05_loaderQuery(self):
+        loader = self.conn.gds.vertexLoader(attributes=["age", "emb", "train"], num_batches=2,
+            output_format="dataframe")
+        res = self.conn.runInstalledQuery(loader.query_name, loader._payload, usePost=True)
+        self.assertEqual(2, len(res))
+        lines = "".join(r["vertex_batch"] for r in res).splitlines()
+        self.assertEqual(10, len(lines))
+        self.assertIn("3|3|3 1.5|0", lines)
+
+    def test_06_iterVertices(self):
+        pages = list(self.conn.iterVertices("Person", select="age", where="age>=2", chunkSize=3))
+        self.assertEqual([3, 3, 2], [len(p) for p in pages])
+        self.assertEqual([str(i) for i in range(2, 10)], [v["v_id"] for p in pages for v in p])
+        self.assertEqual({"age": 2}, pages[0][0]["attributes"])
+
+    def test_07_iterEdges(self):
+        pages = list(self.conn.iterEdges("Knows", chunkSize=4))
+        self.assertEqual(3, len(pages))
+        edges = sorted(tuple(sorted((int(e["from_id"]), int(e["to_id"])))) for p in pages for e in p)
+        self.assertEqual(sorted(tuple(sorted((i, (i + 1) % 10))) for i in range(10)), edges)
+
+    def test_08_partitions(self):
+        parts = [[v["v_id"] for p in self.conn.iterVertices("Person", where="age>=0",
+            partition=(i, 3)) for v in p] for i in range(3)]
+        self.assertEqual(sorted(str(i) for i in range(10)), sorted(sum(parts, [])))
+        self.assertTrue(all(parts))
+        with self.assertRaises(TigerGraphException):
+            list(self.conn.iterVertices("Person", partition=(3, 3)))
+
+
+if __name__ == "__main__":
+    unittest.main()